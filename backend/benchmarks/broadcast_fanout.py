@@ -0,0 +1,62 @@
+"""
+CPU cost of one room broadcast versus room size.
+
+Compares the old fan-out (every receiving consumer runs json.dumps on the
+event dict) with serialize-once frames (the sender encodes once and each
+consumer forwards the ready-made string).
+
+Run from backend/:
+    python -m benchmarks.broadcast_fanout
+"""
+
+import json
+import time
+
+from sync.frames import group_message
+
+ROOM_SIZES = [10, 100, 500, 2000, 5000]
+BROADCASTS = 50
+
+CHAT_EVENT = {
+    "type": "CHAT_MESSAGE",
+    "user": "Premiere Viewer",
+    "message": "this scene is incredible, the score is doing so much work here",
+}
+
+
+def per_consumer_encode(room_size):
+    message = {"type": "room_event", "event": CHAT_EVENT}
+    sent = []
+    for _ in range(room_size):
+        sent.append(json.dumps(message["event"]))
+    return sent
+
+
+def serialize_once(room_size):
+    message = group_message("room_event", CHAT_EVENT)
+    sent = []
+    for _ in range(room_size):
+        sent.append(message["frame"])
+    return sent
+
+
+def cpu_per_broadcast(fanout, room_size):
+    start = time.process_time()
+    for _ in range(BROADCASTS):
+        fanout(room_size)
+    return (time.process_time() - start) / BROADCASTS
+
+
+def main():
+    print(f"{'viewers':>8} {'per-consumer µs':>16} {'serialize-once µs':>18} {'speedup':>8}")
+    for room_size in ROOM_SIZES:
+        old = cpu_per_broadcast(per_consumer_encode, room_size)
+        new = cpu_per_broadcast(serialize_once, room_size)
+        print(
+            f"{room_size:>8} {old * 1e6:>16.1f} {new * 1e6:>18.1f} "
+            f"{old / new if new else float('inf'):>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Latency of admitting one chat message.
+
+Compares the old sequential checks (cooldown, rate window, duplicate and mute
+as separate commands, roughly eight round trips) with the single
+CHAT_ADMISSION_SCRIPT call. Requires a reachable REDIS_URL; keys are written
+under a throwaway room code and removed afterwards.
+
+Run from backend/:
+    python -m benchmarks.chat_admission
+"""
+
+import asyncio
+import os
+import statistics
+import time
+import uuid
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.development")
+django.setup()
+
+from common.redis_client import close_redis_client, get_redis_client  # noqa: E402
+from common.redis_room_state import (  # noqa: E402
+    check_and_update_rate_limit,
+    check_chat_admission,
+    is_duplicate_message,
+    is_user_muted,
+)
+
+MESSAGES = 2000
+
+
+async def sequential_checks(room_code, user_id, message):
+    if await check_and_update_rate_limit(room_code, user_id):
+        return
+    if await is_duplicate_message(room_code, user_id, message):
+        return
+    await is_user_muted(room_code, user_id)
+
+
+async def single_script(room_code, user_id, message):
+    await check_chat_admission(room_code, user_id, message)
+
+
+async def measure(admit, room_code):
+    samples = []
+    for index in range(MESSAGES):
+        # A fresh user per message keeps every call on the full admit path
+        user_id = f"bench-{index}"
+        start = time.perf_counter()
+        await admit(room_code, user_id, f"message {index}")
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def cleanup(room_code):
+    client = get_redis_client()
+    keys = [key async for key in client.scan_iter(match=f"room:{room_code}:*")]
+    if keys:
+        await client.delete(*keys)
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{label:>12} {p50 * 1e6:>10.0f} {p99 * 1e6:>10.0f}")
+
+
+async def main():
+    room_code = f"bench{uuid.uuid4().hex[:6]}"
+    print(f"{'path':>12} {'p50 µs':>10} {'p99 µs':>10}")
+    try:
+        report("sequential", await measure(sequential_checks, room_code))
+        await cleanup(room_code)
+        report("lua", await measure(single_script, room_code))
+    finally:
+        await cleanup(room_code)
+        await close_redis_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
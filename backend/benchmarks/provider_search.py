@@ -0,0 +1,93 @@
+"""
+Latency of the provider search path against a local TMDB stub.
+
+Compares a fresh httpx.AsyncClient per search (the old tmdb_client behaviour:
+new connection every call) with the shared per-loop client from
+providers.http_client, sequentially and under concurrency. Needs no network
+access or TMDB key; the search cache is bypassed so every call reaches the
+stub.
+
+Run from backend/:
+    python -m benchmarks.provider_search
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+import django
+import httpx
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.development")
+os.environ["TMDB_API_KEY"] = "stub"
+
+from benchmarks.tmdb_stub import TmdbStub  # noqa: E402
+
+SEARCHES = 500
+CONCURRENCY = 20
+
+
+async def per_call_client(query):
+    from providers import tmdb_client
+
+    async with httpx.AsyncClient() as client:
+        response = await client.get(
+            f"{tmdb_client.BASE_URL}/search/multi",
+            params={"api_key": "stub", "query": query, "page": 1},
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+async def shared_client(query):
+    from providers.tmdb_client import search_tmdb
+
+    return await search_tmdb(query, 1)
+
+
+async def measure(search, concurrency):
+    samples = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index):
+        async with semaphore:
+            start = time.perf_counter()
+            await search(f"query {index % 50}")
+            samples.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[one(index) for index in range(SEARCHES)])
+    return samples
+
+
+def report(label, samples, stub, connections_before):
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    connections = stub.connections - connections_before
+    print(f"{label:>22} {p50 * 1e3:>9.2f} {p99 * 1e3:>9.2f} {connections:>12}")
+
+
+async def main():
+    stub = TmdbStub()
+    server, port = await stub.start()
+    os.environ["TMDB_BASE_URL"] = f"http://127.0.0.1:{port}/3"
+    django.setup()
+
+    from providers.registry import close_http_client
+
+    print(f"{'path':>22} {'p50 ms':>9} {'p99 ms':>9} {'connections':>12}")
+    try:
+        for concurrency in (1, CONCURRENCY):
+            for label, search in (("per-call", per_call_client), ("shared", shared_client)):
+                before = stub.connections
+                samples = await measure(search, concurrency)
+                report(f"{label} x{concurrency}", samples, stub, before)
+    finally:
+        await close_http_client()
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""
+Offline stand-in for the TMDB search API.
+
+Answers GET /3/search/multi with a canned page of results over HTTP/1.1
+keep-alive, after an optional fixed latency. Used by
+benchmarks.provider_search; it can also be run on its own and targeted by a
+dev server via TMDB_BASE_URL=http://127.0.0.1:<port>/3 (any TMDB_API_KEY).
+
+Run from backend/:
+    python -m benchmarks.tmdb_stub --port 8765 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+from urllib.parse import parse_qs, urlsplit
+
+
+def search_page(query: str, page: int) -> dict:
+    results = [
+        {
+            "id": 1000 + index,
+            "media_type": "movie" if index % 2 else "tv",
+            "title": f"{query} {index}",
+            "name": f"{query} {index}",
+            "poster_path": f"/poster{index}.jpg",
+            "release_date": "2020-01-01",
+            "first_air_date": "2019-01-01",
+        }
+        for index in range(20)
+    ]
+    return {"page": page, "results": results, "total_pages": 5, "total_results": 100}
+
+
+def _response(status: str, body: bytes) -> bytes:
+    head = (
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: keep-alive\r\n\r\n"
+    )
+    return head.encode() + body
+
+
+class TmdbStub:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.connections = 0
+        self.requests = 0
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                while (await reader.readline()) not in (b"\r\n", b""):
+                    pass
+
+                self.requests += 1
+                _, target, _ = request_line.decode().split(" ", 2)
+                url = urlsplit(target)
+                params = parse_qs(url.query)
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+
+                if url.path != "/3/search/multi":
+                    writer.write(_response("404 Not Found", b"{}"))
+                else:
+                    page = search_page(params.get("query", [""])[0], int(params.get("page", ["1"])[0]))
+                    writer.write(_response("200 OK", json.dumps(page).encode()))
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=0):
+        server = await asyncio.start_server(self.handle, host, port)
+        return server, server.sockets[0].getsockname()[1]
+
+
+async def serve(port: int, latency: float):
+    stub = TmdbStub(latency)
+    server, port = await stub.start(port=port)
+    print(f"TMDB stub on http://127.0.0.1:{port}/3")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    args = parser.parse_args()
+    asyncio.run(serve(args.port, args.latency_ms / 1000))
@@ -3,6 +3,7 @@ from django.db import models
 # Create your models here.
 import uuid
 from django.db import models
+from django.utils import timezone
 from users.models import User
 from rooms.models import Room
 
@@ -11,7 +12,8 @@ class ChatMessage(models.Model):
     room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name="chat_messages")
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     message = models.TextField()
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when the message was sent, not when the batched writer persisted it
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ["created_at"]
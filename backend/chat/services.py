@@ -0,0 +1,198 @@
+import logging
+import uuid
+
+from channels.db import database_sync_to_async
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from chat.models import ChatMessage
+from common.redis_keys import room_chat_flush_lock_key
+from common.redis_room_state import (
+    CHAT_HISTORY_LIMIT,
+    acquire_lock,
+    ack_chat_stream,
+    claim_chat_trim,
+    enqueue_chat_message as enqueue_chat_record,
+    get_chat_history,
+    get_pending_chat_rooms,
+    read_chat_stream,
+    release_lock,
+    store_chat_history,
+)
+from rooms.models import Room
+from users.models import User
+
+logger = logging.getLogger("chat")
+
+CHAT_RETENTION_LIMIT = 500
+CHAT_FLUSH_BATCH_SIZE = 500
+CHAT_FLUSH_ROOMS_PER_TICK = 200
+CHAT_FLUSH_LOCK_SECONDS = 30
+CHAT_TRIM_INTERVAL_SECONDS = 60
+
+
+def _history_entry(record):
+    return {
+        "user": record["user"],
+        "message": record["message"],
+        "created_at": record["created_at"],
+    }
+
+
+# ======================
+# History (read path)
+# ======================
+
+def _recent_records(room_id, limit):
+    messages = (
+        ChatMessage.objects
+        .filter(room_id=room_id)
+        .select_related("user")
+        .order_by("-created_at")[:limit]
+    )
+
+    return [
+        {
+            "id": str(m.id),
+            "user": m.user.display_name,
+            "message": m.message,
+            "created_at": m.created_at.isoformat(),
+        }
+        for m in reversed(list(messages))
+    ]
+
+
+@database_sync_to_async
+def get_recent_messages_by_room_id(room_id, limit=CHAT_HISTORY_LIMIT):
+    return [_history_entry(record) for record in _recent_records(room_id, limit)]
+
+
+async def load_chat_history(room_id, room_code):
+    """
+    Recent messages for CHAT_HISTORY: served from the Redis ring buffer,
+    rehydrated from ChatMessage plus not-yet-persisted stream entries
+    only when the buffer is missing.
+    """
+    messages = await get_chat_history(room_code)
+    if messages is not None:
+        return messages
+
+    stored = await database_sync_to_async(_recent_records)(room_id, CHAT_HISTORY_LIMIT)
+    queued = await read_chat_stream(room_code, CHAT_HISTORY_LIMIT, latest=True)
+
+    stored_ids = {record["id"] for record in stored}
+    records = stored + [
+        record for _, record in queued
+        if record["id"] not in stored_ids
+    ]
+
+    messages = [_history_entry(record) for record in records[-CHAT_HISTORY_LIMIT:]]
+    await store_chat_history(room_code, messages)
+    return messages
+
+
+# ======================
+# Persistence (write-behind)
+# ======================
+
+async def enqueue_chat_message(room_id, room_code, user, text):
+    """
+    Queue a message for batched persistence and add it to the history
+    buffer. No database work happens on the WebSocket path.
+    """
+    record = {
+        "id": str(uuid.uuid4()),
+        "room_id": str(room_id),
+        "user_id": str(user.id),
+        "user": user.display_name,
+        "message": text,
+        "created_at": timezone.now().isoformat(),
+    }
+    await enqueue_chat_record(room_code, record, _history_entry(record))
+    return record
+
+
+def persist_chat_records(records) -> int:
+    """
+    Insert queued records in one statement. Records whose room or author
+    no longer exists are dropped; replays of already-written ids are ignored.
+    """
+    room_ids = {record["room_id"] for record in records}
+    user_ids = {record["user_id"] for record in records}
+
+    live_rooms = {
+        str(pk) for pk in Room.objects.filter(id__in=room_ids).values_list("id", flat=True)
+    }
+    live_users = {
+        str(pk) for pk in User.objects.filter(id__in=user_ids).values_list("id", flat=True)
+    }
+
+    rows = [
+        ChatMessage(
+            id=record["id"],
+            room_id=record["room_id"],
+            user_id=record["user_id"],
+            message=record["message"],
+            created_at=parse_datetime(record["created_at"]),
+        )
+        for record in records
+        if record["room_id"] in live_rooms and record["user_id"] in live_users
+    ]
+
+    ChatMessage.objects.bulk_create(rows, ignore_conflicts=True)
+    return len(rows)
+
+
+def trim_room_messages(room_id, keep=CHAT_RETENTION_LIMIT) -> int:
+    cutoff = list(
+        ChatMessage.objects
+        .filter(room_id=room_id)
+        .order_by("-created_at")
+        .values_list("created_at", flat=True)[keep:keep + 1]
+    )
+    if not cutoff:
+        return 0
+
+    deleted, _ = ChatMessage.objects.filter(
+        room_id=room_id,
+        created_at__lte=cutoff[0],
+    ).delete()
+    return deleted
+
+
+async def flush_room_chat(room_code) -> int:
+    lock_key = room_chat_flush_lock_key(room_code)
+    token = await acquire_lock(lock_key, CHAT_FLUSH_LOCK_SECONDS)
+    if token is None:
+        return 0
+
+    try:
+        entries = await read_chat_stream(room_code, CHAT_FLUSH_BATCH_SIZE)
+        records = [record for _, record in entries]
+
+        if records:
+            await database_sync_to_async(persist_chat_records)(records)
+
+        await ack_chat_stream(room_code, [stream_id for stream_id, _ in entries])
+
+        if records and await claim_chat_trim(room_code, CHAT_TRIM_INTERVAL_SECONDS):
+            await database_sync_to_async(trim_room_messages)(records[0]["room_id"])
+
+        return len(records)
+    finally:
+        await release_lock(lock_key, token)
+
+
+async def flush_chat_streams() -> int:
+    """
+    Drain a batch of rooms with queued chat messages into ChatMessage.
+    Returns the number of queued records processed.
+    """
+    total = 0
+    for room_code in await get_pending_chat_rooms(CHAT_FLUSH_ROOMS_PER_TICK):
+        try:
+            total += await flush_room_chat(room_code)
+        except Exception:
+            logger.exception("Chat flush failed | room=%s", room_code)
+
+    return total
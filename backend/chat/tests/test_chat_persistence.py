@@ -0,0 +1,81 @@
+import uuid
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from chat.models import ChatMessage
+from chat.services import persist_chat_records, trim_room_messages
+from rooms.services import create_room
+from users.models import User
+
+
+class ChatPersistenceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="u@test.com",
+            password="pass",
+            display_name="User",
+        )
+        self.room, _ = create_room(
+            host=self.user,
+            is_private=False,
+            entry_mode=None,
+        )
+
+    def _record(self, message, created_at=None, room_id=None):
+        return {
+            "id": str(uuid.uuid4()),
+            "room_id": str(room_id or self.room.id),
+            "user_id": str(self.user.id),
+            "user": "User",
+            "message": message,
+            "created_at": (created_at or timezone.now()).isoformat(),
+        }
+
+    def test_persist_keeps_send_time(self):
+        sent_at = timezone.now() - timedelta(seconds=30)
+        record = self._record("hello", created_at=sent_at)
+
+        persist_chat_records([record])
+
+        stored = ChatMessage.objects.get(id=record["id"])
+        self.assertEqual(stored.created_at, sent_at)
+        self.assertEqual(stored.message, "hello")
+
+    def test_persist_is_idempotent(self):
+        records = [self._record("a"), self._record("b")]
+
+        persist_chat_records(records)
+        persist_chat_records(records)
+
+        self.assertEqual(ChatMessage.objects.count(), 2)
+
+    def test_persist_skips_deleted_rooms(self):
+        written = persist_chat_records([
+            self._record("kept"),
+            self._record("dropped", room_id=uuid.uuid4()),
+        ])
+
+        self.assertEqual(written, 1)
+        self.assertEqual(ChatMessage.objects.get().message, "kept")
+
+    def test_trim_keeps_newest_messages(self):
+        base = timezone.now()
+        persist_chat_records([
+            self._record(f"msg-{index}", created_at=base + timedelta(seconds=index))
+            for index in range(8)
+        ])
+
+        deleted = trim_room_messages(self.room.id, keep=5)
+
+        self.assertEqual(deleted, 3)
+        self.assertEqual(
+            list(ChatMessage.objects.values_list("message", flat=True)),
+            ["msg-3", "msg-4", "msg-5", "msg-6", "msg-7"],
+        )
+
+    def test_trim_noop_under_limit(self):
+        persist_chat_records([self._record("only")])
+
+        self.assertEqual(trim_room_messages(self.room.id, keep=5), 0)
@@ -0,0 +1,38 @@
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from chat.models import ChatMessage
+from chat.services import get_recent_messages_by_room_id
+from rooms.services import create_room
+from users.models import User
+
+
+class ChatHistoryFallbackTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="u@test.com",
+            password="pass",
+            display_name="User",
+        )
+        self.room, _ = create_room(
+            host=self.user,
+            is_private=False,
+            entry_mode=None,
+        )
+
+    def test_returns_latest_messages_oldest_first(self):
+        for index in range(5):
+            ChatMessage.objects.create(
+                room=self.room,
+                user=self.user,
+                message=f"msg-{index}",
+            )
+
+        messages = async_to_sync(get_recent_messages_by_room_id)(self.room.id, limit=3)
+
+        self.assertEqual(
+            [m["message"] for m in messages],
+            ["msg-2", "msg-3", "msg-4"],
+        )
+        self.assertEqual(messages[0]["user"], "User")
+        self.assertIn("created_at", messages[0])
@@ -0,0 +1,33 @@
+import asyncio
+
+from channels_redis.core import ChannelLock
+from channels_redis.core import RedisChannelLayer as BaseRedisChannelLayer
+
+
+class _CancelSafeChannelLock(ChannelLock):
+    async def acquire(self, channel):
+        try:
+            return await super().acquire(channel)
+        except asyncio.CancelledError:
+            # Upstream counts the waiter but never forgets it when cancelled,
+            # so the lock is never dropped and outlives its event loop
+            self.wait_counts[channel] -= 1
+            if self.wait_counts[channel] < 1 and not self.locks[channel].locked():
+                del self.locks[channel]
+                del self.wait_counts[channel]
+            raise
+
+
+class RedisChannelLayer(BaseRedisChannelLayer):
+    """
+    channels_redis layer whose per-channel receive locks survive cancellation.
+
+    Every process-local channel is read through one shared lock per real
+    channel. Channels cancels a consumer's pending receive when it stops; with
+    the stock lock that leaves the entry bound to the current event loop, and
+    receivers on the next loop (tests, management commands) then fail.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.receive_clean_locks = _CancelSafeChannelLock()
@@ -0,0 +1,30 @@
+import asyncio
+import functools
+import weakref
+
+
+def loop_local(factory):
+    """
+    Cache the factory's result per running event loop.
+
+    Async Redis clients, channel-layer listeners and background tasks are all
+    bound to the loop that created them, so process-wide singletons are unsafe.
+    Entries are dropped once their loop is garbage collected; entries for
+    loops that have been closed are pruned on the next miss, since a cached
+    instance that references its own loop would otherwise keep it alive.
+    """
+    instances = weakref.WeakKeyDictionary()
+
+    @functools.wraps(factory)
+    def get():
+        loop = asyncio.get_running_loop()
+        instance = instances.get(loop)
+        if instance is None:
+            for stale in [other for other in instances if other.is_closed()]:
+                instances.pop(stale, None)
+            instance = factory()
+            instances[loop] = instance
+        return instance
+
+    get.instances = instances
+    return get
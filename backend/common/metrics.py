@@ -0,0 +1,41 @@
+from prometheus_client import Counter, Histogram
+
+# Exported through django_prometheus' /metrics endpoint (default registry).
+
+REDIS_CONNECTIONS_CREATED = Counter(
+    "streamit_redis_connections_created_total",
+    "Redis sockets opened by the pooled clients",
+    ["client"],
+)
+
+REDIS_POOL_WAITS = Counter(
+    "streamit_redis_pool_waits_total",
+    "Redis commands that had to wait for a free pooled connection",
+    ["client"],
+)
+
+WS_CONNECT_SECONDS = Histogram(
+    "streamit_ws_connect_seconds",
+    "WebSocket connect handshake latency by phase",
+    ["phase"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+PROVIDER_CALL_SECONDS = Histogram(
+    "streamit_provider_call_seconds",
+    "Provider call latency, hedged attempts included",
+    ["provider", "outcome"],
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+PROVIDER_HEDGES = Counter(
+    "streamit_provider_hedges_total",
+    "Backup provider requests sent after the hedge deadline or a failed attempt",
+    ["provider"],
+)
+
+PROVIDER_CIRCUIT_TRANSITIONS = Counter(
+    "streamit_provider_circuit_transitions_total",
+    "Provider circuit breaker state changes",
+    ["provider", "state"],
+)
@@ -0,0 +1,34 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django_ratelimit.core import is_ratelimited
+from django_ratelimit.exceptions import Ratelimited
+
+
+def async_ratelimit(key, rate, group=None):
+    """
+    django_ratelimit's blocking @ratelimit for async views.
+
+    The 4.x decorator only wraps sync views. The cache check runs off the
+    event loop, outside the thread-sensitive executor, so a slow cache
+    backend never queues behind (or blocks) other requests.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapped(request, *args, **kwargs):
+            limited = await sync_to_async(is_ratelimited, thread_sensitive=False)(
+                request=request,
+                group=group,
+                fn=view,
+                key=key,
+                rate=rate,
+                increment=True,
+            )
+            if limited:
+                raise Ratelimited()
+            return await view(request, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
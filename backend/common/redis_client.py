@@ -1,16 +1,102 @@
-import redis.asyncio as redis
+import asyncio
+
+import redis
+import redis.asyncio as aioredis
 from django.conf import settings
 
+from common.loop_local import loop_local
+from common.metrics import REDIS_CONNECTIONS_CREATED, REDIS_POOL_WAITS
+
 
 def get_redis_url():
     return getattr(settings, "REDIS_URL", "redis://127.0.0.1:6379/0")
 
 
+def _pool_options():
+    return {
+        "max_connections": getattr(settings, "REDIS_MAX_CONNECTIONS", 50),
+        "timeout": getattr(settings, "REDIS_POOL_TIMEOUT_SECONDS", 5),
+        "health_check_interval": getattr(settings, "REDIS_HEALTH_CHECK_INTERVAL_SECONDS", 30),
+        "decode_responses": True,
+    }
+
+
+# ======================
+# Async (event-loop bound)
+# ======================
+
+class _AsyncPool(aioredis.BlockingConnectionPool):
+    async def get_connection(self, *args, **kwargs):
+        if not self.can_get_connection():
+            REDIS_POOL_WAITS.labels(client="async").inc()
+        return await super().get_connection(*args, **kwargs)
+
+
+async def _on_async_connect(connection):
+    REDIS_CONNECTIONS_CREATED.labels(client="async").inc()
+    await connection.on_connect()
+
+
+@loop_local
+def _loop_client():
+    pool = _AsyncPool.from_url(
+        get_redis_url(),
+        redis_connect_func=_on_async_connect,
+        **_pool_options(),
+    )
+    return aioredis.Redis.from_pool(pool)
+
+
 def get_redis_client():
     """
-    Async Redis clients are event-loop bound and must not be cached.
+    Shared async client for the running event loop.
+
+    Async connections are bound to the loop that opened them, so each loop
+    gets its own bounded pool; every caller on that loop reuses it.
     """
-    return redis.from_url(
-        get_redis_url(),
-        decode_responses=True,
-    )
+    return _loop_client()
+
+
+async def close_redis_client():
+    """
+    Close the running loop's client and its pool. Call before a short-lived
+    loop (management commands, async_to_sync wrappers) finishes.
+    """
+    client = _loop_client.instances.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# ======================
+# Sync (process-wide)
+# ======================
+
+class _SyncPool(redis.BlockingConnectionPool):
+    def get_connection(self, *args, **kwargs):
+        if self.pool.empty():
+            REDIS_POOL_WAITS.labels(client="sync").inc()
+        return super().get_connection(*args, **kwargs)
+
+
+def _on_sync_connect(connection):
+    REDIS_CONNECTIONS_CREATED.labels(client="sync").inc()
+    connection.on_connect()
+
+
+_sync_client = None
+
+
+def get_sync_redis_client():
+    """
+    Shared blocking client for sync code (views, management commands,
+    startup recovery). Thread-safe: the pool hands each thread its own socket.
+    """
+    global _sync_client
+    if _sync_client is None:
+        pool = _SyncPool.from_url(
+            get_redis_url(),
+            redis_connect_func=_on_sync_connect,
+            **_pool_options(),
+        )
+        _sync_client = redis.Redis(connection_pool=pool)
+    return _sync_client
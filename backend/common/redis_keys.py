@@ -10,8 +10,44 @@ def room_host_status_key(room_code: str) -> str:
     return f"room:{room_code}:host_status"
 
 
-def room_viewers_key(room_code: str) -> str:
-    return f"room:{room_code}:viewers"
+def room_presence_key(room_code: str) -> str:
+    return f"room:{room_code}:presence"
+
+
+def room_presence_users_key(room_code: str) -> str:
+    return f"room:{room_code}:presence_users"
+
+
+def public_rooms_by_created_key() -> str:
+    return "public:rooms:created"
+
+
+def public_rooms_by_viewers_key() -> str:
+    return "public:rooms:viewers"
+
+
+def public_rooms_version_key() -> str:
+    return "public:rooms:version"
+
+
+def room_public_meta_key(room_code: str) -> str:
+    return f"room:{room_code}:public"
+
+
+def presence_rooms_key() -> str:
+    return "presence:rooms"
+
+
+def presence_sweep_key() -> str:
+    return "presence:sweep_claim"
+
+
+def room_grace_key(room_code: str) -> str:
+    return f"room:{room_code}:grace"
+
+
+def grace_deadlines_key() -> str:
+    return "grace:deadlines"
 
 
 def chat_rate_window_key(room_code: str, user_id: str) -> str:
@@ -26,9 +62,69 @@ def chat_duplicate_key(room_code: str, user_id: str) -> str:
     return f"room:{room_code}:chat_dup:{user_id}"
 
 
+def room_roster_key(room_code: str) -> str:
+    return f"room:{room_code}:roster"
+
+
 def room_muted_users_key(room_code: str) -> str:
     return f"room:{room_code}:muted_users"
 
 
 def room_banned_users_key(room_code: str) -> str:
     return f"room:{room_code}:banned_users"
+
+
+def room_playback_key(room_code: str) -> str:
+    return f"room:{room_code}:playback"
+
+
+def playback_dirty_rooms_key() -> str:
+    return "playback:dirty_rooms"
+
+
+def room_chat_history_key(room_code: str) -> str:
+    return f"room:{room_code}:chat_history"
+
+
+def room_chat_history_ready_key(room_code: str) -> str:
+    return f"room:{room_code}:chat_history_ready"
+
+
+def room_chat_version_key(room_code: str) -> str:
+    return f"room:{room_code}:chat_version"
+
+
+def room_chat_stream_key(room_code: str) -> str:
+    return f"room:{room_code}:chat_stream"
+
+
+def room_chat_flush_lock_key(room_code: str) -> str:
+    return f"room:{room_code}:chat_flush_lock"
+
+
+def room_chat_trimmed_key(room_code: str) -> str:
+    return f"room:{room_code}:chat_trimmed"
+
+
+def chat_pending_rooms_key() -> str:
+    return "chat:pending_rooms"
+
+
+def search_cache_key(provider: str, query: str, page: int) -> str:
+    return f"search:{provider}:{page}:{query}"
+
+
+def search_lock_key(provider: str, query: str, page: int) -> str:
+    return f"search_lock:{provider}:{page}:{query}"
+
+
+def autocomplete_terms_key() -> str:
+    return "autocomplete:terms"
+
+
+def autocomplete_items_key() -> str:
+    return "autocomplete:items"
+
+
+def episode_counts_key(provider: str, external_id: str) -> str:
+    return f"episodes:{provider}:{external_id}"
@@ -1,5 +1,6 @@
 import json
 import time
+import uuid
 from django.utils import timezone
 
 from common.redis_client import get_redis_client
@@ -7,18 +8,356 @@ from common.redis_keys import (
     room_state_key,
     room_host_status_key,
     room_participants_key,
-    room_viewers_key,
+    room_presence_key,
+    room_presence_users_key,
+    presence_rooms_key,
+    presence_sweep_key,
+    public_rooms_by_created_key,
+    public_rooms_by_viewers_key,
+    public_rooms_version_key,
+    room_public_meta_key,
     chat_rate_window_key,
     chat_cooldown_key,
     chat_duplicate_key,
     room_muted_users_key,
     room_banned_users_key,
+    room_playback_key,
+    playback_dirty_rooms_key,
+    room_chat_history_key,
+    room_roster_key,
+    room_grace_key,
+    grace_deadlines_key,
+    room_chat_history_ready_key,
+    room_chat_stream_key,
+    room_chat_version_key,
+    room_chat_trimmed_key,
+    chat_pending_rooms_key,
 )
 
 RATE_LIMIT_COUNT = 5
 RATE_LIMIT_WINDOW = 3  # seconds
 COOLDOWN_SECONDS = 10
 DUPLICATE_WINDOW_SECONDS = 3
+PLAYBACK_STATE_TTL_SECONDS = 60 * 60 * 24
+CHAT_HISTORY_LIMIT = 50
+CHAT_HISTORY_TTL_SECONDS = 60 * 60 * 24
+ROSTER_TTL_SECONDS = 60 * 60 * 24
+
+PLAYBACK_FIELDS = ("is_playing", "time", "version", "anchored_at", "rate")
+
+# Connect admission verdicts returned by CONNECT_ADMISSION_SCRIPT
+CONNECT_ALLOWED = 0
+CONNECT_BANNED = 1
+CONNECT_GRACE_EXPIRED = 2
+CONNECT_INACTIVE = 3
+CONNECT_NOT_APPROVED = 4
+
+# Chat admission verdicts returned by CHAT_ADMISSION_SCRIPT
+CHAT_ALLOWED = 0
+CHAT_BANNED = 1
+CHAT_MUTED = 2
+CHAT_RATE_LIMITED = 3
+CHAT_DUPLICATE = 4
+
+# Seeds the hot playback hash from the durable copy unless it already
+# belongs to this room. Returns the resulting PLAYBACK_FIELDS values.
+SEED_PLAYBACK_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'room_id') ~= ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    redis.call('HSET', KEYS[1],
+        'room_id', ARGV[1],
+        'is_playing', ARGV[2],
+        'time', ARGV[3],
+        'version', ARGV[4],
+        'anchored_at', ARGV[5],
+        'rate', ARGV[6])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[7])
+return redis.call('HMGET', KEYS[1], 'is_playing', 'time', 'version', 'anchored_at', 'rate')
+"""
+
+# Replaces the roster set and bumps its version in one step.
+REPLACE_ROSTER_SCRIPT = """
+redis.call('DEL', KEYS[1])
+if #ARGV > 2 then
+    redis.call('SADD', KEYS[1], unpack(ARGV, 3))
+end
+local version = redis.call('HINCRBY', KEYS[2], 'version', 1)
+redis.call('HSET', KEYS[2], 'host', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return version
+"""
+
+# Applies a coalesced batch of roster changes. Only members that actually
+# changed are returned, and the version moves by exactly one per non-empty
+# batch so clients can detect gaps. Returns {-1} when the roster is missing
+# (the next connect rebuilds it) and {version} when nothing changed.
+APPLY_ROSTER_DELTA_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    return {-1}
+end
+
+local added_count = tonumber(ARGV[1])
+local added = {}
+local removed = {}
+for i = 2, added_count + 1 do
+    if redis.call('SADD', KEYS[1], ARGV[i]) == 1 then
+        table.insert(added, ARGV[i])
+    end
+end
+for i = added_count + 2, #ARGV do
+    if redis.call('SREM', KEYS[1], ARGV[i]) == 1 then
+        table.insert(removed, ARGV[i])
+    end
+end
+
+if #added == 0 and #removed == 0 then
+    return {tonumber(redis.call('HGET', KEYS[2], 'version'))}
+end
+
+local result = {redis.call('HINCRBY', KEYS[2], 'version', 1), #added}
+for _, member in ipairs(added) do
+    table.insert(result, member)
+end
+for _, member in ipairs(removed) do
+    table.insert(result, member)
+end
+return result
+"""
+
+# Presence changes refresh the room's entry in the public viewers index;
+# rooms are only indexed while their public metadata hash exists. The score
+# is viewers * 1e10 + created second, so rooms with equal viewer counts still
+# have distinct, stable scores for cursor pagination. Every index change bumps
+# the index version that keys the cached listing.
+REINDEX_VIEWERS_LUA = """
+local function reindex_viewers(meta_key, index_key, users_key, version_key, room_code)
+    local created = redis.call('HGET', meta_key, 'created_ts')
+    if not created then
+        return
+    end
+    local viewers = redis.call('HLEN', users_key)
+    redis.call('HSET', meta_key, 'viewers', viewers)
+    redis.call('ZADD', index_key, string.format('%.0f', viewers * 1e10 + tonumber(created)), room_code)
+    redis.call('INCR', version_key)
+end
+"""
+
+# Everything a WebSocket connect needs from Redis in one call: ban and grace
+# checks, host grace cancellation, presence writes, and the versions that key
+# the join bundle. Rejections return before any write, in the order ban,
+# inactive room, expired grace, unapproved participant.
+CONNECT_ADMISSION_SCRIPT = REINDEX_VIEWERS_LUA + """
+if redis.call('SISMEMBER', KEYS[1], ARGV[1]) == 1 then
+    return {1}
+end
+
+if ARGV[9] ~= '1' then
+    return {3}
+end
+
+local in_grace = redis.call('EXISTS', KEYS[2])
+if ARGV[2] == '1' and in_grace == 0 then
+    return {2}
+end
+
+if ARGV[10] ~= '1' then
+    return {4}
+end
+
+local host_reconnected = 0
+if ARGV[3] == '1' then
+    if in_grace == 1 then
+        redis.call('DEL', KEYS[2])
+        host_reconnected = 1
+    end
+    redis.call('ZREM', KEYS[11], ARGV[8])
+    redis.call('SET', KEYS[5], ARGV[5])
+end
+
+if redis.call('ZADD', KEYS[3], ARGV[7], ARGV[6]) == 1 then
+    redis.call('HINCRBY', KEYS[9], ARGV[1], 1)
+    reindex_viewers(KEYS[12], KEYS[13], KEYS[9], KEYS[14], ARGV[8])
+end
+redis.call('SADD', KEYS[10], ARGV[8])
+redis.call('SET', KEYS[4], ARGV[4])
+
+return {
+    0,
+    host_reconnected,
+    redis.call('GET', KEYS[6]),
+    redis.call('HGET', KEYS[7], 'room_id'),
+    redis.call('HGET', KEYS[7], 'version'),
+    redis.call('HGET', KEYS[8], 'version'),
+}
+"""
+
+# Presence is a per-room sorted set of "<user_id>:<connection_id>" members
+# scored by last heartbeat, plus a per-user connection refcount hash whose
+# HLEN is the distinct viewer count. Joining is idempotent, so heartbeats
+# reuse it and re-admit a connection a sweep evicted during a stall.
+JOIN_PRESENCE_SCRIPT = REINDEX_VIEWERS_LUA + """
+if redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1]) == 1 then
+    redis.call('HINCRBY', KEYS[2], ARGV[3], 1)
+    reindex_viewers(KEYS[4], KEYS[5], KEYS[2], KEYS[6], ARGV[4])
+end
+redis.call('SADD', KEYS[3], ARGV[4])
+return redis.call('HLEN', KEYS[2])
+"""
+
+LEAVE_PRESENCE_SCRIPT = REINDEX_VIEWERS_LUA + """
+local removed = redis.call('ZREM', KEYS[1], ARGV[1])
+if removed == 1 then
+    if redis.call('HINCRBY', KEYS[2], ARGV[2], -1) <= 0 then
+        redis.call('HDEL', KEYS[2], ARGV[2])
+    end
+end
+if redis.call('ZCARD', KEYS[1]) == 0 then
+    redis.call('DEL', KEYS[2])
+    redis.call('SREM', KEYS[3], ARGV[3])
+end
+if removed == 1 then
+    reindex_viewers(KEYS[4], KEYS[5], KEYS[2], KEYS[6], ARGV[3])
+end
+return redis.call('HLEN', KEYS[2])
+"""
+
+# Evicts connections whose last heartbeat is at or before ARGV[1] (left
+# behind by a crashed worker) and releases their users' refcounts.
+SWEEP_PRESENCE_SCRIPT = REINDEX_VIEWERS_LUA + """
+local stale = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+for _, member in ipairs(stale) do
+    redis.call('ZREM', KEYS[1], member)
+    local user_id = string.match(member, '^[^:]+')
+    if redis.call('HINCRBY', KEYS[2], user_id, -1) <= 0 then
+        redis.call('HDEL', KEYS[2], user_id)
+    end
+end
+if redis.call('ZCARD', KEYS[1]) == 0 then
+    redis.call('DEL', KEYS[2])
+    redis.call('SREM', KEYS[3], ARGV[2])
+end
+if #stale > 0 then
+    reindex_viewers(KEYS[4], KEYS[5], KEYS[2], KEYS[6], ARGV[2])
+end
+return #stale
+"""
+
+# Claims up to ARGV[3] rooms whose grace deadline is at or before ARGV[1] by
+# pushing their score out to the lease deadline ARGV[2]: exactly one caller
+# gets each room, and a claimer that dies is retried once the lease lapses.
+# Returns {next deadline or false, claimed room codes...}.
+CLAIM_DUE_GRACES_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3])
+for _, room_code in ipairs(due) do
+    redis.call('ZADD', KEYS[1], ARGV[2], room_code)
+end
+
+local head = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+local result = {head[2] or false}
+for _, room_code in ipairs(due) do
+    table.insert(result, room_code)
+end
+return result
+"""
+
+# Drops a claimed deadline only while it still carries our lease; a host that
+# disconnected again in the meantime has a fresh deadline that must survive.
+RELEASE_GRACE_CLAIM_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if score and tonumber(score) == tonumber(ARGV[2]) then
+    return redis.call('ZREM', KEYS[1], ARGV[1])
+end
+return 0
+"""
+
+# Evaluates every chat admission rule in one atomic call: ban, mute, cooldown,
+# sliding rate window (which arms the cooldown when exceeded), then duplicate
+# suppression. Returns one of the CHAT_* verdicts.
+CHAT_ADMISSION_SCRIPT = """
+if redis.call('SISMEMBER', KEYS[1], ARGV[1]) == 1 then
+    return 1
+end
+if redis.call('SISMEMBER', KEYS[2], ARGV[1]) == 1 then
+    return 2
+end
+if redis.call('EXISTS', KEYS[3]) == 1 then
+    return 3
+end
+
+local now = tonumber(ARGV[2])
+local window = tonumber(ARGV[4])
+redis.call('ZADD', KEYS[4], now, ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[4], 0, now - window)
+if redis.call('ZCARD', KEYS[4]) > tonumber(ARGV[5]) then
+    redis.call('SET', KEYS[3], '1', 'EX', ARGV[6])
+    redis.call('DEL', KEYS[4])
+    return 3
+end
+redis.call('EXPIRE', KEYS[4], window)
+
+if redis.call('GET', KEYS[5]) == ARGV[7] then
+    return 4
+end
+redis.call('SET', KEYS[5], ARGV[7], 'EX', ARGV[8])
+return 0
+"""
+
+# Queues a chat message for the batched DB writer, bumps the room's chat
+# version and appends to the history ring buffer in one round trip. The ring
+# buffer is only appended to once it has been hydrated; an unhydrated buffer
+# must not look complete.
+ENQUEUE_CHAT_MESSAGE_SCRIPT = """
+redis.call('XADD', KEYS[1], '*', 'record', ARGV[1])
+redis.call('SADD', KEYS[2], ARGV[2])
+redis.call('INCR', KEYS[5])
+redis.call('EXPIRE', KEYS[5], ARGV[5])
+if redis.call('EXISTS', KEYS[4]) == 1 then
+    redis.call('RPUSH', KEYS[3], ARGV[3])
+    redis.call('LTRIM', KEYS[3], -tonumber(ARGV[4]), -1)
+    redis.call('EXPIRE', KEYS[3], ARGV[5])
+    redis.call('EXPIRE', KEYS[4], ARGV[5])
+end
+return 1
+"""
+
+# Drops persisted entries from a room's chat stream and clears the room's
+# pending flag only if nothing new arrived meanwhile.
+ACK_CHAT_STREAM_SCRIPT = """
+if #ARGV > 1 then
+    redis.call('XDEL', KEYS[1], unpack(ARGV, 2))
+end
+if redis.call('XLEN', KEYS[1]) == 0 then
+    redis.call('SREM', KEYS[2], ARGV[1])
+end
+return 1
+"""
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Applies a playback change and bumps the version atomically, then marks the
+# room dirty for the write-behind flusher. Returns -1 when the hash is missing
+# (or belongs to a previous room with the same code) so the caller can re-seed.
+UPDATE_PLAYBACK_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'room_id') ~= ARGV[1] then
+    return -1
+end
+local version = redis.call('HINCRBY', KEYS[1], 'version', 1)
+redis.call('HSET', KEYS[1],
+    'is_playing', ARGV[2],
+    'time', ARGV[3],
+    'anchored_at', ARGV[4],
+    'rate', ARGV[5])
+redis.call('EXPIRE', KEYS[1], ARGV[6])
+redis.call('SADD', KEYS[2], ARGV[7])
+return version
+"""
 
 
 # ======================
@@ -87,31 +426,199 @@ async def host_disconnected(room_data: dict, user_id):
 # Participants
 # ======================
 
-async def update_participants(room_code: str, participants: list[str]):
+async def update_participants(room_code: str, participants: list[str], host: str | None = None) -> int:
+    """
+    Replace the roster wholesale. Returns the new roster version.
+    """
+    client = get_redis_client()
+    script = client.register_script(REPLACE_ROSTER_SCRIPT)
+
+    version = await script(
+        keys=[room_participants_key(room_code), room_roster_key(room_code)],
+        args=[host or "", ROSTER_TTL_SECONDS, *participants],
+    )
+    return int(version)
+
+
+async def get_roster(room_code: str) -> dict | None:
+    """
+    Current roster snapshot, or None if it has not been built yet.
+    """
+    client = get_redis_client()
+
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.smembers(room_participants_key(room_code))
+        pipe.hmget(room_roster_key(room_code), "version", "host")
+        members, (version, host) = await pipe.execute()
+
+    if version is None:
+        return None
+
+    return {
+        "participants": sorted(members),
+        "host": host or None,
+        "version": int(version),
+    }
+
+
+async def apply_roster_delta(room_code: str, added: list[str], removed: list[str]) -> dict | None:
+    """
+    Apply a batch of roster changes. Returns the effective delta
+    ({"added", "removed", "version"}), or None if nothing changed or the
+    roster does not exist.
+    """
+    client = get_redis_client()
+    script = client.register_script(APPLY_ROSTER_DELTA_SCRIPT)
+
+    result = await script(
+        keys=[room_participants_key(room_code), room_roster_key(room_code)],
+        args=[len(added), *added, *removed],
+    )
+    if len(result) == 1:
+        return None
+
+    version, added_count, members = int(result[0]), int(result[1]), result[2:]
+    return {
+        "added": members[:added_count],
+        "removed": members[added_count:],
+        "version": version,
+    }
+
+
+async def clear_roster(room_code: str):
+    client = get_redis_client()
+    await client.delete(
+        room_participants_key(room_code),
+        room_roster_key(room_code),
+    )
+
+
+# ======================
+# Presence
+# ======================
+
+def presence_member(user_id, connection_id) -> str:
+    return f"{user_id}:{connection_id}"
+
+
+def _presence_keys(room_code: str) -> list[str]:
+    return [
+        room_presence_key(room_code),
+        room_presence_users_key(room_code),
+        presence_rooms_key(),
+        room_public_meta_key(room_code),
+        public_rooms_by_viewers_key(),
+        public_rooms_version_key(),
+    ]
+
+
+async def join_presence(room_code: str, user_id, connection_id) -> int:
+    """
+    Record a live connection. Returns the distinct viewer count.
+    """
+    client = get_redis_client()
+    script = client.register_script(JOIN_PRESENCE_SCRIPT)
+
+    count = await script(
+        keys=_presence_keys(room_code),
+        args=[presence_member(user_id, connection_id), time.time(), str(user_id), room_code],
+    )
+    return int(count)
+
+
+async def refresh_presence(connections: list[tuple[str, str, str]]):
+    """
+    Heartbeat a batch of (room_code, user_id, connection_id) in one pipeline.
+    """
+    if not connections:
+        return
+
     client = get_redis_client()
-    key = room_participants_key(room_code)
+    script = client.register_script(JOIN_PRESENCE_SCRIPT)
+    now = time.time()
+
+    async with client.pipeline(transaction=False) as pipe:
+        for room_code, user_id, connection_id in connections:
+            await script(
+                keys=_presence_keys(room_code),
+                args=[presence_member(user_id, connection_id), now, str(user_id), room_code],
+                client=pipe,
+            )
+        await pipe.execute()
 
-    await client.delete(key)
-    if participants:
-        await client.sadd(key, *participants)
+
+async def leave_presence(room_code: str, user_id, connection_id) -> int:
+    """
+    Drop a connection. Safe for connections that never joined or were
+    already swept. Returns the distinct viewer count.
+    """
+    client = get_redis_client()
+    script = client.register_script(LEAVE_PRESENCE_SCRIPT)
+
+    count = await script(
+        keys=_presence_keys(room_code),
+        args=[presence_member(user_id, connection_id), str(user_id), room_code],
+    )
+    return int(count)
 
 
 async def get_viewer_count(room_code: str) -> int:
+    """
+    Distinct users with at least one live connection.
+    """
     client = get_redis_client()
-    viewers = await client.get(room_viewers_key(room_code))
-    return int(viewers or 0)
+    return await client.hlen(room_presence_users_key(room_code))
 
 
-async def increment_viewers(room_code: str):
+async def get_presence_rooms() -> list[str]:
     client = get_redis_client()
-    await client.incr(room_viewers_key(room_code))
+    return list(await client.smembers(presence_rooms_key()))
 
 
-async def decrement_viewers(room_code: str):
+async def sweep_presence(room_codes: list[str], stale_seconds: float) -> int:
+    """
+    Evict connections that have not heartbeated within `stale_seconds`.
+    Returns the number of connections evicted.
+    """
+    if not room_codes:
+        return 0
+
     client = get_redis_client()
-    value = await client.decr(room_viewers_key(room_code))
-    if value <= 0:
-        await client.delete(room_viewers_key(room_code))
+    script = client.register_script(SWEEP_PRESENCE_SCRIPT)
+    cutoff = time.time() - stale_seconds
+
+    async with client.pipeline(transaction=False) as pipe:
+        for room_code in room_codes:
+            await script(
+                keys=_presence_keys(room_code),
+                args=[cutoff, room_code],
+                client=pipe,
+            )
+        results = await pipe.execute()
+
+    return sum(int(evicted) for evicted in results)
+
+
+async def claim_presence_sweep(interval_seconds: float) -> bool:
+    """
+    True for at most one caller (across all workers) per interval.
+    """
+    client = get_redis_client()
+    return bool(await client.set(
+        presence_sweep_key(),
+        "1",
+        nx=True,
+        px=int(interval_seconds * 1000),
+    ))
+
+
+async def clear_presence(room_code: str):
+    client = get_redis_client()
+    await client.delete(
+        room_presence_key(room_code),
+        room_presence_users_key(room_code),
+    )
+    await client.srem(presence_rooms_key(), room_code)
 
 
 async def is_chat_blocked(room_code: str, user_id: str) -> bool:
@@ -176,6 +683,39 @@ async def is_duplicate_message(room_code: str, user_id: str, message: str) -> bo
     return False
 
 
+async def check_chat_admission(room_code: str, user_id: str, message: str) -> int:
+    """
+    Single round trip replacement for is_user_banned/is_user_muted,
+    check_and_update_rate_limit and is_duplicate_message.
+    Returns a CHAT_* verdict.
+    """
+    client = get_redis_client()
+    script = client.register_script(CHAT_ADMISSION_SCRIPT)
+    user_id = str(user_id)
+    now = time.time()
+
+    verdict = await script(
+        keys=[
+            room_banned_users_key(room_code),
+            room_muted_users_key(room_code),
+            chat_cooldown_key(room_code, user_id),
+            chat_rate_window_key(room_code, user_id),
+            chat_duplicate_key(room_code, user_id),
+        ],
+        args=[
+            user_id,
+            now,
+            f"{now}:{uuid.uuid4().hex[:8]}",
+            RATE_LIMIT_WINDOW,
+            RATE_LIMIT_COUNT,
+            COOLDOWN_SECONDS,
+            message,
+            DUPLICATE_WINDOW_SECONDS,
+        ],
+    )
+    return int(verdict)
+
+
 # ======================
 # Moderation
 # ======================
@@ -215,20 +755,496 @@ async def is_user_banned(room_code: str, user_id: str) -> bool:
 # Grace period (TTL)
 # ======================
 
-async def start_grace(room_code: str, ttl_seconds: int):
+async def start_grace(room_code: str, ttl_seconds: int) -> float:
+    """
+    Arm the grace TTL and schedule expiry at the deadline. Returns the
+    deadline as a UNIX timestamp.
+    """
     client = get_redis_client()
-    await client.set(
-        f"room:{room_code}:grace",
-        "1",
-        ex=ttl_seconds,
-    )
+    deadline = time.time() + ttl_seconds
+
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.set(room_grace_key(room_code), "1", ex=ttl_seconds)
+        pipe.zadd(grace_deadlines_key(), {room_code: deadline})
+        await pipe.execute()
+
+    return deadline
 
 
 async def clear_grace(room_code: str):
     client = get_redis_client()
-    await client.delete(f"room:{room_code}:grace")
+
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.delete(room_grace_key(room_code))
+        pipe.zrem(grace_deadlines_key(), room_code)
+        await pipe.execute()
+
+
+async def schedule_grace_expiry(room_code: str, deadline: float):
+    client = get_redis_client()
+    await client.zadd(grace_deadlines_key(), {room_code: deadline})
+
+
+async def claim_due_graces(count: int, lease_seconds: float) -> tuple[list[str], float, float | None]:
+    """
+    Claim rooms whose grace deadline has passed.
+
+    Returns (room codes, lease score to pass to release_grace_claim, next
+    pending deadline or None).
+    """
+    client = get_redis_client()
+    script = client.register_script(CLAIM_DUE_GRACES_SCRIPT)
+    now = time.time()
+    lease = now + lease_seconds
+
+    result = await script(
+        keys=[grace_deadlines_key()],
+        args=[now, lease, count],
+    )
+    next_deadline = float(result[0]) if result[0] else None
+    return list(result[1:]), lease, next_deadline
+
+
+async def release_grace_claim(room_code: str, lease: float) -> bool:
+    client = get_redis_client()
+    script = client.register_script(RELEASE_GRACE_CLAIM_SCRIPT)
+
+    released = await script(
+        keys=[grace_deadlines_key()],
+        args=[room_code, repr(lease)],
+    )
+    return released == 1
 
 
 async def is_in_grace(room_code: str) -> bool:
     client = get_redis_client()
-    return await client.exists(f"room:{room_code}:grace") == 1
+    return await client.exists(room_grace_key(room_code)) == 1
+
+
+# ======================
+# Chat history (ring buffer)
+# ======================
+
+async def get_chat_history(room_code: str) -> list[dict] | None:
+    """
+    Returns the buffered recent messages, or None when the buffer
+    has not been hydrated and the database must be consulted.
+    """
+    client = get_redis_client()
+
+    async with client.pipeline(transaction=False) as pipe:
+        pipe.exists(room_chat_history_ready_key(room_code))
+        pipe.lrange(room_chat_history_key(room_code), 0, -1)
+        ready, entries = await pipe.execute()
+
+    if not ready:
+        return None
+
+    return [json.loads(entry) for entry in entries]
+
+
+async def store_chat_history(room_code: str, messages: list[dict]):
+    client = get_redis_client()
+    key = room_chat_history_key(room_code)
+
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.delete(key)
+        if messages:
+            pipe.rpush(key, *(json.dumps(m) for m in messages[-CHAT_HISTORY_LIMIT:]))
+            pipe.expire(key, CHAT_HISTORY_TTL_SECONDS)
+        pipe.set(
+            room_chat_history_ready_key(room_code),
+            "1",
+            ex=CHAT_HISTORY_TTL_SECONDS,
+        )
+        await pipe.execute()
+
+
+async def clear_chat_history(room_code: str):
+    client = get_redis_client()
+    await client.delete(
+        room_chat_history_key(room_code),
+        room_chat_history_ready_key(room_code),
+        room_chat_version_key(room_code),
+    )
+
+
+# ======================
+# Chat persistence queue (streams)
+# ======================
+
+async def enqueue_chat_message(room_code: str, record: dict, history_entry: dict):
+    client = get_redis_client()
+    script = client.register_script(ENQUEUE_CHAT_MESSAGE_SCRIPT)
+
+    await script(
+        keys=[
+            room_chat_stream_key(room_code),
+            chat_pending_rooms_key(),
+            room_chat_history_key(room_code),
+            room_chat_history_ready_key(room_code),
+            room_chat_version_key(room_code),
+        ],
+        args=[
+            json.dumps(record),
+            room_code,
+            json.dumps(history_entry),
+            CHAT_HISTORY_LIMIT,
+            CHAT_HISTORY_TTL_SECONDS,
+        ],
+    )
+
+
+async def get_pending_chat_rooms(count: int) -> list[str]:
+    client = get_redis_client()
+    return await client.srandmember(chat_pending_rooms_key(), count) or []
+
+
+async def read_chat_stream(room_code: str, count: int, latest: bool = False) -> list[tuple[str, dict]]:
+    """
+    Oldest-first batch of queued records, or the newest `count` when latest=True.
+    """
+    client = get_redis_client()
+    key = room_chat_stream_key(room_code)
+
+    if latest:
+        entries = list(reversed(await client.xrevrange(key, count=count)))
+    else:
+        entries = await client.xrange(key, count=count)
+
+    return [
+        (stream_id, json.loads(fields["record"]))
+        for stream_id, fields in entries
+    ]
+
+
+async def ack_chat_stream(room_code: str, stream_ids: list[str]):
+    client = get_redis_client()
+    script = client.register_script(ACK_CHAT_STREAM_SCRIPT)
+
+    await script(
+        keys=[room_chat_stream_key(room_code), chat_pending_rooms_key()],
+        args=[room_code, *stream_ids],
+    )
+
+
+async def claim_chat_trim(room_code: str, interval_seconds: int) -> bool:
+    """
+    True for at most one caller per room per interval.
+    """
+    client = get_redis_client()
+    return bool(await client.set(
+        room_chat_trimmed_key(room_code),
+        "1",
+        nx=True,
+        ex=interval_seconds,
+    ))
+
+
+async def clear_chat_stream(room_code: str):
+    client = get_redis_client()
+    await client.delete(room_chat_stream_key(room_code))
+    await client.srem(chat_pending_rooms_key(), room_code)
+
+
+# ======================
+# Join bundle versions
+# ======================
+
+def _join_versions(room_id, chat_version, playback_room_id, playback_version, roster_version):
+    if playback_room_id != str(room_id) or roster_version is None:
+        return None
+
+    return (
+        str(room_id),
+        int(chat_version or 0),
+        int(playback_version),
+        int(roster_version),
+    )
+
+
+async def get_join_versions(room_code: str, room_id) -> tuple | None:
+    """
+    (room_id, chat version, playback version, roster version) in one round
+    trip, or None while the playback or roster hot copy is missing.
+    """
+    client = get_redis_client()
+
+    async with client.pipeline(transaction=False) as pipe:
+        pipe.get(room_chat_version_key(room_code))
+        pipe.hmget(room_playback_key(room_code), "room_id", "version")
+        pipe.hget(room_roster_key(room_code), "version")
+        chat_version, (playback_room_id, playback_version), roster_version = await pipe.execute()
+
+    return _join_versions(room_id, chat_version, playback_room_id, playback_version, roster_version)
+
+
+# ======================
+# Connect admission
+# ======================
+
+async def admit_connection(
+    room_data: dict,
+    user_id,
+    *,
+    connection_id: str,
+    is_host: bool,
+    requires_grace: bool,
+    is_approved: bool,
+) -> dict:
+    """
+    Single round trip for the connect handshake. `requires_grace` rejects the
+    connection with CONNECT_GRACE_EXPIRED when the grace key is gone; an
+    inactive room or unapproved participant is rejected too, after the ban
+    check, so a banned user always gets CONNECT_BANNED.
+
+    Returns {"verdict", "host_reconnected", "join_versions"}; on
+    CONNECT_ALLOWED the presence entry, room state and (for the host) host
+    status are already written.
+    """
+    client = get_redis_client()
+    script = client.register_script(CONNECT_ADMISSION_SCRIPT)
+    room_code = room_data["code"]
+    now = timezone.now().isoformat()
+
+    result = await script(
+        keys=[
+            room_banned_users_key(room_code),
+            room_grace_key(room_code),
+            room_presence_key(room_code),
+            room_state_key(room_code),
+            room_host_status_key(room_code),
+            room_chat_version_key(room_code),
+            room_playback_key(room_code),
+            room_roster_key(room_code),
+            room_presence_users_key(room_code),
+            presence_rooms_key(),
+            grace_deadlines_key(),
+            room_public_meta_key(room_code),
+            public_rooms_by_viewers_key(),
+            public_rooms_version_key(),
+        ],
+        args=[
+            str(user_id),
+            "1" if requires_grace else "0",
+            "1" if is_host else "0",
+            json.dumps({"is_active": room_data["is_active"], "updated_at": now}),
+            json.dumps({"status": "connected", "updated_at": now}),
+            presence_member(user_id, connection_id),
+            time.time(),
+            room_code,
+            "1" if room_data["is_active"] else "0",
+            "1" if is_approved else "0",
+        ],
+    )
+
+    verdict = int(result[0])
+    if verdict != CONNECT_ALLOWED:
+        return {"verdict": verdict, "host_reconnected": False, "join_versions": None}
+
+    return {
+        "verdict": verdict,
+        "host_reconnected": result[1] == 1,
+        "join_versions": _join_versions(room_data["id"], *result[2:]),
+    }
+
+
+# ======================
+# Room teardown
+# ======================
+
+def _room_keys(room_code: str) -> list[str]:
+    return [
+        room_state_key(room_code),
+        room_host_status_key(room_code),
+        room_participants_key(room_code),
+        room_roster_key(room_code),
+        room_presence_key(room_code),
+        room_presence_users_key(room_code),
+        room_grace_key(room_code),
+        room_playback_key(room_code),
+        room_chat_history_key(room_code),
+        room_chat_history_ready_key(room_code),
+        room_chat_version_key(room_code),
+        room_chat_stream_key(room_code),
+        room_public_meta_key(room_code),
+    ]
+
+
+async def get_rooms_with_pending_chat(room_codes: list[str]) -> list[str]:
+    if not room_codes:
+        return []
+
+    client = get_redis_client()
+    pending = await client.smismember(chat_pending_rooms_key(), room_codes)
+    return [room_code for room_code, flag in zip(room_codes, pending) if flag]
+
+
+async def clear_rooms(room_codes: list[str]):
+    """
+    Delete every realtime key of finished rooms and drop them from the
+    shared indexes, in one pipeline.
+    """
+    if not room_codes:
+        return
+
+    client = get_redis_client()
+
+    async with client.pipeline(transaction=False) as pipe:
+        for room_code in room_codes:
+            pipe.delete(*_room_keys(room_code))
+        pipe.zrem(grace_deadlines_key(), *room_codes)
+        pipe.zrem(public_rooms_by_created_key(), *room_codes)
+        pipe.zrem(public_rooms_by_viewers_key(), *room_codes)
+        pipe.incr(public_rooms_version_key())
+        pipe.srem(presence_rooms_key(), *room_codes)
+        pipe.srem(chat_pending_rooms_key(), *room_codes)
+        await pipe.execute()
+
+
+# ======================
+# Locks
+# ======================
+
+async def acquire_lock(key: str, ttl_seconds: int) -> str | None:
+    """
+    Returns an ownership token, or None if another holder has the lock.
+    """
+    client = get_redis_client()
+    token = uuid.uuid4().hex
+    if await client.set(key, token, nx=True, ex=ttl_seconds):
+        return token
+    return None
+
+
+async def release_lock(key: str, token: str):
+    client = get_redis_client()
+    script = client.register_script(RELEASE_LOCK_SCRIPT)
+    await script(keys=[key], args=[token])
+
+
+# ======================
+# Playback state (hot copy)
+# ======================
+
+def _decode_playback(is_playing, time, version, anchored_at, rate) -> dict:
+    return {
+        "is_playing": is_playing == "1",
+        "time": float(time or 0),
+        "version": int(version or 0),
+        "anchored_at": float(anchored_at or 0),
+        "rate": float(rate or 1),
+    }
+
+
+async def get_playback_state(room_code: str, room_id) -> dict | None:
+    """
+    Returns the live playback state, or None when Redis has no copy for this room.
+    """
+    client = get_redis_client()
+    values = await client.hgetall(room_playback_key(room_code))
+
+    if values.get("room_id") != str(room_id):
+        return None
+
+    return _decode_playback(*(values.get(field) for field in PLAYBACK_FIELDS))
+
+
+async def seed_playback_state(room_code: str, room_id, state: dict) -> dict:
+    client = get_redis_client()
+    script = client.register_script(SEED_PLAYBACK_SCRIPT)
+
+    values = await script(
+        keys=[room_playback_key(room_code)],
+        args=[
+            str(room_id),
+            "1" if state["is_playing"] else "0",
+            state["time"],
+            state["version"],
+            state["anchored_at"],
+            state["rate"],
+            PLAYBACK_STATE_TTL_SECONDS,
+        ],
+    )
+    return _decode_playback(*values)
+
+
+async def update_playback_state(
+    room_code: str,
+    room_id,
+    is_playing: bool,
+    time: float,
+    anchored_at: float,
+    rate: float = 1.0,
+) -> dict | None:
+    """
+    Re-anchor playback at `time` as of server instant `anchored_at`.
+    Returns the new state, or None when the hot copy must be seeded first.
+    """
+    client = get_redis_client()
+    script = client.register_script(UPDATE_PLAYBACK_SCRIPT)
+
+    version = await script(
+        keys=[room_playback_key(room_code), playback_dirty_rooms_key()],
+        args=[
+            str(room_id),
+            "1" if is_playing else "0",
+            time,
+            anchored_at,
+            rate,
+            PLAYBACK_STATE_TTL_SECONDS,
+            room_code,
+        ],
+    )
+
+    if version == -1:
+        return None
+
+    return {
+        "is_playing": is_playing,
+        "time": float(time),
+        "version": int(version),
+        "anchored_at": float(anchored_at),
+        "rate": float(rate),
+    }
+
+
+async def get_playback_states(room_codes: list[str]) -> dict[str, dict]:
+    """
+    Pipelined read of several rooms' hot copies, keyed by room code.
+    Each entry also carries the owning room_id.
+    """
+    client = get_redis_client()
+
+    async with client.pipeline(transaction=False) as pipe:
+        for room_code in room_codes:
+            pipe.hgetall(room_playback_key(room_code))
+        results = await pipe.execute()
+
+    states = {}
+    for room_code, values in zip(room_codes, results):
+        if not values.get("room_id"):
+            continue
+        state = _decode_playback(*(values.get(field) for field in PLAYBACK_FIELDS))
+        state["room_id"] = values["room_id"]
+        states[room_code] = state
+
+    return states
+
+
+async def pop_dirty_playback_rooms(count: int) -> list[str]:
+    client = get_redis_client()
+    return await client.spop(playback_dirty_rooms_key(), count) or []
+
+
+async def mark_playback_dirty(room_codes: list[str]):
+    if not room_codes:
+        return
+
+    client = get_redis_client()
+    await client.sadd(playback_dirty_rooms_key(), *room_codes)
+
+
+async def clear_playback_state(room_code: str):
+    client = get_redis_client()
+    await client.delete(room_playback_key(room_code))
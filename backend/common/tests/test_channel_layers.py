@@ -0,0 +1,38 @@
+import asyncio
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from common.channel_layers import RedisChannelLayer
+
+
+async def _cancel_waiter_then_contend(locks):
+    await locks.acquire("asgispecific.test!")
+    waiter = asyncio.get_running_loop().create_task(locks.acquire("asgispecific.test!"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    (outcome,) = await asyncio.gather(waiter, return_exceptions=True)
+    locks.release("asgispecific.test!")
+    return outcome
+
+
+class CancelSafeChannelLockTests(SimpleTestCase):
+    def make_layer(self):
+        return RedisChannelLayer(**settings.CHANNEL_LAYERS["default"]["CONFIG"])
+
+    def test_cancelled_waiter_is_forgotten(self):
+        locks = self.make_layer().receive_clean_locks
+
+        asyncio.run(_cancel_waiter_then_contend(locks))
+
+        self.assertNotIn("asgispecific.test!", locks.locks)
+        self.assertNotIn("asgispecific.test!", locks.wait_counts)
+
+    def test_lock_contended_on_a_later_loop(self):
+        locks = self.make_layer().receive_clean_locks
+
+        asyncio.run(_cancel_waiter_then_contend(locks))
+        outcome = asyncio.run(_cancel_waiter_then_contend(locks))
+
+        # Not "lock is bound to a different event loop"
+        self.assertIsInstance(outcome, asyncio.CancelledError)
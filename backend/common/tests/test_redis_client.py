@@ -0,0 +1,43 @@
+import asyncio
+
+from django.test import SimpleTestCase
+
+from common.redis_client import (
+    close_redis_client,
+    get_redis_client,
+    get_sync_redis_client,
+)
+
+
+async def _client_pair():
+    return get_redis_client(), get_redis_client()
+
+
+async def _close_and_refetch():
+    first = get_redis_client()
+    await close_redis_client()
+    return first, get_redis_client()
+
+
+class RedisClientRegistryTests(SimpleTestCase):
+    def test_client_is_shared_within_a_loop(self):
+        first, second = asyncio.run(_client_pair())
+
+        self.assertIs(first, second)
+
+    def test_each_loop_gets_its_own_client(self):
+        first, _ = asyncio.run(_client_pair())
+        second, _ = asyncio.run(_client_pair())
+
+        self.assertIsNot(first, second)
+
+    def test_close_drops_the_loop_client(self):
+        first, second = asyncio.run(_close_and_refetch())
+
+        self.assertIsNot(first, second)
+
+    def test_pool_is_bounded(self):
+        client = get_sync_redis_client()
+
+        self.assertIs(client, get_sync_redis_client())
+        self.assertEqual(client.connection_pool.max_connections, 50)
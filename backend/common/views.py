@@ -1,7 +1,7 @@
-from django.conf import settings
 from django.db import connection
 from django.http import JsonResponse
-import redis
+
+from common.redis_client import get_sync_redis_client
 
 
 def health_check(request):
@@ -12,8 +12,7 @@ def health_check(request):
 		db_status = "error"
 
 	try:
-		client = redis.from_url(settings.REDIS_URL)
-		client.ping()
+		get_sync_redis_client().ping()
 		redis_status = "ok"
 	except Exception:
 		redis_status = "error"
@@ -128,13 +128,88 @@ REDIS_URL = os.getenv("REDIS_URL")
 
 CHANNEL_LAYERS = {
     "default": {
-        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        "BACKEND": "common.channel_layers.RedisChannelLayer",
         "CONFIG": {
             "hosts": [REDIS_URL],
         },
     },
 }
 
+# Pooled Redis clients (common.redis_client): one bounded pool per event loop
+# plus one for sync code
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT_SECONDS = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", "5"))
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = int(
+    os.getenv("REDIS_HEALTH_CHECK_INTERVAL_SECONDS", "30")
+)
+
+# Write-behind cadence for Redis playback state -> RoomPlaybackState
+PLAYBACK_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("PLAYBACK_FLUSH_INTERVAL_SECONDS", "2")
+)
+
+# Batch cadence for queued chat messages (Redis streams) -> ChatMessage
+CHAT_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("CHAT_FLUSH_INTERVAL_SECONDS", "1")
+)
+
+# Debounce window for roster changes broadcast as ROOM_PARTICIPANTS_DELTA
+ROSTER_COALESCE_SECONDS = float(os.getenv("ROSTER_COALESCE_SECONDS", "0.25"))
+
+# Upper bound on how long a cached join bundle (sync.join_bundle) is reused
+JOIN_BUNDLE_TTL_SECONDS = float(os.getenv("JOIN_BUNDLE_TTL_SECONDS", "30"))
+
+# Upper bound on how long a cached room snapshot (sync.room_cache) is served
+ROOM_SNAPSHOT_TTL_SECONDS = float(os.getenv("ROOM_SNAPSHOT_TTL_SECONDS", "30"))
+
+# Presence heartbeat cadence; connections silent for PRESENCE_STALE_SECONDS
+# are swept, and RoomParticipant.last_heartbeat is stamped in batches
+PRESENCE_HEARTBEAT_SECONDS = float(os.getenv("PRESENCE_HEARTBEAT_SECONDS", "15"))
+PRESENCE_STALE_SECONDS = float(os.getenv("PRESENCE_STALE_SECONDS", "60"))
+PRESENCE_PERSIST_SECONDS = float(os.getenv("PRESENCE_PERSIST_SECONDS", "60"))
+
+# Longest the grace scheduler (sync.grace) sleeps between deadline checks
+GRACE_SCHEDULER_MAX_SLEEP_SECONDS = float(
+    os.getenv("GRACE_SCHEDULER_MAX_SLEEP_SECONDS", "1")
+)
+
+# Per-process micro-cache lifetime for GET /api/rooms/public/ pages
+PUBLIC_ROOMS_CACHE_SECONDS = float(os.getenv("PUBLIC_ROOMS_CACHE_SECONDS", "2"))
+
+# Provider search cache: served fresh for SEARCH_CACHE_FRESH_SECONDS, then
+# stale (refreshed in the background) until SEARCH_CACHE_TTL_SECONDS
+SEARCH_CACHE_FRESH_SECONDS = float(os.getenv("SEARCH_CACHE_FRESH_SECONDS", "600"))
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "3600"))
+
+# Shared deadline for the multi-provider search fan-out (providers.search_engine)
+SEARCH_DEADLINE_SECONDS = float(os.getenv("SEARCH_DEADLINE_SECONDS", "3"))
+
+# Background prefetch of the next search page / next TV episode (providers.prefetch)
+PREFETCH_CONCURRENCY = int(os.getenv("PREFETCH_CONCURRENCY", "4"))
+PREFETCH_MAX_PENDING = int(os.getenv("PREFETCH_MAX_PENDING", "64"))
+SEARCH_PREFETCH_MAX_PAGE = int(os.getenv("SEARCH_PREFETCH_MAX_PAGE", "5"))
+EPISODE_COUNTS_TTL_SECONDS = int(os.getenv("EPISODE_COUNTS_TTL_SECONDS", "21600"))
+
+# Shared outbound HTTP client for providers (providers.http_client)
+PROVIDER_HTTP2 = os.getenv("PROVIDER_HTTP2", "True").lower() == "true"
+PROVIDER_HTTP_MAX_CONNECTIONS = int(os.getenv("PROVIDER_HTTP_MAX_CONNECTIONS", "50"))
+PROVIDER_HTTP_MAX_KEEPALIVE = int(os.getenv("PROVIDER_HTTP_MAX_KEEPALIVE", "20"))
+PROVIDER_HTTP_KEEPALIVE_SECONDS = float(os.getenv("PROVIDER_HTTP_KEEPALIVE_SECONDS", "30"))
+PROVIDER_HTTP_TIMEOUT_SECONDS = float(os.getenv("PROVIDER_HTTP_TIMEOUT_SECONDS", "5"))
+PROVIDER_HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("PROVIDER_HTTP_CONNECT_TIMEOUT_SECONDS", "2"))
+
+# Provider hedging and circuit breaker (providers.resilience)
+PROVIDER_HEDGE_ENABLED = os.getenv("PROVIDER_HEDGE_ENABLED", "True").lower() == "true"
+PROVIDER_HEDGE_MIN_SECONDS = float(os.getenv("PROVIDER_HEDGE_MIN_SECONDS", "0.05"))
+PROVIDER_HEDGE_MAX_SECONDS = float(os.getenv("PROVIDER_HEDGE_MAX_SECONDS", "1"))
+PROVIDER_BREAKER_FAILURES = int(os.getenv("PROVIDER_BREAKER_FAILURES", "5"))
+PROVIDER_BREAKER_RESET_SECONDS = float(os.getenv("PROVIDER_BREAKER_RESET_SECONDS", "30"))
+# Expired search entries kept this long to serve while the provider is down
+SEARCH_CACHE_STALE_IF_ERROR_SECONDS = int(os.getenv("SEARCH_CACHE_STALE_IF_ERROR_SECONDS", "86400"))
+
+# Join room groups once per worker and fan out locally (sync.relay)
+ROOM_FANOUT_RELAY = os.getenv("ROOM_FANOUT_RELAY", "True").lower() == "true"
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
@@ -198,3 +273,6 @@ CORS_ALLOWED_ORIGINS = [
 ]
 
 CORS_ALLOW_CREDENTIALS = True
+
+# Response headers the cross-origin frontend needs to read
+CORS_EXPOSE_HEADERS = ["X-Next-Cursor", "X-Search-Missing", "ETag"]
@@ -1,3 +1,16 @@
 from django.contrib import admin
+from .models import ContentMetadata
 
-# Register your models here.
+
+@admin.register(ContentMetadata)
+class ContentMetadataAdmin(admin.ModelAdmin):
+    list_display = (
+        "title",
+        "media_type",
+        "release_year",
+        "provider",
+        "stream_id",
+        "updated_at",
+    )
+    search_fields = ("search_title", "stream_id")
+    list_filter = ("provider", "media_type")
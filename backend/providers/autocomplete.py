@@ -0,0 +1,103 @@
+import json
+
+from channels.db import database_sync_to_async
+
+from common.redis_client import get_redis_client, get_sync_redis_client
+from common.redis_keys import autocomplete_items_key, autocomplete_terms_key
+from providers.models import ContentMetadata
+from providers.search_types import normalize_query
+
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 20
+AUTOCOMPLETE_REBUILD_BATCH = 1000
+
+# Separates a term from its item id; sorts below every title character, so an
+# exact title comes before longer titles that extend it
+TERM_SEPARATOR = "\x00"
+
+
+def item_id(result: dict) -> str:
+    return f"{result['provider']}:{result['media_type']}:{result['stream_id']}"
+
+
+def title_terms(title: str) -> list[str]:
+    """
+    Every word-start suffix of the normalized title, so "reloaded" finds
+    "The Matrix Reloaded" as well as "the ma".
+    """
+    words = normalize_query(title).split(" ")
+    return [" ".join(words[index:]) for index in range(len(words)) if words[index]]
+
+
+async def index_titles(results: list[dict], client=None):
+    """
+    Add search results to the lexicographic autocomplete index: one sorted
+    set member per title term (all scored 0) plus the result payload.
+    """
+    results = [result for result in results if result["stream_id"] and result["title"]]
+    if not results:
+        return
+
+    client = client or get_redis_client()
+    pipe = client.pipeline(transaction=False)
+    pipe.zadd(autocomplete_terms_key(), {
+        f"{term}{TERM_SEPARATOR}{item_id(result)}": 0
+        for result in results
+        for term in title_terms(result["title"])
+    })
+    pipe.hset(autocomplete_items_key(), mapping={
+        item_id(result): json.dumps(result) for result in results
+    })
+    await pipe.execute()
+
+
+def autocomplete(prefix: str, limit: int = AUTOCOMPLETE_LIMIT) -> list[dict]:
+    """
+    Up to `limit` distinct results whose title has a word starting with the
+    prefix. One ZRANGEBYLEX plus one HMGET; providers are never called.
+    """
+    prefix = normalize_query(prefix)
+    if not prefix:
+        return []
+
+    client = get_sync_redis_client()
+    # Raw 0xFF bytes sort after every UTF-8 continuation of the prefix
+    members = client.zrangebylex(
+        autocomplete_terms_key(),
+        b"[" + prefix.encode(),
+        b"[" + prefix.encode() + b"\xff",
+        start=0,
+        num=limit * 3,
+    )
+
+    ids = list(dict.fromkeys(member.rsplit(TERM_SEPARATOR, 1)[1] for member in members))[:limit]
+    if not ids:
+        return []
+
+    payloads = client.hmget(autocomplete_items_key(), ids)
+    return [json.loads(payload) for payload in payloads if payload]
+
+
+def _metadata_batch(after_id: int) -> list:
+    return list(
+        ContentMetadata.objects
+        .filter(id__gt=after_id)
+        .order_by("id")[:AUTOCOMPLETE_REBUILD_BATCH]
+    )
+
+
+async def rebuild_autocomplete_index() -> int:
+    """
+    Replace the index with every stored ContentMetadata row. Returns the
+    number of titles indexed.
+    """
+    client = get_redis_client()
+    await client.delete(autocomplete_terms_key(), autocomplete_items_key())
+
+    indexed = 0
+    last_id = 0
+    while batch := await database_sync_to_async(_metadata_batch)(last_id):
+        await index_titles([row.as_search_result() for row in batch], client)
+        indexed += len(batch)
+        last_id = batch[-1].id
+    return indexed
@@ -30,3 +30,9 @@ class BaseProvider(ABC):
         Search provider content and return normalized results.
         """
         raise NotImplementedError
+
+    async def episode_counts(self, external_id: str) -> Dict[int, int]:
+        """
+        Episodes per season for a TV title; empty when unsupported.
+        """
+        return {}
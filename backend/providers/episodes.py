@@ -0,0 +1,68 @@
+import json
+
+from django.conf import settings
+
+from common.redis_client import get_redis_client
+from common.redis_keys import episode_counts_key
+from providers.registry import get_provider
+from providers.resilience import get_provider_guard
+from providers.resolver import derive_embed_url, resolve_playback_source
+
+
+async def get_episode_counts(provider_name: str, external_id: str) -> dict[int, int]:
+    """
+    Episodes per season for a TV title, cached in Redis for
+    EPISODE_COUNTS_TTL_SECONDS so episode switches need no provider call.
+    """
+    client = get_redis_client()
+    key = episode_counts_key(provider_name, external_id)
+
+    cached = await client.get(key)
+    if cached:
+        return {int(season): count for season, count in json.loads(cached).items()}
+
+    provider = get_provider(provider_name)
+    counts = await get_provider_guard(provider_name).call(provider.episode_counts, external_id)
+    await client.set(
+        key,
+        json.dumps(counts),
+        ex=getattr(settings, "EPISODE_COUNTS_TTL_SECONDS", 21600),
+    )
+    return counts
+
+
+def next_episode_after(counts: dict[int, int], season: int, episode: int) -> tuple[int, int] | None:
+    """
+    The episode that follows, rolling over to the next listed season.
+    None at the end of the series or when the season is unknown.
+    """
+    if season not in counts:
+        return None
+    if episode < counts[season]:
+        return season, episode + 1
+
+    later = sorted(number for number in counts if number > season)
+    return (later[0], 1) if later else None
+
+
+async def resolve_next_episode(provider_name: str, external_id: str, season: int, episode: int) -> dict | None:
+    counts = await get_episode_counts(provider_name, external_id)
+    upcoming = next_episode_after(counts, season, episode)
+    if upcoming is None:
+        return None
+
+    source = resolve_playback_source(
+        provider=provider_name,
+        media_type="tv",
+        external_id=external_id,
+        season=upcoming[0],
+        episode=upcoming[1],
+    )
+    return {
+        "provider": source.provider,
+        "media_type": source.media_type,
+        "external_id": source.external_id,
+        "season": source.season,
+        "episode": source.episode,
+        "embed_url": derive_embed_url(source),
+    }
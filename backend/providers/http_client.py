@@ -0,0 +1,60 @@
+import asyncio
+import importlib.util
+import logging
+
+import httpx
+from django.conf import settings
+
+from common.loop_local import loop_local
+
+logger = logging.getLogger("providers")
+
+
+def _http2_enabled() -> bool:
+    if not getattr(settings, "PROVIDER_HTTP2", True):
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("PROVIDER_HTTP2 is set but the h2 package is missing; using HTTP/1.1")
+        return False
+    return True
+
+
+def _client_options():
+    return {
+        "http2": _http2_enabled(),
+        "limits": httpx.Limits(
+            max_connections=getattr(settings, "PROVIDER_HTTP_MAX_CONNECTIONS", 50),
+            max_keepalive_connections=getattr(settings, "PROVIDER_HTTP_MAX_KEEPALIVE", 20),
+            keepalive_expiry=getattr(settings, "PROVIDER_HTTP_KEEPALIVE_SECONDS", 30),
+        ),
+        "timeout": httpx.Timeout(
+            getattr(settings, "PROVIDER_HTTP_TIMEOUT_SECONDS", 5),
+            connect=getattr(settings, "PROVIDER_HTTP_CONNECT_TIMEOUT_SECONDS", 2),
+        ),
+    }
+
+
+@loop_local
+def _loop_client():
+    return httpx.AsyncClient(**_client_options())
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared outbound HTTP client for the running event loop.
+
+    Connections (and their TLS sessions) are reused across provider calls;
+    like the Redis client, each loop gets its own pool because httpx
+    transports are bound to the loop that opened them.
+    """
+    return _loop_client()
+
+
+async def close_http_client():
+    """
+    Close the running loop's client and its pool. Call before a short-lived
+    loop (management commands, benchmarks) finishes.
+    """
+    client = _loop_client.instances.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
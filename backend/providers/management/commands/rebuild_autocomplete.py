@@ -0,0 +1,22 @@
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+
+from common.redis_client import close_redis_client
+from providers.autocomplete import rebuild_autocomplete_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Redis autocomplete index from stored content metadata"
+
+    def handle(self, *args, **options):
+        async_to_sync(self._run)()
+
+    async def _run(self):
+        try:
+            indexed = await rebuild_autocomplete_index()
+        finally:
+            await close_redis_client()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {indexed} title(s) for autocomplete")
+        )
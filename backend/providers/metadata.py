@@ -0,0 +1,87 @@
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from providers.models import ContentMetadata
+from providers.search_types import normalize_query
+
+SEARCH_PAGE_SIZE = 20
+
+_UPDATE_FIELDS = ["title", "search_title", "poster", "release_year", "updated_at"]
+
+
+def record_search_results(results: list[dict]) -> int:
+    """
+    Upsert provider search results into ContentMetadata in one statement.
+    """
+    now = timezone.now()
+    rows = {
+        (result["provider"], result["media_type"], result["stream_id"]): ContentMetadata(
+            provider=result["provider"],
+            stream_id=result["stream_id"],
+            media_type=result["media_type"],
+            title=result["title"][:255],
+            search_title=normalize_query(result["title"])[:255],
+            poster=result["poster"],
+            release_year=result["release_year"],
+            updated_at=now,
+        )
+        for result in results
+        if result["stream_id"] and result["title"]
+    }
+    if not rows:
+        return 0
+
+    ContentMetadata.objects.bulk_create(
+        rows.values(),
+        update_conflicts=True,
+        unique_fields=["provider", "media_type", "stream_id"],
+        update_fields=_UPDATE_FIELDS,
+    )
+    return len(rows)
+
+
+def search_local(query: str, page: int = 1, page_size: int = SEARCH_PAGE_SIZE) -> list[dict]:
+    """
+    One page of stored titles containing the normalized query, prefix matches
+    first. Served by the search_title btree index for prefixes and the
+    trigram index for substrings on PostgreSQL.
+    """
+    query = normalize_query(query)
+    start = (page - 1) * page_size
+    matches = (
+        ContentMetadata.objects
+        .filter(search_title__contains=query)
+        .annotate(
+            prefix_rank=Case(
+                When(search_title__startswith=query, then=Value(0)),
+                default=Value(1),
+                output_field=IntegerField(),
+            )
+        )
+        .order_by("prefix_rank", F("release_year").desc(nulls_last=True), "title", "id")
+    )
+    return [item.as_search_result() for item in matches[start:start + page_size]]
+
+
+def lookup_content(sources) -> dict:
+    """
+    Bulk metadata for (provider, stream_id) pairs, e.g. room videos.
+    Movies win over TV entries that share a stream id, since rooms play movies.
+    """
+    sources = {(provider, stream_id) for provider, stream_id in sources if provider and stream_id}
+    if not sources:
+        return {}
+
+    rows = ContentMetadata.objects.filter(
+        provider__in={provider for provider, _ in sources},
+        stream_id__in={stream_id for _, stream_id in sources},
+    )
+
+    found = {}
+    for row in rows:
+        key = (row.provider, row.stream_id)
+        if key not in sources:
+            continue
+        if key not in found or row.media_type == "movie":
+            found[key] = row
+    return found
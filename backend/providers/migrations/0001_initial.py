@@ -0,0 +1,31 @@
+# Generated by Django 5.2.11 on 2026-10-18 05:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentMetadata',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.CharField(max_length=50)),
+                ('stream_id', models.CharField(max_length=255)),
+                ('media_type', models.CharField(max_length=20)),
+                ('title', models.CharField(max_length=255)),
+                ('search_title', models.CharField(db_index=True, max_length=255)),
+                ('poster', models.URLField(blank=True, max_length=500, null=True)),
+                ('release_year', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('provider', 'media_type', 'stream_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations
+
+INDEX_NAME = "providers_content_title_trgm"
+
+
+def create_trigram_index(apps, schema_editor):
+    # Substring search on search_title; PostgreSQL only (pg_trgm is a trusted
+    # extension, so the database owner can enable it). Other backends scan.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+        "ON providers_contentmetadata USING gin (search_title gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("providers", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
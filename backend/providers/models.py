@@ -1,3 +1,34 @@
 from django.db import models
 
-# Create your models here.
+
+class ContentMetadata(models.Model):
+    """
+    Search results seen from providers, kept so repeat and prefix searches
+    and room listings can be answered without an external call.
+    """
+
+    provider = models.CharField(max_length=50)
+    stream_id = models.CharField(max_length=255)
+    media_type = models.CharField(max_length=20)  # movie / tv
+    title = models.CharField(max_length=255)
+    # Normalized title (NFKC, casefolded, single spaces) used for lookups
+    search_title = models.CharField(max_length=255, db_index=True)
+    poster = models.URLField(max_length=500, null=True, blank=True)
+    release_year = models.PositiveSmallIntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("provider", "media_type", "stream_id")
+
+    def __str__(self):
+        return f"{self.title} ({self.provider}:{self.media_type}:{self.stream_id})"
+
+    def as_search_result(self) -> dict:
+        return {
+            "provider": self.provider,
+            "stream_id": self.stream_id,
+            "media_type": self.media_type,
+            "title": self.title,
+            "poster": self.poster,
+            "release_year": self.release_year,
+        }
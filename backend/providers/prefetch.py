@@ -0,0 +1,72 @@
+import asyncio
+import logging
+
+from django.conf import settings
+
+from common.loop_local import loop_local
+from providers.episodes import resolve_next_episode
+from providers.resilience import ProviderUnavailable
+from providers.search_cache import get_search_cache
+from providers.search_types import normalize_query
+
+logger = logging.getLogger("providers")
+
+
+class Prefetcher:
+    """
+    Per-event-loop background warmer for what a user is likely to ask for
+    next: the following search page and the following TV episode.
+
+    At most PREFETCH_CONCURRENCY warm-ups run at once and at most
+    PREFETCH_MAX_PENDING are queued; beyond that new work is dropped, since
+    a prefetch is only worth doing if it finishes before the user asks.
+    Duplicate keys are coalesced. Failures are logged and never surface.
+    """
+
+    def __init__(self):
+        self.max_pending = getattr(settings, "PREFETCH_MAX_PENDING", 64)
+        self.max_search_page = getattr(settings, "SEARCH_PREFETCH_MAX_PAGE", 5)
+        self._semaphore = asyncio.Semaphore(getattr(settings, "PREFETCH_CONCURRENCY", 4))
+        self._pending: dict[str, asyncio.Task] = {}
+
+    def schedule(self, key: str, factory) -> bool:
+        if key in self._pending or len(self._pending) >= self.max_pending:
+            return False
+
+        task = asyncio.get_running_loop().create_task(self._run(key, factory))
+        self._pending[key] = task
+        task.add_done_callback(lambda _, key=key: self._pending.pop(key, None))
+        return True
+
+    async def _run(self, key, factory):
+        async with self._semaphore:
+            try:
+                await factory()
+            except ProviderUnavailable:
+                logger.debug("Prefetch skipped, circuit open | key=%s", key)
+            except Exception:
+                logger.warning("Prefetch failed | key=%s", key, exc_info=True)
+
+    def prefetch_search_page(self, provider, query: str, page: int) -> bool:
+        if page > self.max_search_page:
+            return False
+        return self.schedule(
+            f"search:{provider.name}:{page}:{normalize_query(query)}",
+            lambda: get_search_cache().search(provider, query, page),
+        )
+
+    def prefetch_next_episode(self, provider_name: str, external_id: str, season: int, episode: int) -> bool:
+        return self.schedule(
+            f"episode:{provider_name}:{external_id}",
+            lambda: resolve_next_episode(provider_name, external_id, season, episode),
+        )
+
+
+@loop_local
+def get_prefetcher():
+    return Prefetcher()
+
+
+async def schedule_next_episode(provider_name: str, external_id: str, season: int, episode: int) -> bool:
+    # Entry point for sync views: async_to_sync runs this on the server loop
+    return get_prefetcher().prefetch_next_episode(provider_name, external_id, season, episode)
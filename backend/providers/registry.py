@@ -1,6 +1,9 @@
 from providers.base import BaseProvider
+from providers.http_client import close_http_client, get_http_client
 from providers.vidking import VidkingProvider
 
+__all__ = ["PROVIDERS", "close_http_client", "get_http_client", "get_provider"]
+
 
 PROVIDERS: dict[str, BaseProvider] = {
     "vidking": VidkingProvider(),
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+
+import httpx
+from django.conf import settings
+
+from common.loop_local import loop_local
+from common.metrics import PROVIDER_CALL_SECONDS, PROVIDER_CIRCUIT_TRANSITIONS, PROVIDER_HEDGES
+
+logger = logging.getLogger("providers")
+
+LATENCY_WINDOW = 200
+LATENCY_MIN_SAMPLES = 20
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderUnavailable(Exception):
+    """
+    Raised without calling the provider while its circuit is open.
+    """
+
+    def __init__(self, provider: str, retry_after: float):
+        super().__init__(f"Provider {provider} is unavailable")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """
+    Failures that say something about provider health. Client errors and
+    configuration problems (bad key, bad params) do not trip the breaker.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500 or exc.response.status_code == 429
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError))
+
+
+class LatencyTracker:
+    """
+    Sliding window of successful call durations.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        if len(self.samples) < LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+class CircuitBreaker:
+    """
+    Opens after PROVIDER_BREAKER_FAILURES consecutive upstream failures and
+    fails fast for PROVIDER_BREAKER_RESET_SECONDS. Then one probe is let
+    through (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.failure_threshold = getattr(settings, "PROVIDER_BREAKER_FAILURES", 5)
+        self.reset_seconds = getattr(settings, "PROVIDER_BREAKER_RESET_SECONDS", 30)
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+    def _transition(self, state: str):
+        if state != self.state:
+            logger.warning("Provider circuit %s | provider=%s", state, self.provider)
+            PROVIDER_CIRCUIT_TRANSITIONS.labels(provider=self.provider, state=state).inc()
+            self.state = state
+
+    def retry_after(self) -> float:
+        return max(0.0, self.opened_at + self.reset_seconds - time.monotonic())
+
+    def allow(self) -> bool:
+        if self.state == OPEN and self.retry_after() == 0:
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self.probing:
+                return False
+            self.probing = True
+            return True
+        return self.state == CLOSED
+
+    def record_success(self):
+        self.failures = 0
+        self.probing = False
+        self._transition(CLOSED)
+
+    def record_failure(self):
+        self.failures += 1
+        self.probing = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._transition(OPEN)
+
+    def release(self):
+        # A half-open probe that ended without a health signal frees the slot
+        self.probing = False
+
+
+class ProviderGuard:
+    """
+    Per-provider call wrapper: circuit breaker plus hedging.
+
+    A backup attempt is started once the primary has run longer than the
+    provider's recent p95 (clamped to PROVIDER_HEDGE_MIN/MAX_SECONDS), or as
+    soon as the primary fails upstream. The first success wins and the other
+    attempt is cancelled, so a slow upstream costs at most about two
+    attempts and never more than one extra request.
+    """
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.latency = LatencyTracker()
+        self.breaker = CircuitBreaker(provider)
+        self.hedge_enabled = getattr(settings, "PROVIDER_HEDGE_ENABLED", True)
+        self.hedge_min = getattr(settings, "PROVIDER_HEDGE_MIN_SECONDS", 0.05)
+        self.hedge_max = getattr(settings, "PROVIDER_HEDGE_MAX_SECONDS", 1.0)
+
+    def hedge_delay(self) -> float:
+        p95 = self.latency.quantile(0.95)
+        if p95 is None:
+            return self.hedge_max
+        return min(self.hedge_max, max(self.hedge_min, p95))
+
+    async def call(self, fn, *args):
+        if not self.breaker.allow():
+            raise ProviderUnavailable(self.provider, self.breaker.retry_after())
+
+        start = time.monotonic()
+        try:
+            result = await self._hedged(fn, *args)
+        except BaseException as exc:
+            PROVIDER_CALL_SECONDS.labels(provider=self.provider, outcome="error").observe(
+                time.monotonic() - start
+            )
+            if isinstance(exc, Exception) and is_upstream_failure(exc):
+                self.breaker.record_failure()
+            else:
+                self.breaker.release()
+            raise
+
+        elapsed = time.monotonic() - start
+        PROVIDER_CALL_SECONDS.labels(provider=self.provider, outcome="ok").observe(elapsed)
+        self.latency.record(elapsed)
+        self.breaker.record_success()
+        return result
+
+    async def _hedged(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        attempts = {loop.create_task(fn(*args))}
+        hedged = not self.hedge_enabled
+        deadline = loop.time() + self.hedge_delay()
+        error = None
+
+        try:
+            while attempts:
+                timeout = None if hedged else max(0.0, deadline - loop.time())
+                done, attempts = await asyncio.wait(
+                    attempts, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        return task.result()
+                    error = exc
+
+                retry = error is not None and is_upstream_failure(error) and not attempts
+                if not hedged and (not done or retry):
+                    hedged = True
+                    PROVIDER_HEDGES.labels(provider=self.provider).inc()
+                    attempts.add(loop.create_task(fn(*args)))
+
+            raise error
+        finally:
+            for task in attempts:
+                task.cancel()
+
+
+@loop_local
+def _loop_guards():
+    return {}
+
+
+def get_provider_guard(provider: str) -> ProviderGuard:
+    guards = _loop_guards()
+    guard = guards.get(provider)
+    if guard is None:
+        guard = guards[provider] = ProviderGuard(provider)
+    return guard
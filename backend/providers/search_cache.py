@@ -0,0 +1,159 @@
+import asyncio
+import json
+import logging
+import math
+import time
+from dataclasses import asdict
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+
+from common.loop_local import loop_local
+from common.redis_client import get_redis_client
+from common.redis_keys import search_cache_key, search_lock_key
+from common.redis_room_state import acquire_lock, release_lock
+from providers.autocomplete import index_titles
+from providers.metadata import record_search_results
+from providers.resilience import ProviderUnavailable, get_provider_guard, is_upstream_failure
+from providers.search_types import normalize_query
+
+logger = logging.getLogger("providers.search")
+
+SEARCH_LOCK_SECONDS = 5
+SEARCH_LOCK_POLL_SECONDS = 0.05
+
+
+async def read_search_entry(key: str) -> dict | None:
+    client = get_redis_client()
+    cached = await client.get(key)
+    return json.loads(cached) if cached else None
+
+
+async def store_search_entry(
+    key: str,
+    results: list[dict],
+    fresh_seconds: float,
+    ttl_seconds: int,
+    stale_if_error_seconds: int = 0,
+):
+    client = get_redis_client()
+    now = time.time()
+    entry = {
+        "results": results,
+        "fresh_until": now + fresh_seconds,
+        "expires_at": now + ttl_seconds,
+    }
+    await client.set(key, json.dumps(entry), ex=ttl_seconds + stale_if_error_seconds)
+
+
+class SearchCache:
+    """
+    Per-event-loop front for provider search.
+
+    Entries are fresh for SEARCH_CACHE_FRESH_SECONDS and kept for
+    SEARCH_CACHE_TTL_SECONDS. A stale entry is served immediately while one
+    background task refreshes it. Misses and refreshes are coalesced per key:
+    in-process through a shared task, across nodes through a Redis lock whose
+    losers wait for the winner's result instead of calling the provider.
+
+    Every provider fetch is also upserted into ContentMetadata, which backs
+    local search and room titles, and into the autocomplete index. Provider calls go through the provider's guard (hedging and circuit
+    breaker). Expired entries linger for SEARCH_CACHE_STALE_IF_ERROR_SECONDS
+    and are served only when the provider is failing or its circuit is open.
+    """
+
+    def __init__(self):
+        self.fresh_seconds = getattr(settings, "SEARCH_CACHE_FRESH_SECONDS", 600)
+        self.ttl_seconds = getattr(settings, "SEARCH_CACHE_TTL_SECONDS", 3600)
+        self.stale_if_error_seconds = getattr(settings, "SEARCH_CACHE_STALE_IF_ERROR_SECONDS", 86400)
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def search(self, provider, query: str, page: int = 1) -> list[dict]:
+        query = normalize_query(query)
+        key = search_cache_key(provider.name, query, page)
+
+        entry = await read_search_entry(key)
+        now = time.time()
+        if entry is not None and now < entry.get("expires_at", math.inf):
+            if now >= entry["fresh_until"]:
+                self._start(key, provider, query, page, wait=False)
+            return entry["results"]
+
+        try:
+            # Shielded so one caller disconnecting does not cancel the shared fetch
+            results = await asyncio.shield(self._start(key, provider, query, page, wait=True))
+            if results is None:
+                # Joined a background refresh that another node was already running
+                results = await self._fetch(key, provider, query, page)
+        except Exception as exc:
+            if entry is None or not (isinstance(exc, ProviderUnavailable) or is_upstream_failure(exc)):
+                raise
+            logger.warning("Serving expired search results | key=%s error=%r", key, exc)
+            return entry["results"]
+        return results
+
+    def _start(self, key, provider, query, page, wait) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._fill(key, provider, query, page, wait)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finished(key, done))
+        return task
+
+    def _finished(self, key, task):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is None:
+            return
+        if isinstance(task.exception(), ProviderUnavailable):
+            logger.debug("Search fill skipped, circuit open | key=%s", key)
+        else:
+            logger.warning("Search fill failed | key=%s", key, exc_info=task.exception())
+
+    async def _fill(self, key, provider, query, page, wait) -> list[dict] | None:
+        lock_key = search_lock_key(provider.name, query, page)
+        token = await acquire_lock(lock_key, SEARCH_LOCK_SECONDS)
+
+        if token is None:
+            # Another node holds the lock; a refresh can just let it finish
+            if not wait:
+                return None
+
+            entry = await self._wait_for_entry(key)
+            if entry is not None:
+                return entry["results"]
+            return await self._fetch(key, provider, query, page)
+
+        try:
+            return await self._fetch(key, provider, query, page)
+        finally:
+            await release_lock(lock_key, token)
+
+    async def _wait_for_entry(self, key) -> dict | None:
+        deadline = time.monotonic() + SEARCH_LOCK_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(SEARCH_LOCK_POLL_SECONDS)
+            entry = await read_search_entry(key)
+            if entry is not None and time.time() < entry["fresh_until"]:
+                return entry
+        return None
+
+    async def _fetch(self, key, provider, query, page) -> list[dict]:
+        found = await get_provider_guard(provider.name).call(provider.search, query, page)
+        results = [asdict(result) for result in found]
+        await store_search_entry(
+            key, results, self.fresh_seconds, self.ttl_seconds, self.stale_if_error_seconds
+        )
+
+        try:
+            await database_sync_to_async(record_search_results)(results)
+            await index_titles(results)
+        except Exception:
+            logger.warning("Content metadata upsert failed | key=%s", key, exc_info=True)
+        return results
+
+
+@loop_local
+def get_search_cache():
+    return SearchCache()
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+
+from providers.metadata import SEARCH_PAGE_SIZE, search_local
+from providers.prefetch import get_prefetcher
+from providers.registry import PROVIDERS
+from providers.resilience import ProviderUnavailable
+from providers.search_cache import get_search_cache
+from providers.search_types import normalize_query
+
+logger = logging.getLogger("providers.search")
+
+
+@dataclass
+class SearchOutcome:
+    results: list[dict]
+    # Providers that timed out or failed; their results are missing
+    missing: list[str] = field(default_factory=list)
+
+
+def _dedupe_key(result: dict):
+    return result["media_type"], normalize_query(result["title"]), result["release_year"]
+
+
+def merge_results(ranked: list[list[dict]]) -> list[dict]:
+    """
+    Interleave provider result lists by rank (registry order breaks ties) and
+    drop later duplicates of the same title, media type and year.
+    """
+    merged = []
+    seen = set()
+    for rank in range(max((len(results) for results in ranked), default=0)):
+        for results in ranked:
+            if rank >= len(results):
+                continue
+            key = _dedupe_key(results[rank])
+            if key not in seen:
+                seen.add(key)
+                merged.append(results[rank])
+    return merged
+
+
+async def search_providers(query: str, page: int = 1, providers=None) -> SearchOutcome:
+    """
+    Answer from stored ContentMetadata when it fills the page; otherwise
+    query every registered provider concurrently through its own search cache
+    entry and merge whatever arrives within SEARCH_DEADLINE_SECONDS, with
+    local matches filling gaps after the provider results.
+
+    Latency is the slowest provider's (bounded by the deadline), not the sum.
+    Late providers keep filling their cache entry in the background, so the
+    next identical search includes them. Providers that returned a full page
+    get their next page prefetched. Raises ProviderUnavailable only when
+    nothing arrived (locally or remotely) and a provider's circuit was open;
+    re-raises the first error when every provider failed outright.
+    """
+    local = await database_sync_to_async(search_local)(query, page)
+    if len(local) >= SEARCH_PAGE_SIZE:
+        return SearchOutcome(results=local)
+
+    providers = list(PROVIDERS.values()) if providers is None else providers
+    deadline = getattr(settings, "SEARCH_DEADLINE_SECONDS", 3)
+    cache = get_search_cache()
+
+    tasks = {
+        asyncio.ensure_future(cache.search(provider, query, page)): provider
+        for provider in providers
+    }
+    done, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in pending:
+        # Only cancels this wait; the shielded cache fill carries on
+        task.cancel()
+
+    ranked = []
+    missing = []
+    errors = []
+    prefetcher = get_prefetcher()
+    for task, provider in tasks.items():
+        name = provider.name
+        if task in done and task.exception() is None:
+            ranked.append(task.result())
+            # A full page suggests there is a next one; warm it in the background
+            if len(task.result()) >= SEARCH_PAGE_SIZE:
+                prefetcher.prefetch_search_page(provider, query, page + 1)
+            continue
+
+        missing.append(name)
+        if task in pending:
+            logger.info("Search provider missed deadline | provider=%s", name)
+        else:
+            # The cache fill already logged the traceback
+            errors.append(task.exception())
+            logger.info("Search provider failed | provider=%s error=%r", name, task.exception())
+
+    if not ranked and not local and errors and not pending:
+        unavailable = [exc for exc in errors if isinstance(exc, ProviderUnavailable)]
+        if unavailable:
+            raise min(unavailable, key=lambda exc: exc.retry_after)
+        raise errors[0]
+
+    results = merge_results(ranked)
+    seen = {_dedupe_key(result) for result in results}
+    gaps = [result for result in local if _dedupe_key(result) not in seen]
+    results.extend(gaps[:max(0, SEARCH_PAGE_SIZE - len(results))])
+    return SearchOutcome(results=results, missing=missing)
@@ -1,3 +1,4 @@
+import unicodedata
 from dataclasses import dataclass
 from typing import Optional
 
@@ -10,3 +11,11 @@ class ContentSearchResult:
     title: str
     poster: Optional[str]
     release_year: Optional[int]
+
+
+def normalize_query(query: str) -> str:
+    """
+    Case- and whitespace-insensitive form shared by search cache keys,
+    upstream calls, stored titles and fan-out dedupe keys.
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).split()).casefold()
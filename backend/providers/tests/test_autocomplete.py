@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from common.redis_client import get_redis_client
+from common.redis_keys import autocomplete_items_key, autocomplete_terms_key
+from providers.autocomplete import autocomplete, index_titles, rebuild_autocomplete_index, title_terms
+from providers.metadata import record_search_results
+from providers.search_engine import SearchOutcome
+
+
+def _result(stream_id, title, media_type="movie"):
+    return {
+        "provider": "vidking",
+        "stream_id": stream_id,
+        "media_type": media_type,
+        "title": title,
+        "poster": None,
+        "release_year": 2020,
+    }
+
+
+class TitleTermsTests(SimpleTestCase):
+    def test_word_start_suffixes_are_normalized(self):
+        self.assertEqual(
+            title_terms("The  Matrix RELOADED"),
+            ["the matrix reloaded", "matrix reloaded", "reloaded"],
+        )
+
+
+class AutocompleteIndexTests(TestCase):
+    def setUp(self):
+        async_to_sync(self._clear)()
+
+    def tearDown(self):
+        async_to_sync(self._clear)()
+
+    async def _clear(self):
+        await get_redis_client().delete(autocomplete_terms_key(), autocomplete_items_key())
+
+    def test_prefix_matches_any_word_start_once(self):
+        async_to_sync(index_titles)([
+            _result("1", "The Matrix"),
+            _result("2", "Matrix Reloaded"),
+            _result("3", "Inception"),
+            _result("4", "Mad Max: Matrix Edition"),
+        ])
+
+        titles = [item["title"] for item in autocomplete("MATR", 10)]
+
+        self.assertEqual(titles, ["The Matrix", "Mad Max: Matrix Edition", "Matrix Reloaded"])
+        self.assertEqual(autocomplete("reload", 10)[0]["stream_id"], "2")
+        self.assertEqual(autocomplete("zzz", 10), [])
+
+    def test_limit_and_non_ascii_prefix(self):
+        async_to_sync(index_titles)([_result(str(index), f"Amélie {index}") for index in range(5)])
+
+        self.assertEqual(len(autocomplete("amé", 3)), 3)
+        self.assertEqual(autocomplete("ame", 3), [])
+
+    def test_rebuild_from_metadata(self):
+        record_search_results([_result("1", "The Matrix"), _result("2", "Inception")])
+
+        self.assertEqual(async_to_sync(rebuild_autocomplete_index)(), 2)
+        self.assertEqual(autocomplete("incep", 10)[0]["title"], "Inception")
+
+
+class AutocompleteViewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    @patch("rooms.views.autocomplete")
+    def test_returns_results_with_clamped_limit(self, mock_autocomplete):
+        mock_autocomplete.return_value = [_result("1", "The Matrix")]
+
+        res = self.client.get("/api/rooms/search/autocomplete/?q=mat&limit=500")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()[0]["title"], "The Matrix")
+        mock_autocomplete.assert_called_once_with("mat", 20)
+
+    def test_requires_query(self):
+        self.assertEqual(self.client.get("/api/rooms/search/autocomplete/").status_code, 400)
+        self.assertEqual(
+            self.client.get("/api/rooms/search/autocomplete/?q=a&limit=x").status_code,
+            400,
+        )
+
+
+class SearchViewTests(TestCase):
+    @patch("rooms.views.search_providers", new_callable=AsyncMock)
+    def test_search_returns_merged_results_and_missing_header(self, mock_search):
+        mock_search.return_value = SearchOutcome(results=[_result("1", "The Matrix")], missing=["slow"])
+
+        res = APIClient().get("/api/rooms/search/?q=matrix")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()[0]["title"], "The Matrix")
+        self.assertEqual(res["X-Search-Missing"], "slow")
+        mock_search.assert_awaited_once_with("matrix", 1)
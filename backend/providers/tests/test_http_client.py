@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+import httpx
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+
+from providers import tmdb_client
+from providers.http_client import _client_options, close_http_client, get_http_client
+from providers.registry import get_http_client as registry_get_http_client
+
+
+class HttpClientTests(TestCase):
+    def test_client_is_shared_per_loop_and_closed_explicitly(self):
+        async def run():
+            first = get_http_client()
+            second = registry_get_http_client()
+            await close_http_client()
+            third = get_http_client()
+            await close_http_client()
+            return first, second, third
+
+        first, second, third = async_to_sync(run)()
+
+        self.assertIs(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertIsNot(first, third)
+
+    @override_settings(
+        PROVIDER_HTTP_MAX_CONNECTIONS=7,
+        PROVIDER_HTTP_MAX_KEEPALIVE=3,
+        PROVIDER_HTTP_TIMEOUT_SECONDS=4,
+        PROVIDER_HTTP_CONNECT_TIMEOUT_SECONDS=1,
+    )
+    def test_limits_and_timeouts_come_from_settings(self):
+        options = _client_options()
+
+        self.assertEqual(options["limits"].max_connections, 7)
+        self.assertEqual(options["limits"].max_keepalive_connections, 3)
+        self.assertEqual(options["timeout"].read, 4)
+        self.assertEqual(options["timeout"].connect, 1)
+
+    @override_settings(PROVIDER_HTTP2=True)
+    def test_http2_falls_back_without_h2(self):
+        with patch("providers.http_client.importlib.util.find_spec", return_value=None):
+            self.assertFalse(_client_options()["http2"])
+
+    @override_settings(PROVIDER_HTTP2=False)
+    def test_http2_can_be_disabled(self):
+        self.assertFalse(_client_options()["http2"])
+
+
+class SearchTmdbClientTests(TestCase):
+    @patch.object(tmdb_client, "TMDB_API_KEY", "key")
+    def test_search_reuses_shared_client(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"results": []})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def run():
+            with patch("providers.tmdb_client.get_http_client", return_value=client):
+                await tmdb_client.search_tmdb("matrix", 2)
+                await tmdb_client.search_tmdb("matrix", 3)
+            return client.is_closed
+
+        closed = async_to_sync(run)()
+
+        self.assertFalse(closed)
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[0].url.params["query"], "matrix")
+        self.assertEqual(requests[1].url.params["page"], "3")
@@ -0,0 +1,87 @@
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from providers.metadata import SEARCH_PAGE_SIZE, lookup_content, record_search_results, search_local
+from providers.models import ContentMetadata
+from providers.search_engine import search_providers
+
+
+def _result(stream_id, title, year=2020, media_type="movie", provider="vidking"):
+    return {
+        "provider": provider,
+        "stream_id": stream_id,
+        "media_type": media_type,
+        "title": title,
+        "poster": f"https://image.test/{stream_id}.jpg",
+        "release_year": year,
+    }
+
+
+class RecordSearchResultsTests(TestCase):
+    def test_upserts_by_provider_media_type_and_stream_id(self):
+        record_search_results([_result("1", "The Matrix", 1999)])
+        record_search_results([
+            _result("1", "The Matrix (Remastered)", 1999),
+            _result("1", "Matrix Show", 2021, media_type="tv"),
+        ])
+
+        self.assertEqual(ContentMetadata.objects.count(), 2)
+        movie = ContentMetadata.objects.get(media_type="movie", stream_id="1")
+        self.assertEqual(movie.title, "The Matrix (Remastered)")
+        self.assertEqual(movie.search_title, "the matrix (remastered)")
+
+
+class SearchLocalTests(TestCase):
+    def setUp(self):
+        record_search_results([
+            _result("1", "The Matrix", 1999),
+            _result("2", "Matrix Reloaded", 2003),
+            _result("3", "Inception", 2010),
+        ])
+
+    def test_prefix_matches_rank_first(self):
+        titles = [item["title"] for item in search_local("  MATRIX ")]
+        self.assertEqual(titles, ["Matrix Reloaded", "The Matrix"])
+
+    def test_pages(self):
+        self.assertEqual(len(search_local("matr", page=1, page_size=1)), 1)
+        self.assertEqual(search_local("matr", page=2, page_size=1)[0]["title"], "The Matrix")
+        self.assertEqual(search_local("matr", page=3, page_size=1), [])
+
+
+class LookupContentTests(TestCase):
+    def test_bulk_lookup_prefers_movies(self):
+        record_search_results([
+            _result("1", "Matrix Show", media_type="tv"),
+            _result("1", "The Matrix"),
+            _result("2", "Inception"),
+        ])
+
+        with self.assertNumQueries(1):
+            found = lookup_content([("vidking", "1"), ("vidking", "2"), ("vidking", "9"), ("", "")])
+
+        self.assertEqual(found[("vidking", "1")].title, "The Matrix")
+        self.assertEqual(found[("vidking", "2")].title, "Inception")
+        self.assertNotIn(("vidking", "9"), found)
+
+
+class LocalFirstSearchTests(TestCase):
+    @patch("providers.search_engine.get_search_cache")
+    def test_full_local_page_skips_providers(self, get_cache):
+        record_search_results([_result(str(index), f"Matrix {index}") for index in range(SEARCH_PAGE_SIZE)])
+
+        outcome = async_to_sync(search_providers)("matrix", 1)
+
+        self.assertEqual(len(outcome.results), SEARCH_PAGE_SIZE)
+        get_cache.assert_not_called()
+
+    @patch("providers.search_engine.get_search_cache")
+    def test_local_matches_fill_gaps_after_provider_results(self, get_cache):
+        record_search_results([_result("1", "The Matrix", 1999), _result("2", "Matrix Reloaded", 2003)])
+        get_cache.return_value.search = AsyncMock(return_value=[_result("1", "The Matrix", 1999)])
+
+        outcome = async_to_sync(search_providers)("matrix", 1)
+
+        self.assertEqual([item["title"] for item in outcome.results], ["The Matrix", "Matrix Reloaded"])
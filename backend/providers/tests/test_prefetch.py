@@ -0,0 +1,134 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from providers.episodes import next_episode_after, resolve_next_episode
+from providers.metadata import SEARCH_PAGE_SIZE
+from providers.prefetch import Prefetcher
+from providers.registry import get_provider
+from providers.search_engine import search_providers
+
+
+class NextEpisodeAfterTests(SimpleTestCase):
+    counts = {1: 3, 2: 2, 4: 5}
+
+    def test_next_in_season(self):
+        self.assertEqual(next_episode_after(self.counts, 1, 2), (1, 3))
+
+    def test_rolls_over_to_next_listed_season(self):
+        self.assertEqual(next_episode_after(self.counts, 1, 3), (2, 1))
+        self.assertEqual(next_episode_after(self.counts, 2, 2), (4, 1))
+
+    def test_series_end_and_unknown_season(self):
+        self.assertIsNone(next_episode_after(self.counts, 4, 5))
+        self.assertIsNone(next_episode_after(self.counts, 3, 1))
+
+
+class EpisodeResolutionTests(TestCase):
+    @patch("providers.vidking.get_tmdb_show", new_callable=AsyncMock)
+    def test_vidking_episode_counts_skip_specials(self, mock_show):
+        mock_show.return_value = {
+            "seasons": [
+                {"season_number": 0, "episode_count": 4},
+                {"season_number": 1, "episode_count": 8},
+                {"season_number": 2, "episode_count": 10},
+            ]
+        }
+
+        counts = async_to_sync(get_provider("vidking").episode_counts)("119051")
+
+        self.assertEqual(counts, {1: 8, 2: 10})
+
+    @patch("providers.episodes.get_episode_counts", new_callable=AsyncMock, return_value={1: 8, 2: 10})
+    def test_resolves_next_source_and_embed_url(self, mock_counts):
+        upcoming = async_to_sync(resolve_next_episode)("vidking", "119051", 1, 8)
+
+        self.assertEqual(upcoming["season"], 2)
+        self.assertEqual(upcoming["episode"], 1)
+        self.assertEqual(upcoming["embed_url"], "https://www.vidking.net/embed/tv/119051/2/1")
+
+
+@override_settings(PREFETCH_CONCURRENCY=2, PREFETCH_MAX_PENDING=3, SEARCH_PREFETCH_MAX_PAGE=2)
+class PrefetcherTests(TestCase):
+    def test_concurrency_budget_dedupe_and_queue_bound(self):
+        running = []
+        peak = []
+
+        async def warm():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        async def run():
+            prefetcher = Prefetcher()
+            scheduled = [prefetcher.schedule(key, warm) for key in ["a", "a", "b", "c", "d"]]
+            await asyncio.gather(*prefetcher._pending.values())
+            return scheduled, prefetcher._pending
+
+        scheduled, pending = async_to_sync(run)()
+
+        self.assertEqual(scheduled, [True, False, True, True, False])
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(pending, {})
+
+    def test_search_prefetch_stops_at_max_page(self):
+        provider = MagicMock()
+        provider.name = "vidking"
+
+        async def run():
+            prefetcher = Prefetcher()
+            with patch("providers.prefetch.get_search_cache") as get_cache:
+                get_cache.return_value.search = AsyncMock(return_value=[])
+                results = [
+                    prefetcher.prefetch_search_page(provider, "Matrix", 2),
+                    prefetcher.prefetch_search_page(provider, " matrix", 2),
+                    prefetcher.prefetch_search_page(provider, "matrix", 3),
+                ]
+                await asyncio.gather(*prefetcher._pending.values())
+                return results, get_cache.return_value.search
+
+        results, search = async_to_sync(run)()
+
+        self.assertEqual(results, [True, False, False])
+        search.assert_awaited_once_with(provider, "Matrix", 2)
+
+    def test_failures_are_swallowed(self):
+        async def run():
+            prefetcher = Prefetcher()
+            prefetcher.schedule("boom", AsyncMock(side_effect=RuntimeError("boom")))
+            await asyncio.gather(*prefetcher._pending.values())
+
+        async_to_sync(run)()
+
+
+class SearchPagePrefetchTests(TestCase):
+    @patch("providers.search_engine.get_prefetcher")
+    @patch("providers.search_engine.get_search_cache")
+    def test_full_page_prefetches_next_page(self, get_cache, get_prefetcher):
+        full = MagicMock()
+        full.name = "full"
+        short = MagicMock()
+        short.name = "short"
+
+        async def search(provider, query, page):
+            count = SEARCH_PAGE_SIZE if provider is full else 3
+            return [
+                {
+                    "provider": provider.name,
+                    "stream_id": str(index),
+                    "media_type": "movie",
+                    "title": f"{provider.name} {index}",
+                    "poster": None,
+                    "release_year": 2020,
+                }
+                for index in range(count)
+            ]
+
+        get_cache.return_value.search = search
+
+        async_to_sync(search_providers)("matrix", 1, providers=[full, short])
+
+        get_prefetcher.return_value.prefetch_search_page.assert_called_once_with(full, "matrix", 2)
@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+
+from providers.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    LatencyTracker,
+    ProviderGuard,
+    ProviderUnavailable,
+)
+
+
+def _upstream_error():
+    request = httpx.Request("GET", "https://tmdb.test/3/search/multi")
+    return httpx.HTTPStatusError("boom", request=request, response=httpx.Response(503, request=request))
+
+
+class LatencyTrackerTests(TestCase):
+    def test_quantile_needs_enough_samples(self):
+        tracker = LatencyTracker()
+        for index in range(1, 11):
+            tracker.record(index / 100)
+        self.assertIsNone(tracker.quantile(0.95))
+
+        for index in range(11, 101):
+            tracker.record(index / 100)
+        self.assertAlmostEqual(tracker.quantile(0.95), 0.95)
+
+
+@override_settings(PROVIDER_BREAKER_FAILURES=2, PROVIDER_BREAKER_RESET_SECONDS=30)
+class CircuitBreakerTests(TestCase):
+    def test_opens_then_half_open_probe_closes(self):
+        breaker = CircuitBreaker("vidking")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow())
+
+        with patch("providers.resilience.time.monotonic", return_value=breaker.opened_at + 31):
+            self.assertTrue(breaker.allow())
+            self.assertEqual(breaker.state, HALF_OPEN)
+            self.assertFalse(breaker.allow())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow())
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("vidking")
+        breaker.record_failure()
+        breaker.record_failure()
+
+        with patch("providers.resilience.time.monotonic", return_value=breaker.opened_at + 31):
+            self.assertTrue(breaker.allow())
+            breaker.record_failure()
+
+        self.assertEqual(breaker.state, OPEN)
+
+    def test_transitions_are_counted(self):
+        breaker = CircuitBreaker("metrics-test")
+        with patch("providers.resilience.PROVIDER_CIRCUIT_TRANSITIONS") as transitions:
+            breaker.record_failure()
+            breaker.record_failure()
+
+        transitions.labels.assert_called_once_with(provider="metrics-test", state=OPEN)
+
+
+@override_settings(PROVIDER_HEDGE_MIN_SECONDS=0.01, PROVIDER_HEDGE_MAX_SECONDS=0.02)
+class ProviderGuardTests(TestCase):
+    def test_slow_primary_is_hedged(self):
+        calls = []
+
+        async def search(query):
+            calls.append(query)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+                return ["slow"]
+            return ["fast"]
+
+        guard = ProviderGuard("vidking")
+        result = async_to_sync(guard.call)(search, "matrix")
+
+        self.assertEqual(result, ["fast"])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(guard.breaker.state, CLOSED)
+
+    def test_fast_primary_is_not_hedged(self):
+        calls = []
+
+        async def search(query):
+            calls.append(query)
+            return ["ok"]
+
+        guard = ProviderGuard("vidking")
+        self.assertEqual(async_to_sync(guard.call)(search, "matrix"), ["ok"])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(guard.latency.samples), 1)
+
+    def test_upstream_failure_retries_once(self):
+        calls = []
+
+        async def search(query):
+            calls.append(query)
+            if len(calls) == 1:
+                raise _upstream_error()
+            return ["ok"]
+
+        guard = ProviderGuard("vidking")
+        self.assertEqual(async_to_sync(guard.call)(search, "matrix"), ["ok"])
+        self.assertEqual(len(calls), 2)
+
+    def test_client_errors_do_not_trip_breaker(self):
+        async def search(query):
+            raise ValueError("TMDB_API_KEY is not configured")
+
+        guard = ProviderGuard("vidking")
+        for _ in range(10):
+            with self.assertRaises(ValueError):
+                async_to_sync(guard.call)(search, "matrix")
+
+        self.assertEqual(guard.breaker.state, CLOSED)
+
+    @override_settings(PROVIDER_BREAKER_FAILURES=2)
+    def test_open_circuit_fails_fast(self):
+        calls = []
+
+        async def search(query):
+            calls.append(query)
+            raise _upstream_error()
+
+        guard = ProviderGuard("vidking")
+        for _ in range(2):
+            with self.assertRaises(httpx.HTTPStatusError):
+                async_to_sync(guard.call)(search, "matrix")
+        attempts = len(calls)
+
+        with self.assertRaises(ProviderUnavailable) as raised:
+            async_to_sync(guard.call)(search, "matrix")
+
+        self.assertEqual(len(calls), attempts)
+        self.assertGreater(raised.exception.retry_after, 0)
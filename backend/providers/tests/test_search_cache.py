@@ -0,0 +1,169 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from common.redis_keys import search_cache_key
+from providers.resilience import ProviderUnavailable
+from providers.search_cache import SearchCache, normalize_query
+from providers.search_types import ContentSearchResult
+
+
+def _result(title="Test Movie"):
+    return ContentSearchResult(
+        provider="vidking",
+        stream_id="123",
+        media_type="movie",
+        title=title,
+        poster=None,
+        release_year=2020,
+    )
+
+
+class _Provider:
+    name = "vidking"
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.calls = []
+
+    async def search(self, query, page=1):
+        self.calls.append((query, page))
+        await asyncio.sleep(self.delay)
+        return [_result()]
+
+
+class NormalizeQueryTests(TestCase):
+    def test_case_and_whitespace_collapse(self):
+        self.assertEqual(normalize_query("  The   MATRIX\t"), "the matrix")
+        self.assertEqual(
+            search_cache_key("vidking", normalize_query("The Matrix"), 1),
+            search_cache_key("vidking", normalize_query(" the  matrix "), 1),
+        )
+
+
+@patch("providers.search_cache.release_lock", new_callable=AsyncMock)
+@patch("providers.search_cache.acquire_lock", new_callable=AsyncMock, return_value="token")
+@patch("providers.search_cache.store_search_entry", new_callable=AsyncMock)
+@patch("providers.search_cache.read_search_entry", new_callable=AsyncMock)
+class SearchCacheTests(TestCase):
+    def test_concurrent_misses_call_provider_once(self, read, store, acquire, release):
+        read.return_value = None
+        provider = _Provider(delay=0.05)
+
+        async def run():
+            cache = SearchCache()
+            return await asyncio.gather(*[
+                cache.search(provider, query, 1)
+                for query in ["Matrix", "matrix", " MATRIX ", "matrix"]
+            ])
+
+        results = async_to_sync(run)()
+
+        self.assertEqual(provider.calls, [("matrix", 1)])
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertEqual(results[0][0]["title"], "Test Movie")
+        store.assert_awaited_once()
+        acquire.assert_awaited_once()
+        release.assert_awaited_once()
+
+    def test_fresh_hit_skips_provider(self, read, store, acquire, release):
+        read.return_value = {"results": [{"title": "Cached"}], "fresh_until": time.time() + 60}
+        provider = _Provider()
+
+        results = async_to_sync(SearchCache().search)(provider, "matrix", 1)
+
+        self.assertEqual(results, [{"title": "Cached"}])
+        self.assertEqual(provider.calls, [])
+        acquire.assert_not_awaited()
+
+    def test_stale_hit_is_served_while_one_refresh_runs(self, read, store, acquire, release):
+        read.return_value = {"results": [{"title": "Stale"}], "fresh_until": time.time() - 1}
+        provider = _Provider(delay=0.01)
+
+        async def run():
+            cache = SearchCache()
+            served = await asyncio.gather(*[cache.search(provider, "matrix", 1) for _ in range(3)])
+            await asyncio.gather(*cache._inflight.values())
+            return served
+
+        served = async_to_sync(run)()
+
+        self.assertEqual(served, [[{"title": "Stale"}]] * 3)
+        self.assertEqual(provider.calls, [("matrix", 1)])
+        store.assert_awaited_once()
+
+    def test_lock_loser_waits_for_winner(self, read, store, acquire, release):
+        acquire.return_value = None
+        read.side_effect = [
+            None,
+            None,
+            {"results": [{"title": "Peer"}], "fresh_until": time.time() + 60},
+        ]
+        provider = _Provider()
+
+        results = async_to_sync(SearchCache().search)(provider, "matrix", 1)
+
+        self.assertEqual(results, [{"title": "Peer"}])
+        self.assertEqual(provider.calls, [])
+        release.assert_not_awaited()
+
+    def test_stale_refresh_skipped_when_peer_holds_lock(self, read, store, acquire, release):
+        acquire.return_value = None
+        read.return_value = {"results": [{"title": "Stale"}], "fresh_until": time.time() - 1}
+        provider = _Provider()
+
+        async def run():
+            cache = SearchCache()
+            served = await cache.search(provider, "matrix", 1)
+            await asyncio.gather(*cache._inflight.values())
+            return served
+
+        self.assertEqual(async_to_sync(run)(), [{"title": "Stale"}])
+        self.assertEqual(provider.calls, [])
+
+
+@patch("providers.search_cache.release_lock", new_callable=AsyncMock)
+@patch("providers.search_cache.acquire_lock", new_callable=AsyncMock, return_value="token")
+@patch("providers.search_cache.store_search_entry", new_callable=AsyncMock)
+@patch("providers.search_cache.read_search_entry", new_callable=AsyncMock)
+class StaleIfErrorTests(TestCase):
+    def test_expired_entry_served_when_circuit_open(self, read, store, acquire, release):
+        read.return_value = {
+            "results": [{"title": "Old"}],
+            "fresh_until": time.time() - 120,
+            "expires_at": time.time() - 60,
+        }
+        provider = _Provider()
+
+        with patch(
+            "providers.search_cache.get_provider_guard",
+            return_value=AsyncMock(call=AsyncMock(side_effect=ProviderUnavailable("vidking", 10))),
+        ):
+            results = async_to_sync(SearchCache().search)(provider, "matrix", 1)
+
+        self.assertEqual(results, [{"title": "Old"}])
+        store.assert_not_awaited()
+
+    def test_open_circuit_without_entry_raises(self, read, store, acquire, release):
+        read.return_value = None
+
+        with patch(
+            "providers.search_cache.get_provider_guard",
+            return_value=AsyncMock(call=AsyncMock(side_effect=ProviderUnavailable("vidking", 10))),
+        ):
+            with self.assertRaises(ProviderUnavailable):
+                async_to_sync(SearchCache().search)(_Provider(), "matrix", 1)
+
+    def test_expired_entry_not_served_when_provider_healthy(self, read, store, acquire, release):
+        read.return_value = {
+            "results": [{"title": "Old"}],
+            "fresh_until": time.time() - 120,
+            "expires_at": time.time() - 60,
+        }
+
+        results = async_to_sync(SearchCache().search)(_Provider(), "matrix", 1)
+
+        self.assertEqual(results[0]["title"], "Test Movie")
@@ -0,0 +1,123 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+
+from providers.resilience import ProviderUnavailable
+from providers.search_cache import get_search_cache
+from providers.search_engine import merge_results, search_providers
+from providers.search_types import ContentSearchResult
+
+
+def _result(provider, stream_id, title, year=2020, media_type="movie"):
+    return ContentSearchResult(
+        provider=provider,
+        stream_id=stream_id,
+        media_type=media_type,
+        title=title,
+        poster=None,
+        release_year=year,
+    )
+
+
+class _Provider:
+    def __init__(self, name, titles, delay=0.0, error=None):
+        self.name = name
+        self.titles = titles
+        self.delay = delay
+        self.error = error
+
+    async def search(self, query, page=1):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [_result(self.name, str(index), title) for index, title in enumerate(self.titles)]
+
+
+def _run(providers):
+    async def run():
+        try:
+            return await search_providers("matrix", 1, providers=providers)
+        finally:
+            # Let late fills finish so the loop closes cleanly
+            await asyncio.gather(*get_search_cache()._inflight.values(), return_exceptions=True)
+
+    return async_to_sync(run)()
+
+
+class MergeResultsTests(TestCase):
+    def test_interleaves_by_rank_and_dedupes(self):
+        first = [
+            {"title": "The Matrix", "media_type": "movie", "release_year": 1999, "provider": "a"},
+            {"title": "Matrix Reloaded", "media_type": "movie", "release_year": 2003, "provider": "a"},
+        ]
+        second = [
+            {"title": "the  matrix", "media_type": "movie", "release_year": 1999, "provider": "b"},
+            {"title": "The Matrix", "media_type": "tv", "release_year": 1999, "provider": "b"},
+        ]
+
+        merged = merge_results([first, second])
+
+        self.assertEqual(
+            [(item["provider"], item["title"]) for item in merged],
+            [("a", "The Matrix"), ("a", "Matrix Reloaded"), ("b", "The Matrix")],
+        )
+
+
+@override_settings(SEARCH_DEADLINE_SECONDS=0.2)
+@patch("providers.search_cache.release_lock", new_callable=AsyncMock)
+@patch("providers.search_cache.acquire_lock", new_callable=AsyncMock, return_value="token")
+@patch("providers.search_cache.store_search_entry", new_callable=AsyncMock)
+@patch("providers.search_cache.read_search_entry", new_callable=AsyncMock, return_value=None)
+class SearchProvidersTests(TestCase):
+    def test_providers_are_queried_concurrently(self, read, store, acquire, release):
+        providers = [
+            _Provider("a", ["One"], delay=0.1),
+            _Provider("b", ["Two"], delay=0.1),
+        ]
+
+        start = time.monotonic()
+        outcome = _run(providers)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.18)
+        self.assertEqual([item["title"] for item in outcome.results], ["One", "Two"])
+        self.assertEqual(outcome.missing, [])
+        self.assertEqual(store.await_count, 2)
+
+    def test_late_provider_is_missing_but_still_cached(self, read, store, acquire, release):
+        providers = [
+            _Provider("fast", ["One"]),
+            _Provider("slow", ["Two"], delay=0.4),
+        ]
+
+        outcome = _run(providers)
+
+        self.assertEqual([item["title"] for item in outcome.results], ["One"])
+        self.assertEqual(outcome.missing, ["slow"])
+        self.assertEqual(store.await_count, 2)
+
+    def test_failed_provider_does_not_fail_search(self, read, store, acquire, release):
+        providers = [
+            _Provider("ok", ["One"]),
+            _Provider("broken", [], error=ValueError("bad key")),
+        ]
+
+        outcome = _run(providers)
+
+        self.assertEqual([item["title"] for item in outcome.results], ["One"])
+        self.assertEqual(outcome.missing, ["broken"])
+
+    def test_all_unavailable_raises_soonest_retry(self, read, store, acquire, release):
+        providers = [
+            _Provider("a", [], error=ProviderUnavailable("a", 20)),
+            _Provider("b", [], error=ProviderUnavailable("b", 5)),
+        ]
+
+        with patch("providers.resilience.ProviderGuard.call", new=lambda self, fn, *args: fn(*args)):
+            with self.assertRaises(ProviderUnavailable) as raised:
+                _run(providers)
+
+        self.assertEqual(raised.exception.provider, "b")
@@ -1,23 +1,34 @@
 import os
 
-import httpx
+from providers.http_client import get_http_client
 
 TMDB_API_KEY = os.getenv("TMDB_API_KEY")
-BASE_URL = "https://api.themoviedb.org/3"
+BASE_URL = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
 
 
 async def search_tmdb(query: str, page: int = 1) -> dict:
     if not TMDB_API_KEY:
         raise ValueError("TMDB_API_KEY is not configured")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/search/multi",
-            params={
-                "api_key": TMDB_API_KEY,
-                "query": query,
-                "page": page,
-            },
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await get_http_client().get(
+        f"{BASE_URL}/search/multi",
+        params={
+            "api_key": TMDB_API_KEY,
+            "query": query,
+            "page": page,
+        },
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+async def get_tmdb_show(tv_id: str) -> dict:
+    if not TMDB_API_KEY:
+        raise ValueError("TMDB_API_KEY is not configured")
+
+    response = await get_http_client().get(
+        f"{BASE_URL}/tv/{tv_id}",
+        params={"api_key": TMDB_API_KEY},
+    )
+    response.raise_for_status()
+    return response.json()
@@ -2,7 +2,7 @@
 
 from providers.base import BaseProvider, PlaybackSource
 from providers.search_types import ContentSearchResult
-from providers.tmdb_client import search_tmdb
+from providers.tmdb_client import get_tmdb_show, search_tmdb
 
 
 VIDKING_BASE_URL = "https://www.vidking.net/embed"
@@ -51,6 +51,16 @@ def derive_vidking_embed_url(source: PlaybackSource) -> str:
 class VidkingProvider(BaseProvider):
     name = "vidking"
 
+    async def episode_counts(self, external_id: str) -> dict[int, int]:
+        data = await get_tmdb_show(external_id)
+
+        # Season 0 holds specials, which are not part of the binge order
+        return {
+            season["season_number"]: season["episode_count"]
+            for season in data.get("seasons", [])
+            if season.get("season_number", 0) > 0 and season.get("episode_count")
+        }
+
     async def search(self, query: str, page: int = 1) -> list[ContentSearchResult]:
         data = await search_tmdb(query, page)
 
@@ -0,0 +1,30 @@
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+
+from chat.services import flush_chat_streams
+from common.redis_client import close_redis_client
+
+
+class Command(BaseCommand):
+    help = "Persist queued chat messages from Redis streams into ChatMessage"
+
+    def handle(self, *args, **options):
+        async_to_sync(self._run)()
+
+    async def _run(self):
+        try:
+            await self._flush_all()
+        finally:
+            await close_redis_client()
+
+    async def _flush_all(self):
+        total = 0
+        while True:
+            processed = await flush_chat_streams()
+            if not processed:
+                break
+            total += processed
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Flushed {total} queued chat message(s)")
+        )
@@ -0,0 +1,30 @@
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+
+from common.redis_client import close_redis_client
+from rooms.services.playback import flush_playback_states
+
+
+class Command(BaseCommand):
+    help = "Persist dirty Redis playback state into RoomPlaybackState"
+
+    def handle(self, *args, **options):
+        async_to_sync(self._run)()
+
+    async def _run(self):
+        try:
+            await self._flush_all()
+        finally:
+            await close_redis_client()
+
+    async def _flush_all(self):
+        total = 0
+        while True:
+            written = await flush_playback_states()
+            if not written:
+                break
+            total += written
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Flushed playback state for {total} room(s)")
+        )
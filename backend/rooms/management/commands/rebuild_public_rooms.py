@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from rooms.services.discovery import rebuild_public_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Redis index of discoverable public rooms from the database"
+
+    def handle(self, *args, **options):
+        indexed = rebuild_public_index()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {indexed} public room(s)")
+        )
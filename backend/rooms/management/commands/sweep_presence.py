@@ -0,0 +1,23 @@
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from common.redis_client import close_redis_client
+from rooms.services.presence import sweep_stale_presence
+
+
+class Command(BaseCommand):
+    help = "Evict presence entries whose connections stopped heartbeating"
+
+    def handle(self, *args, **options):
+        async_to_sync(self._run)()
+
+    async def _run(self):
+        try:
+            evicted = await sweep_stale_presence(settings.PRESENCE_STALE_SECONDS)
+        finally:
+            await close_redis_client()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Evicted {evicted} stale connection(s)")
+        )
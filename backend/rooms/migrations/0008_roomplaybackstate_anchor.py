@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rooms", "0007_roomplaybackstate_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="roomplaybackstate",
+            name="anchored_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="roomplaybackstate",
+            name="playback_rate",
+            field=models.FloatField(default=1.0),
+        ),
+    ]
@@ -142,6 +142,9 @@ class RoomPlaybackState(models.Model):
     is_playing = models.BooleanField(default=False)
     current_time = models.FloatField(default=0.0)
     version = models.PositiveIntegerField(default=0)
+    # Server instant at which current_time was true; position advances from here while playing
+    anchored_at = models.DateTimeField(null=True, blank=True)
+    playback_rate = models.FloatField(default=1.0)
     updated_at = models.DateTimeField(auto_now=True)
 
 class RoomParticipant(models.Model):
@@ -0,0 +1,300 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from common.redis_client import get_sync_redis_client
+from common.redis_keys import (
+    public_rooms_by_created_key,
+    public_rooms_by_viewers_key,
+    public_rooms_version_key,
+    room_presence_users_key,
+    room_public_meta_key,
+)
+from providers.metadata import lookup_content
+from rooms.models import Room
+from users.models import User
+
+logger = logging.getLogger(__name__)
+
+PUBLIC_ROOMS_PAGE_SIZE = 20
+PUBLIC_ROOMS_MAX_PAGE_SIZE = 100
+PUBLIC_ROOM_SORTS = {
+    "recent": public_rooms_by_created_key,
+    "viewers": public_rooms_by_viewers_key,
+}
+PUBLIC_ROOM_FIELDS = ("code", "host", "created_at", "viewers", "video_provider", "video_id")
+PUBLIC_LISTING_CACHE_SIZE = 256
+
+# Writes the room's listing metadata and both index scores, seeding the
+# viewer count from live presence, and bumps the index version.
+INDEX_PUBLIC_ROOM_SCRIPT = """
+local viewers = redis.call('HLEN', KEYS[4])
+redis.call('HSET', KEYS[1],
+    'code', ARGV[1], 'host', ARGV[2], 'created_at', ARGV[3],
+    'created_ts', ARGV[4], 'viewers', viewers,
+    'video_provider', ARGV[6], 'video_id', ARGV[7])
+redis.call('ZADD', KEYS[2], ARGV[5], ARGV[1])
+redis.call('ZADD', KEYS[3], string.format('%.0f', viewers * 1e10 + tonumber(ARGV[4])), ARGV[1])
+redis.call('INCR', KEYS[5])
+return viewers
+"""
+
+
+def is_discoverable(room) -> bool:
+    return not room.is_private and room.is_active and room.state == Room.State.LIVE
+
+
+def index_public_room(room, host_name, client=None):
+    client = client or get_sync_redis_client()
+    script = client.register_script(INDEX_PUBLIC_ROOM_SCRIPT)
+    created = room.created_at.timestamp()
+
+    script(
+        keys=[
+            room_public_meta_key(room.code),
+            public_rooms_by_created_key(),
+            public_rooms_by_viewers_key(),
+            room_presence_users_key(room.code),
+            public_rooms_version_key(),
+        ],
+        args=[
+            room.code, host_name, room.created_at.isoformat(), int(created), created,
+            room.video_provider, room.video_id,
+        ],
+    )
+
+
+def unindex_public_rooms(room_codes, client=None):
+    if not room_codes:
+        return
+
+    client = client or get_sync_redis_client()
+    pipe = client.pipeline(transaction=False)
+    pipe.zrem(public_rooms_by_created_key(), *room_codes)
+    pipe.zrem(public_rooms_by_viewers_key(), *room_codes)
+    pipe.delete(*(room_public_meta_key(code) for code in room_codes))
+    pipe.incr(public_rooms_version_key())
+    pipe.execute()
+
+
+def sync_public_room(room):
+    """
+    Add or remove a room from the public index after a save. Best-effort:
+    a failure leaves the listing stale until the next save or rebuild.
+    """
+    try:
+        if is_discoverable(room):
+            host_name = (
+                User.objects
+                .filter(id=room.host_id)
+                .values_list("display_name", flat=True)
+                .first()
+            )
+            index_public_room(room, host_name or "")
+        else:
+            unindex_public_rooms([room.code])
+    except Exception:
+        logger.warning("Public room index update failed | room=%s", room.code, exc_info=True)
+
+
+def rebuild_public_index() -> int:
+    """
+    Rebuild the index from the database. Returns the number of rooms indexed.
+    """
+    client = get_sync_redis_client()
+    rooms = list(
+        Room.objects.filter(
+            is_private=False,
+            is_active=True,
+            state=Room.State.LIVE,
+        )
+        .only(
+            "code", "host", "created_at", "is_private", "is_active", "state",
+            "video_provider", "video_id",
+        )
+        .select_related("host")
+    )
+
+    live = {room.code for room in rooms}
+    stale = [
+        code for code in client.zrange(public_rooms_by_created_key(), 0, -1)
+        if code not in live
+    ]
+    unindex_public_rooms(stale, client)
+
+    for room in rooms:
+        index_public_room(room, room.host.display_name, client)
+
+    return len(rooms)
+
+
+def encode_cursor(score: float, room_code: str) -> str:
+    return f"{score!r}:{room_code}"
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    """
+    Raises ValueError for a malformed cursor.
+    """
+    score, sep, room_code = cursor.partition(":")
+    if not sep or not room_code:
+        raise ValueError("malformed cursor")
+    return float(score), room_code
+
+
+def list_public_rooms(sort="recent", limit=PUBLIC_ROOMS_PAGE_SIZE, cursor=None):
+    """
+    One page of discoverable rooms, highest score first.
+
+    Returns (rooms, next_cursor); next_cursor is None on the last page.
+    The cursor is the last row's (score, code), so pages stay stable while
+    rooms are added, removed or re-scored.
+    """
+    client = get_sync_redis_client()
+    key = PUBLIC_ROOM_SORTS[sort]()
+    max_score, after = cursor if cursor else ("+inf", None)
+
+    # Equal scores come back in reverse code order; skip the ones already served
+    entries = []
+    offset = 0
+    while True:
+        batch = client.zrevrangebyscore(
+            key, max_score, "-inf", start=offset, num=limit + 1, withscores=True,
+        )
+        offset += len(batch)
+        entries.extend(
+            (code, score) for code, score in batch
+            if after is None or score < max_score or code < after
+        )
+        if len(entries) > limit or len(batch) <= limit:
+            break
+
+    page = entries[:limit]
+    pipe = client.pipeline(transaction=False)
+    for code, _ in page:
+        pipe.hmget(room_public_meta_key(code), *PUBLIC_ROOM_FIELDS)
+    values = pipe.execute() if page else []
+
+    values = [row for row in values if row[0] is not None]
+    content = lookup_content((provider, video_id) for *_, provider, video_id in values)
+
+    rooms = []
+    for code, host, created_at, viewers, provider, video_id in values:
+        metadata = content.get((provider, video_id))
+        rooms.append({
+            "code": code,
+            "host": host,
+            "viewers": int(viewers or 0),
+            "created_at": created_at,
+            "video_title": metadata.title if metadata else None,
+            "video_poster": metadata.poster if metadata else None,
+        })
+
+    next_cursor = encode_cursor(page[-1][1], page[-1][0]) if len(entries) > limit else None
+    return rooms, next_cursor
+
+
+def get_index_version(client=None) -> str:
+    client = client or get_sync_redis_client()
+    return client.get(public_rooms_version_key()) or "0"
+
+
+@dataclass
+class CachedListing:
+    version: str
+    etag: str
+    body: bytes
+    next_cursor: str | None
+    checked_at: float
+
+
+class PublicListingCache:
+    """
+    Per-process micro-cache of rendered listing pages, keyed by
+    (sort, limit, cursor).
+
+    A page is served without touching Redis for `ttl` seconds. After that
+    one GET of the index version decides: unchanged content is re-armed,
+    changed content is rebuilt by a single request while concurrent
+    requests keep getting the stale copy.
+    """
+
+    def __init__(self, ttl=None, max_entries=PUBLIC_LISTING_CACHE_SIZE):
+        self.ttl = getattr(settings, "PUBLIC_ROOMS_CACHE_SECONDS", 2.0) if ttl is None else ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._building = set()
+        self._lock = threading.Lock()
+
+    def get(self, sort, limit, cursor) -> CachedListing:
+        key = (sort, limit, cursor)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None and now - entry.checked_at < self.ttl:
+            return entry
+
+        version = get_index_version()
+        if entry is not None and entry.version == version:
+            entry.checked_at = now
+            return entry
+
+        with self._lock:
+            if entry is not None and key in self._building:
+                return entry
+            self._building.add(key)
+
+        try:
+            entry = self._build(key, version, now)
+        except Exception:
+            if entry is None:
+                raise
+            logger.warning("Public listing rebuild failed; serving stale copy", exc_info=True)
+            return entry
+        finally:
+            with self._lock:
+                self._building.discard(key)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def _build(self, key, version, now) -> CachedListing:
+        sort, limit, cursor = key
+        rooms, next_cursor = list_public_rooms(sort, limit, decode_cursor(cursor) if cursor else None)
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:12]
+
+        return CachedListing(
+            version=version,
+            etag=f'W/"{version}-{digest}"',
+            body=json.dumps(rooms).encode(),
+            next_cursor=next_cursor,
+            checked_at=now,
+        )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_listing_cache = None
+
+
+def get_public_listing_cache():
+    global _listing_cache
+    if _listing_cache is None:
+        _listing_cache = PublicListingCache()
+    return _listing_cache
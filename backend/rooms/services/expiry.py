@@ -0,0 +1,78 @@
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from common.redis_room_state import clear_rooms, get_rooms_with_pending_chat
+from chat.services import flush_room_chat
+from rooms.models import Room
+from rooms.services.playback import flush_playback_states
+
+logger = logging.getLogger(__name__)
+
+
+def expire_room_if_due(room_code) -> tuple[bool, float | None]:
+    """
+    Expire a GRACE room whose deadline has passed.
+
+    Returns (expired, deadline): deadline is the room's real grace deadline
+    as a UNIX timestamp when it is still in the future, so the caller can
+    reschedule it; both are falsy when the room is no longer in grace.
+    """
+    room = Room.objects.filter(code=room_code, state=Room.State.GRACE).first()
+    if room is None or not room.host_disconnected_at:
+        return False, None
+
+    if room.grace_expired():
+        room.mark_expired()
+        return True, None
+
+    deadline = room.host_disconnected_at + timedelta(seconds=Room.GRACE_PERIOD_SECONDS)
+    return False, deadline.timestamp()
+
+
+def expire_overdue_rooms(now=None) -> list[str]:
+    """
+    Expire every GRACE room past its deadline with one conditional UPDATE.
+    Returns the codes of the rooms this call actually expired.
+    """
+    now = now or timezone.now()
+    overdue = Room.objects.filter(
+        state=Room.State.GRACE,
+        is_active=True,
+        host_disconnected_at__lte=now - timedelta(seconds=Room.GRACE_PERIOD_SECONDS),
+    )
+
+    with transaction.atomic():
+        room_ids = list(overdue.select_for_update().values_list("id", flat=True))
+        if not room_ids:
+            return []
+
+        # Re-apply the full filter so a room revived (or re-entering grace
+        # with a fresh deadline) since the read is left alone
+        overdue.filter(id__in=room_ids).update(state=Room.State.EXPIRED, is_active=False)
+
+        return list(
+            Room.objects.filter(id__in=room_ids, state=Room.State.EXPIRED)
+            .values_list("code", flat=True)
+        )
+
+
+async def clear_rooms_redis_state(room_codes: list[str]):
+    """
+    Drop finished rooms' realtime state, persisting playback and queued
+    chat first.
+    """
+    if not room_codes:
+        return
+
+    # Persist the final playback positions before dropping the hot copies
+    await flush_playback_states(room_codes)
+
+    # Write out queued chat messages before dropping the streams
+    for room_code in await get_rooms_with_pending_chat(room_codes):
+        while await flush_room_chat(room_code):
+            pass
+
+    await clear_rooms(room_codes)
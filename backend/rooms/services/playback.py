@@ -0,0 +1,135 @@
+import logging
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from channels.db import database_sync_to_async
+
+from common.redis_room_state import (
+    get_playback_state,
+    get_playback_states,
+    mark_playback_dirty,
+    pop_dirty_playback_rooms,
+    seed_playback_state,
+    update_playback_state,
+)
+from rooms.models import Room, RoomPlaybackState
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 500
+
+
+@database_sync_to_async
+def get_stored_playback_state(room_id):
+    state, _ = RoomPlaybackState.objects.get_or_create(room_id=room_id)
+    anchored_at = state.anchored_at or state.updated_at
+    return {
+        "is_playing": state.is_playing,
+        "time": state.current_time,
+        "version": state.version,
+        "anchored_at": anchored_at.timestamp(),
+        "rate": state.playback_rate,
+    }
+
+
+def persist_playback_states(states: dict[str, dict]) -> int:
+    """
+    Upsert hot-copy states into RoomPlaybackState in a single statement.
+    Rooms deleted since the state was written are skipped.
+    """
+    room_ids = {state["room_id"] for state in states.values()}
+    existing = {
+        str(room_id)
+        for room_id in Room.objects.filter(id__in=room_ids).values_list("id", flat=True)
+    }
+
+    rows = [
+        RoomPlaybackState(
+            room_id=state["room_id"],
+            is_playing=state["is_playing"],
+            current_time=state["time"],
+            version=state["version"],
+            anchored_at=datetime.fromtimestamp(state["anchored_at"], tz=dt_timezone.utc),
+            playback_rate=state["rate"],
+        )
+        for state in states.values()
+        if state["room_id"] in existing
+    ]
+
+    if rows:
+        RoomPlaybackState.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["room"],
+            update_fields=[
+                "is_playing",
+                "current_time",
+                "version",
+                "anchored_at",
+                "playback_rate",
+                "updated_at",
+            ],
+        )
+
+    return len(rows)
+
+
+async def load_playback_state(room_id, room_code):
+    """
+    Read the live playback state from Redis, seeding it from the database
+    the first time a room is touched.
+    """
+    state = await get_playback_state(room_code, room_id)
+    if state is not None:
+        return state
+
+    stored = await get_stored_playback_state(room_id)
+    return await seed_playback_state(room_code, room_id, stored)
+
+
+async def set_playback_state(room_id, room_code, is_playing, position, rate=1.0):
+    """
+    Re-anchor playback at `position` as of now and return the new state.
+    The database is updated later by flush_playback_states().
+    """
+    anchored_at = time.time()
+
+    state = await update_playback_state(
+        room_code, room_id, is_playing, position, anchored_at, rate
+    )
+    if state is not None:
+        return state
+
+    await load_playback_state(room_id, room_code)
+    return await update_playback_state(
+        room_code, room_id, is_playing, position, anchored_at, rate
+    )
+
+
+async def flush_playback_states(room_codes=None):
+    """
+    Persist hot playback state to the database.
+
+    Without room_codes, drains a batch from the dirty set (the periodic path).
+    With room_codes, writes those rooms unconditionally (lifecycle transitions).
+    """
+    drained = room_codes is None
+    if drained:
+        room_codes = await pop_dirty_playback_rooms(FLUSH_BATCH_SIZE)
+
+    if not room_codes:
+        return 0
+
+    states = await get_playback_states(room_codes)
+    if not states:
+        return 0
+
+    try:
+        written = await database_sync_to_async(persist_playback_states)(states)
+    except Exception:
+        if drained:
+            await mark_playback_dirty(list(states))
+        raise
+
+    logger.debug("Flushed playback state | rooms=%s", written)
+    return written
@@ -0,0 +1,35 @@
+import operator
+from functools import reduce
+
+from django.db.models import Q
+
+from common.redis_room_state import get_presence_rooms, sweep_presence
+from rooms.models import RoomParticipant
+
+HEARTBEAT_ROOMS_PER_STATEMENT = 200
+
+
+def persist_heartbeats(room_users: dict[str, set[str]], at) -> int:
+    """
+    Stamp RoomParticipant.last_heartbeat for every (room, user) with a live
+    connection, one UPDATE per HEARTBEAT_ROOMS_PER_STATEMENT rooms.
+    """
+    items = list(room_users.items())
+    updated = 0
+
+    for start in range(0, len(items), HEARTBEAT_ROOMS_PER_STATEMENT):
+        condition = reduce(operator.or_, (
+            Q(room_id=room_id, user_id__in=user_ids)
+            for room_id, user_ids in items[start:start + HEARTBEAT_ROOMS_PER_STATEMENT]
+        ))
+        updated += RoomParticipant.objects.filter(condition).update(last_heartbeat=at)
+
+    return updated
+
+
+async def sweep_stale_presence(stale_seconds: float) -> int:
+    """
+    Evict presence entries left behind by crashed workers in every room
+    with live connections. Returns the number of connections evicted.
+    """
+    return await sweep_presence(await get_presence_rooms(), stale_seconds)
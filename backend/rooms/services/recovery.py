@@ -1,68 +1,114 @@
 import logging
+import math
 from datetime import timedelta
 
-from asgiref.sync import async_to_sync
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
-from common.redis_client import get_redis_client
-from common.redis_keys import room_state_key
+from common.redis_client import get_sync_redis_client
+from common.redis_keys import grace_deadlines_key, room_grace_key, room_state_key
 from rooms.models import Room
+from rooms.services.discovery import unindex_public_rooms
 
 logger = logging.getLogger(__name__)
 
+RECOVERY_BATCH_SIZE = 500
 
-def recover_live_rooms():
+
+def demote_live_rooms(room_ids, now) -> list[tuple[str, str, object]]:
+    """
+    Move LIVE rooms that lost their Redis state to GRACE in one UPDATE,
+    expiring those whose host left more than a grace period ago. Rooms
+    without a disconnect time start their grace now.
+
+    Returns (code, state, host_disconnected_at) for every demoted room.
+    """
+    overdue = Q(host_disconnected_at__lte=now - timedelta(seconds=Room.GRACE_PERIOD_SECONDS))
+
+    Room.objects.filter(id__in=room_ids, state=Room.State.LIVE).update(
+        state=Case(
+            When(overdue, then=Value(Room.State.EXPIRED)),
+            default=Value(Room.State.GRACE),
+        ),
+        is_active=Case(
+            When(overdue, then=Value(False)),
+            default=F("is_active"),
+        ),
+        host_disconnected_at=Coalesce(F("host_disconnected_at"), Value(now)),
+    )
+
+    return list(
+        Room.objects
+        .filter(id__in=room_ids, state__in=[Room.State.GRACE, Room.State.EXPIRED])
+        .values_list("code", "state", "host_disconnected_at")
+    )
+
+
+def schedule_recovered_grace(redis, rooms, now):
+    """
+    Re-arm grace TTLs and expiry deadlines for demoted rooms in one pipeline,
+    so hosts can still reconnect and the grace scheduler expires the rest.
+    """
+    pipe = redis.pipeline(transaction=False)
+
+    for code, disconnected_at in rooms:
+        deadline = disconnected_at + timedelta(seconds=Room.GRACE_PERIOD_SECONDS)
+        remaining = math.ceil((deadline - now).total_seconds())
+        if remaining > 0:
+            pipe.set(room_grace_key(code), "1", ex=remaining)
+        pipe.zadd(grace_deadlines_key(), {code: deadline.timestamp()})
+
+    pipe.execute()
+
+
+def recover_live_rooms() -> dict:
     """
     Runs at server startup to reconcile DB and Redis state.
+
+    LIVE rooms are checked in batches: one pipelined EXISTS per batch, then
+    one UPDATE for every room whose Redis state is gone. Returns counts of
+    rooms checked, moved to GRACE and expired.
     """
+    redis = get_sync_redis_client()
+    now = timezone.now()
+    rooms = list(Room.objects.filter(state=Room.State.LIVE).values_list("id", "code"))
+    counts = {"checked": 0, "grace": 0, "expired": 0}
 
-    redis = get_redis_client()
-    rooms = Room.objects.filter(state=Room.State.LIVE)
+    for start in range(0, len(rooms), RECOVERY_BATCH_SIZE):
+        batch = rooms[start:start + RECOVERY_BATCH_SIZE]
 
-    for room in rooms:
-        key = room_state_key(room.code)
+        pipe = redis.pipeline(transaction=False)
+        for _, code in batch:
+            pipe.exists(room_state_key(code))
 
         try:
-            exists = async_to_sync(redis.exists)(key)
+            found = pipe.execute()
         except Exception as exc:
             logger.error(
                 "Live room recovery skipped due to Redis error.",
-                extra={"room_code": room.code, "error": str(exc)},
+                extra={"rooms": len(batch), "error": str(exc)},
             )
             continue
 
-        if exists:
+        counts["checked"] += len(batch)
+        missing = [room_id for (room_id, _), exists in zip(batch, found) if not exists]
+        if not missing:
             continue
 
-        now = timezone.now()
-
-        if room.host_disconnected_at:
-            grace_deadline = room.host_disconnected_at + timedelta(
-                seconds=Room.GRACE_PERIOD_SECONDS
-            )
+        demoted = demote_live_rooms(missing, now)
+        unindex_public_rooms([code for code, _, _ in demoted], redis)
+        grace = [(code, disconnected_at) for code, state, disconnected_at in demoted if state == Room.State.GRACE]
+        counts["grace"] += len(grace)
+        counts["expired"] += len(demoted) - len(grace)
 
-            room.state = Room.State.GRACE
-            room.save(update_fields=["state"])
-
-            if now >= grace_deadline:
-                room.mark_expired()
-                logger.warning(
-                    "Live room missing Redis state; grace expired. Marked EXPIRED.",
-                    extra={"room_code": room.code},
-                )
-                continue
-
-            logger.warning(
-                "Live room missing Redis state. Moving to GRACE.",
-                extra={"room_code": room.code},
-            )
-            continue
-
-        room.state = Room.State.GRACE
-        room.host_disconnected_at = now
-        room.save(update_fields=["state", "host_disconnected_at"])
+        if grace:
+            schedule_recovered_grace(redis, grace, now)
 
+    if counts["grace"] or counts["expired"]:
         logger.warning(
-            "Live room missing Redis state. Moving to GRACE.",
-            extra={"room_code": room.code},
+            "Live rooms missing Redis state. Moved to GRACE or EXPIRED.",
+            extra=counts,
         )
+
+    return counts
@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from rooms.models import Room
+from rooms.services.discovery import sync_public_room
+
+
+@receiver(post_save, sender=Room)
+def room_saved(sender, instance, created, **kwargs):
+    # New rooms start CREATED and are not discoverable yet
+    if created:
+        return
+
+    transaction.on_commit(lambda: sync_public_room(instance))
@@ -0,0 +1,91 @@
+from unittest.mock import AsyncMock, patch
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from rooms.models import Room
+from users.models import User
+
+UPCOMING = {
+    "provider": "vidking",
+    "media_type": "tv",
+    "external_id": "119051",
+    "season": 1,
+    "episode": 3,
+    "embed_url": "https://www.vidking.net/embed/tv/119051/1/3",
+}
+
+
+@patch("rooms.views.schedule_next_episode", new_callable=AsyncMock)
+class NextEpisodeTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com",
+            password="pass",
+            display_name="User",
+        )
+
+        self.room = Room.objects.create(
+            code="EPI123",
+            host=self.user,
+            video_provider="vidking",
+            video_id="119051",
+        )
+
+        self.client = APIClient()
+        token = AccessToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    @patch("rooms.views.resolve_next_episode", new_callable=AsyncMock, return_value=UPCOMING)
+    def test_returns_next_episode_and_prefetches_the_one_after(self, mock_resolve, mock_schedule):
+        res = self.client.get(
+            "/api/rooms/next-episode/?provider=vidking&media_id=119051&season=1&episode=2"
+        )
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["embed_url"], UPCOMING["embed_url"])
+        mock_resolve.assert_awaited_once_with("vidking", "119051", 1, 2)
+        mock_schedule.assert_awaited_once_with("vidking", "119051", 1, 3)
+
+    @patch("rooms.views.resolve_next_episode", new_callable=AsyncMock, return_value=None)
+    def test_series_end_returns_no_content(self, mock_resolve, mock_schedule):
+        res = self.client.get(
+            "/api/rooms/next-episode/?provider=vidking&media_id=119051&season=4&episode=9"
+        )
+
+        self.assertEqual(res.status_code, 204)
+        mock_schedule.assert_not_awaited()
+
+    def test_invalid_params(self, mock_schedule):
+        res = self.client.get("/api/rooms/next-episode/?provider=nope&media_id=1&season=1&episode=1")
+        self.assertEqual(res.status_code, 400)
+
+        res = self.client.get("/api/rooms/next-episode/?provider=vidking&media_id=1&season=x&episode=1")
+        self.assertEqual(res.status_code, 400)
+
+    def test_saving_tv_progress_prefetches_next_episode(self, mock_schedule):
+        res = self.client.post(
+            "/api/rooms/progress/save/",
+            {
+                "room_id": str(self.room.id),
+                "media_id": "119051",
+                "media_type": "tv",
+                "season": "1",
+                "episode": "2",
+                "timestamp": 30,
+            },
+            format="json",
+        )
+
+        self.assertEqual(res.status_code, 200)
+        mock_schedule.assert_awaited_once_with("vidking", "119051", 1, 2)
+
+    def test_saving_movie_progress_does_not_prefetch(self, mock_schedule):
+        self.client.post(
+            "/api/rooms/progress/save/",
+            {"room_id": str(self.room.id), "media_id": "603", "media_type": "movie"},
+            format="json",
+        )
+
+        mock_schedule.assert_not_awaited()
@@ -0,0 +1,67 @@
+import uuid
+
+from django.test import TestCase
+
+from rooms.models import Room, RoomPlaybackState
+from rooms.services.playback import persist_playback_states
+from users.models import User
+
+
+class PlaybackFlushTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(
+            email="host@test.com",
+            password="pass",
+            display_name="Host",
+        )
+
+        self.room = Room.objects.create(
+            code="FLUSH1",
+            host=self.host,
+            video_provider="x",
+            video_id="y",
+        )
+
+    def test_persist_creates_and_updates_state(self):
+        persist_playback_states({
+            self.room.code: {
+                "room_id": str(self.room.id),
+                "is_playing": True,
+                "time": 12.5,
+                "version": 3,
+                "anchored_at": 1700000000.0,
+                "rate": 1.0,
+            },
+        })
+        persist_playback_states({
+            self.room.code: {
+                "room_id": str(self.room.id),
+                "is_playing": False,
+                "time": 40.0,
+                "version": 4,
+                "anchored_at": 1700000030.0,
+                "rate": 1.5,
+            },
+        })
+
+        state = RoomPlaybackState.objects.get(room=self.room)
+        self.assertFalse(state.is_playing)
+        self.assertEqual(state.current_time, 40.0)
+        self.assertEqual(state.version, 4)
+        self.assertEqual(state.playback_rate, 1.5)
+        self.assertEqual(state.anchored_at.timestamp(), 1700000030.0)
+
+    def test_persist_skips_deleted_rooms(self):
+        written = persist_playback_states({
+            "GONE01": {
+                "room_id": str(uuid.uuid4()),
+                "is_playing": True,
+                "time": 1.0,
+                "version": 1,
+                "anchored_at": 1700000000.0,
+                "rate": 1.0,
+            },
+        })
+
+        self.assertEqual(written, 0)
+        self.assertFalse(RoomPlaybackState.objects.exists())
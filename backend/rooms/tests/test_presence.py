@@ -0,0 +1,53 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from rooms.models import Room, RoomParticipant
+from rooms.services.presence import persist_heartbeats
+from users.models import User
+
+
+class PersistHeartbeatsTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(
+            email="host@test.com",
+            password="pass",
+            display_name="Host",
+        )
+        self.viewer = User.objects.create_user(
+            email="viewer@test.com",
+            password="pass",
+            display_name="Viewer",
+        )
+        self.room = Room.objects.create(
+            code="BEAT01",
+            host=self.host,
+            video_provider="x",
+            video_id="y",
+        )
+        self.other_room = Room.objects.create(
+            code="BEAT02",
+            host=self.host,
+            video_provider="x",
+            video_id="y",
+        )
+        for room in (self.room, self.other_room):
+            for user in (self.host, self.viewer):
+                RoomParticipant.objects.get_or_create(room=room, user=user)
+
+    def test_stamps_only_live_pairs_in_one_statement(self):
+        at = timezone.now() + timedelta(minutes=5)
+
+        with self.assertNumQueries(1):
+            updated = persist_heartbeats(
+                {
+                    str(self.room.id): {str(self.host.id), str(self.viewer.id)},
+                    str(self.other_room.id): {str(self.viewer.id)},
+                },
+                at,
+            )
+
+        self.assertEqual(updated, 3)
+        stale = RoomParticipant.objects.get(room=self.other_room, user=self.host)
+        self.assertNotEqual(stale.last_heartbeat, at)
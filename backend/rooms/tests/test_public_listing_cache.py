@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from rooms.services.discovery import PublicListingCache, get_public_listing_cache
+
+ROOMS = [{"code": "ABC123", "host": "Host", "viewers": 2, "created_at": "2026-01-01T00:00:00+00:00"}]
+
+
+@patch("rooms.services.discovery.list_public_rooms", return_value=(ROOMS, None))
+@patch("rooms.services.discovery.get_index_version", return_value="7")
+class PublicListingCacheTests(SimpleTestCase):
+    def test_fresh_entry_skips_redis(self, mock_version, mock_list):
+        cache = PublicListingCache(ttl=60)
+
+        first = cache.get("recent", 20, None)
+        second = cache.get("recent", 20, None)
+
+        self.assertIs(first, second)
+        mock_version.assert_called_once()
+        mock_list.assert_called_once()
+
+    def test_expired_entry_with_same_version_is_reused(self, mock_version, mock_list):
+        cache = PublicListingCache(ttl=0)
+
+        first = cache.get("recent", 20, None)
+        second = cache.get("recent", 20, None)
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_version.call_count, 2)
+        mock_list.assert_called_once()
+
+    def test_version_change_rebuilds_with_new_etag(self, mock_version, mock_list):
+        cache = PublicListingCache(ttl=0)
+
+        first = cache.get("recent", 20, None)
+        mock_version.return_value = "8"
+        second = cache.get("recent", 20, None)
+
+        self.assertEqual(mock_list.call_count, 2)
+        self.assertNotEqual(first.etag, second.etag)
+
+    def test_stale_copy_served_while_another_request_rebuilds(self, mock_version, mock_list):
+        cache = PublicListingCache(ttl=0)
+        stale = cache.get("recent", 20, None)
+
+        mock_version.return_value = "8"
+        cache._building.add(("recent", 20, None))
+
+        self.assertIs(cache.get("recent", 20, None), stale)
+        mock_list.assert_called_once()
+
+    def test_stale_copy_served_when_rebuild_fails(self, mock_version, mock_list):
+        cache = PublicListingCache(ttl=0)
+        stale = cache.get("recent", 20, None)
+
+        mock_version.return_value = "8"
+        mock_list.side_effect = ConnectionError
+
+        self.assertIs(cache.get("recent", 20, None), stale)
+
+    def test_pages_are_cached_separately(self, mock_version, mock_list):
+        cache = PublicListingCache(ttl=60)
+
+        recent = cache.get("recent", 20, None)
+        viewers = cache.get("viewers", 20, None)
+
+        self.assertNotEqual(recent.etag, viewers.etag)
+        self.assertEqual(mock_list.call_count, 2)
+
+
+@patch("rooms.services.discovery.list_public_rooms", return_value=(ROOMS, "12.0:ABC123"))
+@patch("rooms.services.discovery.get_index_version", return_value="7")
+class PublicListingConditionalGetTests(TestCase):
+    def setUp(self):
+        get_public_listing_cache().clear()
+
+    def tearDown(self):
+        get_public_listing_cache().clear()
+
+    def test_unchanged_listing_returns_304(self, mock_version, mock_list):
+        res = self.client.get("/api/rooms/public/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), ROOMS)
+        self.assertEqual(res["X-Next-Cursor"], "12.0:ABC123")
+
+        res = self.client.get("/api/rooms/public/", HTTP_IF_NONE_MATCH=res["ETag"])
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res.content, b"")
+        mock_list.assert_called_once()
+
+    def test_outdated_etag_gets_full_body(self, mock_version, mock_list):
+        res = self.client.get("/api/rooms/public/", HTTP_IF_NONE_MATCH='W/"6-stale"')
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), ROOMS)
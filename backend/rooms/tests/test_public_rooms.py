@@ -1,59 +1,173 @@
+from unittest.mock import patch
+
 from asgiref.sync import async_to_sync
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from common.redis_client import get_redis_client
-from common.redis_keys import room_host_status_key, room_viewers_key
-from common.redis_room_state import host_connected, increment_viewers
+from common.redis_keys import public_rooms_by_created_key, public_rooms_by_viewers_key
+from common.redis_room_state import (
+    clear_rooms,
+    join_presence,
+    leave_presence,
+    sweep_presence,
+)
+from providers.metadata import record_search_results
 from rooms.models import Room
+from rooms.services.discovery import (
+    decode_cursor,
+    encode_cursor,
+    get_public_listing_cache,
+)
 from users.models import User
 
 
 class PublicRoomsTests(TestCase):
     def setUp(self):
+        async_to_sync(self._clear_index)()
+
+        # Tests change the index between requests; check its version every time
+        listing_cache = get_public_listing_cache()
+        listing_cache.clear()
+        ttl = patch.object(listing_cache, "ttl", 0)
+        ttl.start()
+        self.addCleanup(ttl.stop)
+
         self.host = User.objects.create_user(
             email="host@test.com",
             password="pass",
             display_name="Host",
         )
-
-        self.room = Room.objects.create(
-            code="PUB123",
-            host=self.host,
-            is_private=False,
-            video_provider="x",
-            video_id="y",
+        self.viewer = User.objects.create_user(
+            email="viewer@test.com",
+            password="pass",
+            display_name="Viewer",
         )
-        self.room.mark_live()
 
-        async_to_sync(self._clear_redis_keys)(self.room.code)
+        self.room = self.make_live_room("PUB123")
 
-        room_data = {
-            "code": self.room.code,
-            "host_id": self.host.id,
-            "is_active": True,
-        }
-        async_to_sync(host_connected)(room_data, self.host.id)
-        async_to_sync(increment_viewers)(self.room.code)
-        async_to_sync(increment_viewers)(self.room.code)
-        async_to_sync(increment_viewers)(self.room.code)
+        async_to_sync(join_presence)(self.room.code, self.host.id, "host-tab")
+        async_to_sync(join_presence)(self.room.code, self.viewer.id, "viewer-tab-1")
+        async_to_sync(join_presence)(self.room.code, self.viewer.id, "viewer-tab-2")
 
     def tearDown(self):
-        async_to_sync(self._clear_redis_keys)(self.room.code)
+        async_to_sync(self._clear_index)()
+        get_public_listing_cache().clear()
 
-    async def _clear_redis_keys(self, room_code):
+    async def _clear_index(self):
         client = get_redis_client()
-        await client.delete(room_host_status_key(room_code))
-        await client.delete(room_viewers_key(room_code))
+        codes = await client.zrange(public_rooms_by_created_key(), 0, -1)
+        await clear_rooms(list(codes) + ["PUB123"])
+        await client.delete(public_rooms_by_created_key(), public_rooms_by_viewers_key())
+
+    def make_live_room(self, code):
+        room = Room.objects.create(
+            code=code,
+            host=self.host,
+            is_private=False,
+            video_provider="x",
+            video_id="y",
+        )
+        # The index follows committed lifecycle saves
+        with self.captureOnCommitCallbacks(execute=True):
+            room.mark_live()
+        return room
 
     def test_public_room_listed(self):
         res = self.client.get("/api/rooms/public/")
         self.assertEqual(res.status_code, 200)
         self.assertEqual(len(res.json()), 1)
-        self.assertEqual(res.json()[0]["viewers"], 3)
+        self.assertEqual(res.json()[0]["code"], "PUB123")
+        self.assertEqual(res.json()[0]["host"], "Host")
+        self.assertEqual(res.json()[0]["viewers"], 2)
+        self.assertIsNone(res.json()[0]["video_title"])
+
+    def test_public_room_shows_stored_video_title(self):
+        record_search_results([{
+            "provider": "x",
+            "stream_id": "y",
+            "media_type": "movie",
+            "title": "The Matrix",
+            "poster": "https://image.test/y.jpg",
+            "release_year": 1999,
+        }])
+
+        with self.assertNumQueries(1):
+            res = self.client.get("/api/rooms/public/?sort=viewers")
+
+        self.assertEqual(res.json()[0]["video_title"], "The Matrix")
+        self.assertEqual(res.json()[0]["video_poster"], "https://image.test/y.jpg")
+
+    def test_viewer_counted_until_last_connection_leaves(self):
+        async_to_sync(leave_presence)(self.room.code, self.viewer.id, "viewer-tab-1")
+        res = self.client.get("/api/rooms/public/")
+        self.assertEqual(res.json()[0]["viewers"], 2)
+
+        async_to_sync(leave_presence)(self.room.code, self.viewer.id, "viewer-tab-2")
+        res = self.client.get("/api/rooms/public/")
+        self.assertEqual(res.json()[0]["viewers"], 1)
+
+    def test_stale_connections_swept(self):
+        evicted = async_to_sync(sweep_presence)([self.room.code], -1)
+        self.assertEqual(evicted, 3)
+
+        res = self.client.get("/api/rooms/public/")
+        self.assertEqual(res.json()[0]["viewers"], 0)
 
     def test_private_room_hidden(self):
-        self.room.is_private = True
-        self.room.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.room.is_private = True
+            self.room.save()
 
         res = self.client.get("/api/rooms/public/")
         self.assertEqual(res.json(), [])
+
+    def test_grace_room_hidden(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.room.mark_grace()
+
+        res = self.client.get("/api/rooms/public/")
+        self.assertEqual(res.json(), [])
+
+    def test_cursor_pagination_by_viewers(self):
+        quiet = [self.make_live_room(f"PUB00{index}") for index in range(3)]
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"sort": "viewers", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            res = self.client.get("/api/rooms/public/", params)
+            seen.extend(room["code"] for room in res.json())
+            cursor = res.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        self.assertEqual(seen[0], self.room.code)
+        self.assertEqual(sorted(seen[1:]), sorted(room.code for room in quiet))
+        self.assertEqual(len(seen), len(set(seen)))
+
+
+class PublicRoomsParamsTests(TestCase):
+    def test_unknown_sort_rejected(self):
+        res = self.client.get("/api/rooms/public/", {"sort": "random"})
+        self.assertEqual(res.status_code, 400)
+
+    def test_malformed_cursor_rejected(self):
+        res = self.client.get("/api/rooms/public/", {"cursor": "not-a-cursor"})
+        self.assertEqual(res.status_code, 400)
+
+    def test_pagination_headers_exposed_cross_origin(self):
+        res = self.client.get(
+            "/api/rooms/public/",
+            {"cursor": "not-a-cursor"},
+            HTTP_ORIGIN="http://localhost:3000",
+        )
+        exposed = {header.strip().lower() for header in res["Access-Control-Expose-Headers"].split(",")}
+        self.assertLessEqual({"x-next-cursor", "x-search-missing", "etag"}, exposed)
+
+
+class CursorTests(SimpleTestCase):
+    def test_round_trip(self):
+        score = 20000000001760000000.0
+        self.assertEqual(decode_cursor(encode_cursor(score, "ABC123")), (score, "ABC123"))
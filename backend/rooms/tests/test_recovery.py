@@ -0,0 +1,119 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db.models.query import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from rooms.models import Room
+from rooms.services.expiry import expire_overdue_rooms
+from rooms.services.recovery import demote_live_rooms
+from users.models import User
+
+
+class SetBasedLifecycleTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(
+            email="host@test.com",
+            password="pass",
+            display_name="Host",
+        )
+        self.now = timezone.now()
+
+    def make_room(self, code, state, disconnected_seconds_ago=None):
+        return Room.objects.create(
+            code=code,
+            host=self.host,
+            video_provider="x",
+            video_id="y",
+            state=state,
+            host_disconnected_at=(
+                None if disconnected_seconds_ago is None
+                else self.now - timedelta(seconds=disconnected_seconds_ago)
+            ),
+        )
+
+    def test_demote_splits_grace_and_expired_in_one_update(self):
+        fresh = self.make_room("REC001", Room.State.LIVE)
+        recent = self.make_room("REC002", Room.State.LIVE, 10)
+        overdue = self.make_room("REC003", Room.State.LIVE, Room.GRACE_PERIOD_SECONDS + 1)
+        untouched = self.make_room("REC004", Room.State.LIVE)
+
+        with self.assertNumQueries(2):
+            demoted = demote_live_rooms([fresh.id, recent.id, overdue.id], self.now)
+
+        self.assertEqual(
+            sorted((code, state) for code, state, _ in demoted),
+            [
+                ("REC001", Room.State.GRACE),
+                ("REC002", Room.State.GRACE),
+                ("REC003", Room.State.EXPIRED),
+            ],
+        )
+
+        fresh.refresh_from_db()
+        self.assertEqual(fresh.host_disconnected_at, self.now)
+
+        recent.refresh_from_db()
+        self.assertEqual(recent.host_disconnected_at, self.now - timedelta(seconds=10))
+        self.assertTrue(recent.is_active)
+
+        overdue.refresh_from_db()
+        self.assertFalse(overdue.is_active)
+
+        untouched.refresh_from_db()
+        self.assertEqual(untouched.state, Room.State.LIVE)
+
+    def test_expire_overdue_rooms_is_set_based(self):
+        self.make_room("EXP001", Room.State.GRACE, Room.GRACE_PERIOD_SECONDS + 1)
+        self.make_room("EXP002", Room.State.GRACE, Room.GRACE_PERIOD_SECONDS + 60)
+        self.make_room("EXP003", Room.State.GRACE, 10)
+        self.make_room("EXP004", Room.State.LIVE, Room.GRACE_PERIOD_SECONDS + 1)
+
+        # Locked read, guarded UPDATE and re-select, inside one savepoint
+        with self.assertNumQueries(5):
+            expired = expire_overdue_rooms(self.now)
+
+        self.assertEqual(sorted(expired), ["EXP001", "EXP002"])
+        self.assertEqual(
+            dict(Room.objects.values_list("code", "state")),
+            {
+                "EXP001": Room.State.EXPIRED,
+                "EXP002": Room.State.EXPIRED,
+                "EXP003": Room.State.GRACE,
+                "EXP004": Room.State.LIVE,
+            },
+        )
+
+    def test_expire_overdue_rooms_skips_rooms_revived_mid_run(self):
+        self.make_room("EXP001", Room.State.GRACE, Room.GRACE_PERIOD_SECONDS + 1)
+        self.make_room("EXP002", Room.State.GRACE, Room.GRACE_PERIOD_SECONDS + 1)
+        self.make_room("EXP003", Room.State.GRACE, Room.GRACE_PERIOD_SECONDS + 1)
+        original_update = QuerySet.update
+
+        def revive_then_update(queryset, **kwargs):
+            if kwargs.get("state") == Room.State.EXPIRED:
+                # Host reconnects to one room, and reconnects then leaves the other
+                original_update(
+                    Room.objects.filter(code="EXP001"),
+                    state=Room.State.LIVE,
+                    host_disconnected_at=None,
+                )
+                original_update(
+                    Room.objects.filter(code="EXP002"),
+                    host_disconnected_at=self.now,
+                )
+            return original_update(queryset, **kwargs)
+
+        with patch.object(QuerySet, "update", autospec=True, side_effect=revive_then_update):
+            expired = expire_overdue_rooms(self.now)
+
+        self.assertEqual(expired, ["EXP003"])
+        self.assertEqual(
+            dict(Room.objects.values_list("code", "state")),
+            {
+                "EXP001": Room.State.LIVE,
+                "EXP002": Room.State.GRACE,
+                "EXP003": Room.State.EXPIRED,
+            },
+        )
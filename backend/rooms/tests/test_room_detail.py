@@ -0,0 +1,51 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from providers.metadata import record_search_results
+from rooms.models import Room, RoomParticipant
+from users.models import User
+
+
+class RoomDetailTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com",
+            password="pass",
+            display_name="User",
+        )
+
+        self.room = Room.objects.create(
+            code="DET123",
+            host=self.user,
+            video_provider="vidking",
+            video_id="603",
+        )
+        RoomParticipant.objects.create(room=self.room, user=self.user)
+
+        self.client = APIClient()
+        token = AccessToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_includes_stored_video_metadata(self):
+        record_search_results([{
+            "provider": "vidking",
+            "stream_id": "603",
+            "media_type": "movie",
+            "title": "The Matrix",
+            "poster": "https://image.test/603.jpg",
+            "release_year": 1999,
+        }])
+
+        res = self.client.get(f"/api/rooms/{self.room.code}/detail/")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["video_title"], "The Matrix")
+        self.assertEqual(res.json()["video_poster"], "https://image.test/603.jpg")
+
+    def test_unknown_video_has_no_metadata(self):
+        res = self.client.get(f"/api/rooms/{self.room.code}/detail/")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertIsNone(res.json()["video_title"])
+        self.assertIsNone(res.json()["video_poster"])
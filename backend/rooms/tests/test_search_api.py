@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.test import TestCase
+
+from providers.resilience import ProviderUnavailable
+from providers.search_engine import SearchOutcome
+from rooms.views import search_content
+
+
+class SearchApiTests(TestCase):
+    def setUp(self):
+        # The endpoint is rate limited per IP through the default cache
+        cache.clear()
+
+    def test_query_required(self):
+        res = self.client.get("/api/rooms/search/")
+        self.assertEqual(res.status_code, 400)
+
+    def test_page_must_be_positive_integer(self):
+        self.assertEqual(self.client.get("/api/rooms/search/", {"q": "matrix", "page": "x"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/rooms/search/", {"q": "matrix", "page": 0}).status_code, 400)
+
+    @patch("rooms.views.search_providers", new_callable=AsyncMock)
+    def test_returns_merged_results_and_missing_providers(self, search_providers):
+        results = [{"title": "The Matrix", "media_type": "movie"}]
+        search_providers.return_value = SearchOutcome(results=results, missing=["tmdb"])
+
+        res = self.client.get("/api/rooms/search/", {"q": "matrix", "page": 2})
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), results)
+        self.assertEqual(res["X-Search-Missing"], "tmdb")
+        search_providers.assert_awaited_once_with("matrix", 2)
+
+    @patch("rooms.views.search_providers", new_callable=AsyncMock)
+    def test_unavailable_providers_return_503(self, search_providers):
+        search_providers.side_effect = ProviderUnavailable("vidking", 2.4)
+
+        res = self.client.get("/api/rooms/search/", {"q": "matrix"})
+
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(res["Retry-After"], "2")
+        self.assertEqual(res.json(), {"error": "Search is temporarily unavailable"})
+
+    def test_served_by_an_async_view(self):
+        # The fan-out must run on the event loop, not hold a worker thread
+        self.assertTrue(iscoroutinefunction(search_content))
+
+    def test_only_get_allowed(self):
+        self.assertEqual(self.client.post("/api/rooms/search/", {"q": "matrix"}).status_code, 405)
+
+    @patch("rooms.views.search_providers", new_callable=AsyncMock)
+    def test_rate_limited_per_ip(self, search_providers):
+        search_providers.return_value = SearchOutcome(results=[], missing=[])
+
+        for _ in range(10):
+            self.assertEqual(self.client.get("/api/rooms/search/", {"q": "matrix"}).status_code, 200)
+
+        self.assertEqual(self.client.get("/api/rooms/search/", {"q": "matrix"}).status_code, 403)
@@ -9,9 +9,11 @@ from .views import (
     room_source_view,
     public_rooms_view,
     search_content,
+    autocomplete_content,
     save_progress_view,
     get_progress_view,
     resume_progress_view,
+    next_episode_view,
 )
 
 urlpatterns = [
@@ -23,8 +25,10 @@ urlpatterns = [
     path("source/", room_source_view),
     path("progress/save/", save_progress_view),
     path("progress/get/", get_progress_view),
+    path("next-episode/", next_episode_view),
     path("<str:room_code>/detail/", room_detail_view),
     path("<str:room_code>/resume/", resume_progress_view),
     path("public/", public_rooms_view),
     path("search/", search_content),
+    path("search/autocomplete/", autocomplete_content),
 ]
@@ -1,11 +1,11 @@
-from django.http import JsonResponse
-from django.views.decorators.http import require_POST
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse, JsonResponse
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_GET, require_POST
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.csrf import csrf_exempt
 from django.shortcuts import get_object_or_404
 
-from asgiref.sync import async_to_sync
-
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -15,14 +15,23 @@ from django_ratelimit.decorators import ratelimit
 import json
 
 from .models import Room, RoomParticipant, WatchProgress
-from common.redis_client import get_redis_client
-from common.redis_keys import (
-    room_host_status_key,
-    room_viewers_key,
-)
+from common.ratelimit import async_ratelimit
+from providers.autocomplete import AUTOCOMPLETE_LIMIT, AUTOCOMPLETE_MAX_LIMIT, autocomplete
+from providers.episodes import resolve_next_episode
+from providers.metadata import lookup_content
+from providers.prefetch import schedule_next_episode
 from providers.registry import get_provider
+from providers.resilience import ProviderUnavailable
+from providers.search_engine import search_providers
 from .serializers import WatchProgressSerializer
 from .services import create_room, join_room
+from .services.discovery import (
+    PUBLIC_ROOM_SORTS,
+    PUBLIC_ROOMS_MAX_PAGE_SIZE,
+    PUBLIC_ROOMS_PAGE_SIZE,
+    decode_cursor,
+    get_public_listing_cache,
+)
 from .permissions import PermissionService
 
 @csrf_exempt
@@ -157,6 +166,10 @@ def room_detail_view(request, room_code):
     if not is_participant:
         return Response({"error": "Not a participant"}, status=403)
 
+    metadata = lookup_content([(room.video_provider, room.video_id)]).get(
+        (room.video_provider, room.video_id)
+    )
+
     return Response({
         "room_id": str(room.id),
         "code": room.code,
@@ -169,6 +182,8 @@ def room_detail_view(request, room_code):
         "host_id": str(room.host_id),
         "video_provider": room.video_provider,
         "video_id": room.video_id,
+        "video_title": metadata.title if metadata else None,
+        "video_poster": metadata.poster if metadata else None,
         "created_at": room.created_at.isoformat(),
         "is_host": room.host_id == request.user.id,
     })
@@ -287,10 +302,54 @@ def save_progress_view(request):
         },
     )
 
+    if progress.season is not None and progress.episode is not None:
+        # Warm the next episode so a binge switch needs no provider call
+        async_to_sync(schedule_next_episode)(
+            room.video_provider, progress.media_id, int(progress.season), int(progress.episode)
+        )
+
     serializer = WatchProgressSerializer(progress)
     return Response(serializer.data, status=200)
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def next_episode_view(request):
+    provider = request.query_params.get("provider")
+    media_id = request.query_params.get("media_id")
+
+    try:
+        season = int(request.query_params.get("season"))
+        episode = int(request.query_params.get("episode"))
+        get_provider(provider)
+    except (TypeError, ValueError):
+        return Response(
+            {"error": "provider, media_id, season and episode required"},
+            status=400,
+        )
+
+    if not media_id:
+        return Response({"error": "media_id required"}, status=400)
+
+    try:
+        upcoming = async_to_sync(resolve_next_episode)(provider, media_id, season, episode)
+    except ProviderUnavailable as exc:
+        return Response(
+            {"error": "Episode data is temporarily unavailable"},
+            status=503,
+            headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+        )
+
+    if upcoming is None:
+        return Response(status=204)
+
+    # Keep one episode ahead while the user binges
+    async_to_sync(schedule_next_episode)(
+        provider, media_id, upcoming["season"], upcoming["episode"]
+    )
+    return Response(upcoming)
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def get_progress_view(request):
@@ -350,70 +409,78 @@ def resume_progress_view(request, room_code):
 @ratelimit(key="ip", rate="20/m", block=True)
 @api_view(["GET"])
 def public_rooms_view(request):
-    rooms = list(
-        Room.objects.filter(
-            is_private=False,
-            is_active=True,
-            state=Room.State.LIVE,
+    sort = request.GET.get("sort", "recent")
+    if sort not in PUBLIC_ROOM_SORTS:
+        return Response(
+            {"error": f"sort must be one of: {', '.join(PUBLIC_ROOM_SORTS)}"},
+            status=400,
         )
-        .only("code", "host", "created_at")
-        .select_related("host")
-        .order_by("-created_at")
-    )
-
-    async def build_response(rooms_list):
-        client = get_redis_client()
-        response = []
 
-        for room in rooms_list:
-            host_status = await client.get(room_host_status_key(room.code))
-            if not host_status:
-                continue
-
-            host_payload = json.loads(host_status)
-            if host_payload.get("status") != "connected":
-                continue
-
-            viewers = await client.get(room_viewers_key(room.code))
-
-            response.append({
-                "code": room.code,
-                "host": room.host.display_name,
-                "viewers": int(viewers or 0),
-                "created_at": room.created_at.isoformat(),
-            })
+    try:
+        limit = int(request.GET.get("limit", PUBLIC_ROOMS_PAGE_SIZE))
+        cursor = request.GET.get("cursor") or None
+        if cursor:
+            decode_cursor(cursor)
+    except ValueError:
+        return Response({"error": "Invalid limit or cursor"}, status=400)
+
+    limit = max(1, min(limit, PUBLIC_ROOMS_MAX_PAGE_SIZE))
+    listing = get_public_listing_cache().get(sort, limit, cursor)
+
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    if "*" in etags or listing.etag in etags:
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(listing.body, content_type="application/json")
+        if listing.next_cursor:
+            response["X-Next-Cursor"] = listing.next_cursor
+
+    response["ETag"] = listing.etag
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+@ratelimit(key="ip", rate="120/m", block=True)
+@api_view(["GET"])
+def autocomplete_content(request):
+    query = (request.GET.get("q") or "").strip()
+    if not query:
+        return Response({"error": "q required"}, status=400)
 
-        return response
+    try:
+        limit = int(request.GET.get("limit", AUTOCOMPLETE_LIMIT))
+    except (TypeError, ValueError):
+        return Response({"error": "limit must be an integer"}, status=400)
 
-    data = async_to_sync(build_response)(rooms)
-    return Response(data)
+    limit = max(1, min(limit, AUTOCOMPLETE_MAX_LIMIT))
+    return Response(autocomplete(query, limit))
 
 
-@ratelimit(key="ip", rate="10/m", block=True)
-@api_view(["GET"])
+@require_GET
+@async_ratelimit(key="ip", rate="10/m")
 async def search_content(request):
+    # A plain async view: DRF does not await async views, and the provider
+    # fan-out must run on the event loop rather than hold a worker thread
     query = (request.GET.get("q") or "").strip()
     if not query:
-        return Response({"error": "q required"}, status=400)
+        return JsonResponse({"error": "q required"}, status=400)
 
     try:
         page = int(request.GET.get("page", 1))
     except (TypeError, ValueError):
-        return Response({"error": "page must be an integer"}, status=400)
+        return JsonResponse({"error": "page must be an integer"}, status=400)
 
     if page < 1:
-        return Response({"error": "page must be >= 1"}, status=400)
-
-    provider = get_provider("vidking")
-    cache_key = f"search:{provider.name}:{query}:{page}"
-    client = get_redis_client()
-
-    cached = await client.get(cache_key)
-    if cached:
-        return Response(json.loads(cached))
+        return JsonResponse({"error": "page must be >= 1"}, status=400)
 
-    results = await provider.search(query, page)
-    payload = [result.__dict__ for result in results]
+    try:
+        outcome = await search_providers(query, page)
+    except ProviderUnavailable as exc:
+        response = JsonResponse({"error": "Search is temporarily unavailable"}, status=503)
+        response["Retry-After"] = str(max(1, round(exc.retry_after)))
+        return response
 
-    await client.set(cache_key, json.dumps(payload), ex=3600)
-    return Response(payload)
+    response = JsonResponse(outcome.results, safe=False)
+    if outcome.missing:
+        response["X-Search-Missing"] = ",".join(outcome.missing)
+    return response
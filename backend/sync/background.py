@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from common.loop_local import loop_local
+from common.redis_room_state import claim_presence_sweep, refresh_presence
+from chat.services import flush_chat_streams
+from rooms.services.playback import flush_playback_states
+from rooms.services.presence import persist_heartbeats, sweep_stale_presence
+
+logger = logging.getLogger("sync.background")
+
+
+class BackgroundService(ABC):
+    """
+    Periodic task that runs while at least one WebSocket connection on the
+    current event loop holds it.
+
+    Consumers call acquire() on connect and release() on disconnect. The last
+    release stops the loop gracefully: the in-flight tick is allowed to finish
+    and one final tick runs so nothing buffered is left behind.
+    """
+
+    name = "background"
+    interval = 1.0
+
+    def __init__(self):
+        self._holders = 0
+        self._task = None
+        self._stopping = None
+
+    def acquire(self):
+        self._holders += 1
+        if self._task is None:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def release(self):
+        self._holders = max(self._holders - 1, 0)
+        if self._holders or self._task is None:
+            return
+
+        task = self._task
+        self._task = None
+        self._stopping.set()
+        await task
+
+    async def _run(self):
+        stopping = self._stopping
+
+        while not stopping.is_set():
+            try:
+                await asyncio.wait_for(stopping.wait(), timeout=self.next_delay())
+            except asyncio.TimeoutError:
+                pass
+            await self._safe_tick()
+
+    async def _safe_tick(self):
+        try:
+            await self.tick()
+        except Exception:
+            logger.exception("Background tick failed | service=%s", self.name)
+
+    def next_delay(self) -> float:
+        return self.interval
+
+    @abstractmethod
+    async def tick(self):
+        """
+        One unit of periodic work; exceptions are logged, not propagated.
+        """
+        raise NotImplementedError
+
+
+class PlaybackFlusher(BackgroundService):
+    """
+    Write-behind persistence of the Redis playback hot copy into RoomPlaybackState.
+    """
+
+    name = "playback_flusher"
+
+    def __init__(self):
+        super().__init__()
+        self.interval = getattr(settings, "PLAYBACK_FLUSH_INTERVAL_SECONDS", 2.0)
+
+    async def tick(self):
+        await flush_playback_states()
+
+
+@loop_local
+def get_playback_flusher():
+    return PlaybackFlusher()
+
+
+class ChatWriter(BackgroundService):
+    """
+    Batched persistence of queued chat messages from Redis streams into ChatMessage.
+    """
+
+    name = "chat_writer"
+
+    def __init__(self):
+        super().__init__()
+        self.interval = getattr(settings, "CHAT_FLUSH_INTERVAL_SECONDS", 1.0)
+
+    async def tick(self):
+        await flush_chat_streams()
+
+
+@loop_local
+def get_chat_writer():
+    return ChatWriter()
+
+
+class PresenceHeartbeat(BackgroundService):
+    """
+    Keeps this loop's connections alive in the Redis presence sets with one
+    pipelined heartbeat per tick, stamps RoomParticipant.last_heartbeat in
+    batches, and (on one worker per interval) sweeps entries whose worker
+    stopped heartbeating.
+    """
+
+    name = "presence_heartbeat"
+
+    def __init__(self):
+        super().__init__()
+        self.interval = getattr(settings, "PRESENCE_HEARTBEAT_SECONDS", 15.0)
+        self.stale_seconds = getattr(settings, "PRESENCE_STALE_SECONDS", 60.0)
+        self.persist_interval = getattr(settings, "PRESENCE_PERSIST_SECONDS", 60.0)
+        self._connections = {}
+        self._persisted_at = time.monotonic()
+
+    def track(self, connection_id, room_code, room_id, user_id):
+        self._connections[connection_id] = (room_code, str(room_id), str(user_id))
+        self.acquire()
+
+    async def untrack(self, connection_id):
+        if self._connections.pop(connection_id, None) is None:
+            return
+        await self.release()
+
+    async def tick(self):
+        connections = list(self._connections.items())
+
+        await refresh_presence([
+            (room_code, user_id, connection_id)
+            for connection_id, (room_code, _, user_id) in connections
+        ])
+
+        now = time.monotonic()
+        if connections and now - self._persisted_at >= self.persist_interval:
+            self._persisted_at = now
+            room_users = defaultdict(set)
+            for _, (_, room_id, user_id) in connections:
+                room_users[room_id].add(user_id)
+            await database_sync_to_async(persist_heartbeats)(room_users, timezone.now())
+
+        if await claim_presence_sweep(self.interval):
+            evicted = await sweep_stale_presence(self.stale_seconds)
+            if evicted:
+                logger.info("Swept stale presence | connections=%s", evicted)
+
+
+@loop_local
+def get_presence_heartbeat():
+    return PresenceHeartbeat()
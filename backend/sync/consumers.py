@@ -2,37 +2,73 @@
 
 import json
 import logging
+import uuid
+from time import perf_counter
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
+from django.conf import settings
+from django.db.models import OuterRef, Subquery
 from django.utils import timezone
-from chat.models import ChatMessage
+from chat.services import enqueue_chat_message, load_chat_history
 
 from rooms.models import Room, RoomParticipant
 from rooms.permissions import PermissionService
+from users.models import User
+from rooms.services.playback import (
+    flush_playback_states,
+    load_playback_state,
+    set_playback_state,
+)
 from common.redis_room_state import (
-    room_connected,
     room_disconnected,
-    host_connected,
     host_disconnected,
     update_participants,
+    get_roster,
     start_grace,
-    clear_grace,
-    is_in_grace,
-    increment_viewers,
-    decrement_viewers,
-    check_and_update_rate_limit,
-    is_duplicate_message,
-    is_user_banned,
+    CONNECT_BANNED,
+    CONNECT_GRACE_EXPIRED,
+    CONNECT_INACTIVE,
+    CONNECT_NOT_APPROVED,
+    admit_connection,
+    leave_presence,
+    CHAT_ALLOWED,
+    CHAT_BANNED,
+    CHAT_DUPLICATE,
+    CHAT_MUTED,
+    CHAT_RATE_LIMITED,
+    check_chat_admission,
     mute_user,
-    is_user_muted,
     ban_user,
 )
+from common.metrics import WS_CONNECT_SECONDS
+from sync.background import get_chat_writer, get_playback_flusher, get_presence_heartbeat
+from sync.frames import group_message
+from sync.grace import get_grace_scheduler
+from sync.join_bundle import JoinBundle, get_join_bundle_cache
+from sync.playback_clock import PlaybackAnchor
+from sync.relay import get_room_relay
+from sync.room_cache import get_room_snapshot_cache, room_snapshot
+from sync.roster import get_roster_coalescer
 
 logger = logging.getLogger("sync.ws")
 
 
 # ===== Constants (event types, close codes if any) =====
 
+CHAT_REJECTION_MESSAGES = {
+    CHAT_BANNED: "You are banned from this room",
+    CHAT_MUTED: "You are muted in this room",
+    CHAT_RATE_LIMITED: "Rate limit exceeded. Please wait.",
+    CHAT_DUPLICATE: "Duplicate message blocked.",
+}
+
+
+def user_group_name(room_code, user_id):
+    """
+    Per-user-per-room group: moderation reaches only the target's sockets.
+    """
+    return f"room_{room_code}_user_{user_id}"
+
 
 # ===== DB ACCESS HELPERS (SYNC ONLY) =====
 # All functions here:
@@ -41,94 +77,36 @@ logger = logging.getLogger("sync.ws")
 # - return primitives / dicts only
 
 @database_sync_to_async
-def get_room_snapshot(room_code):
-    try:
-        room = Room.objects.get(code=room_code)
-        return {
-            "id": room.id,
-            "code": room.code,
-            "host_id": room.host_id,
-            "is_active": room.is_active,
-            "is_chat_enabled": room.is_chat_enabled,
-            "host_disconnected_at": room.host_disconnected_at,
-            "state": room.state,
-        }
-    except Room.DoesNotExist:
-        return None
-
-
-@database_sync_to_async
-def is_approved_participant(room_id, user):
-    return RoomParticipant.objects.filter(
-        room_id=room_id,
-        user=user,
-        status=RoomParticipant.STATUS_APPROVED,
-    ).exists()
-
-
-@database_sync_to_async
-def save_message_by_room_id(room_id, user, text):
-    ChatMessage.objects.create(
-        room_id=room_id,
-        user=user,
-        message=text,
-    )
-
-    messages = (
-        ChatMessage.objects
-        .filter(room_id=room_id)
-        .order_by("-created_at")
-        .values_list("id", flat=True)[500:]
+def get_connect_context(room_code, user, cached_room=None):
+    """
+    Room snapshot plus the user's participant status in a single query.
+    With a cached snapshot only the participant status is read.
+    """
+    if cached_room is not None:
+        status = (
+            RoomParticipant.objects
+            .filter(room_id=cached_room["id"], user=user)
+            .values_list("status", flat=True)
+            .first()
+        )
+        return cached_room, status
+
+    room = (
+        Room.objects
+        .annotate(
+            participant_status=Subquery(
+                RoomParticipant.objects
+                .filter(room=OuterRef("pk"), user=user)
+                .values("status")[:1]
+            )
+        )
+        .filter(code=room_code)
+        .first()
     )
+    if room is None:
+        return None, None
 
-    if messages:
-        ChatMessage.objects.filter(id__in=list(messages)).delete()
-
-
-@database_sync_to_async
-def get_recent_messages_by_room_id(room_id, limit=50):
-    messages = (
-        ChatMessage.objects
-        .filter(room_id=room_id)
-        .select_related("user")
-        .order_by("-created_at")[:limit]
-    )
-
-    return [
-        {
-            "user": m.user.display_name,
-            "message": m.message,
-            "created_at": m.created_at.isoformat(),
-        }
-        for m in reversed(list(messages))
-    ]
-
-
-@database_sync_to_async
-def get_playback_state_by_room_id(room_id):
-    from rooms.models import RoomPlaybackState
-    state, _ = RoomPlaybackState.objects.get_or_create(room_id=room_id)
-    return {
-        "is_playing": state.is_playing,
-        "time": state.current_time,
-        "version": state.version,
-    }
-
-
-@database_sync_to_async
-def update_playback_state_by_room_id(room_id, is_playing, time):
-    from rooms.models import RoomPlaybackState
-    state, _ = RoomPlaybackState.objects.get_or_create(room_id=room_id)
-    state.is_playing = is_playing
-    state.current_time = time
-    state.version += 1
-    state.save()
-
-    return {
-        "is_playing": state.is_playing,
-        "time": state.current_time,
-        "version": state.version,
-    }
+    return room_snapshot(room), room.participant_status
 
 
 @database_sync_to_async
@@ -220,6 +198,16 @@ def mark_room_expired_by_id(room_id):
     room.mark_expired()
 
 
+@database_sync_to_async
+def get_display_name_by_user_id(user_id):
+    return (
+        User.objects
+        .filter(id=user_id)
+        .values_list("display_name", flat=True)
+        .first()
+    )
+
+
 @database_sync_to_async
 def get_participant_payload_by_room_id(room_id):
     qs = (
@@ -251,6 +239,8 @@ def get_participant_payload_by_room_id(room_id):
 # ===== CONSUMER CLASS =====
 class RoomPresenceConsumer(AsyncWebsocketConsumer):
     DRIFT_THRESHOLD_SECONDS = 2
+    MIN_PLAYBACK_RATE = 0.25
+    MAX_PLAYBACK_RATE = 4.0
 
     # --- Connection lifecycle ---
     async def connect(self):
@@ -268,8 +258,11 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
             await self.close(code=4003)
             return
 
-        # 2️⃣ Room existence
-        self.room_data = await get_room_snapshot(self.room_code)
+        connect_started = perf_counter()
+
+        # 2️⃣ Room existence + participant approval (one query, snapshot cached)
+        with WS_CONNECT_SECONDS.labels(phase="authorize").time():
+            self.room_data, participant_status = await self.load_connect_context()
         room = self.room_data
         if not room:
             logger.warning("WS reject: room not found | room=%s user_id=%s code=4002", self.room_code, self.user.id)
@@ -281,122 +274,192 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
         else:
             self.role = "participant"
 
-        if await is_user_banned(self.room_data["code"], self.user.id):
+        # 3️⃣ Redis admission: ban, inactive, grace, approval, then presence
+        # writes and join versions
+        with WS_CONNECT_SECONDS.labels(phase="admit").time():
+            admission = await admit_connection(
+                room,
+                self.user.id,
+                connection_id=self.channel_name,
+                is_host=self.user.id == room["host_id"],
+                requires_grace=room["state"] == Room.State.GRACE,
+                is_approved=participant_status == RoomParticipant.STATUS_APPROVED,
+            )
+
+        if admission["verdict"] == CONNECT_BANNED:
             logger.warning("WS reject: user banned | room=%s user_id=%s code=4010", self.room_code, self.user.id)
             await self.close(code=4010)
             return
 
-        if not room["is_active"]:
+        if admission["verdict"] == CONNECT_INACTIVE:
             logger.warning("WS reject: room inactive | room=%s state=%s user_id=%s code=4005", self.room_code, room["state"], self.user.id)
             await self.close(code=4005)
             return
 
-        if self.room_data["state"] == Room.State.GRACE:
-            if not await is_in_grace(self.room_data["code"]):
-                await mark_room_expired_by_id(self.room_data["id"])
-                logger.warning("WS reject: grace expired | room=%s user_id=%s code=4004", self.room_code, self.user.id)
-                await self.close(code=4004)
-                return
-
-        self.room_group_name = f"room_{room['code']}"
-
-        if self.user.id == self.room_data["host_id"]:
-            if await is_in_grace(self.room_data["code"]):
-                await clear_grace(self.room_data["code"])
-                await mark_room_live_by_id(self.room_data["id"])
-
-                await self.channel_layer.group_send(
-                    self.room_group_name,
-                    {"type": "host_reconnected"}
-                )
+        if admission["verdict"] == CONNECT_GRACE_EXPIRED:
+            await mark_room_expired_by_id(room["id"])
+            logger.warning("WS reject: grace expired | room=%s user_id=%s code=4004", self.room_code, self.user.id)
+            await self.close(code=4004)
+            return
 
-        # 3️⃣ Participant approval
-        is_allowed = await is_approved_participant(room["id"], self.user)
-        if not is_allowed:
+        if admission["verdict"] == CONNECT_NOT_APPROVED:
             logger.warning("WS reject: participant not approved | room=%s user_id=%s code=4003", self.room_code, self.user.id)
             await self.close(code=4003)
             return
 
-        # 4️⃣ Join room group
-        await self.channel_layer.group_add(
-            self.room_group_name,
-            self.channel_name,
-        )
-
-        await self.accept()
-        logger.info("WS accepted | room=%s user_id=%s role=%s", self.room_code, self.user.id, self.role)
-
-        await increment_viewers(self.room_data["code"])
+        self.room_group_name = f"room_{room['code']}"
+        self.user_group_name = user_group_name(room["code"], self.user.id)
 
-        await room_connected(room)
-        await host_connected(room, self.user.id)
+        if admission["host_reconnected"]:
+            await mark_room_live_by_id(room["id"])
 
-        await self.broadcast_participants()
+            await self.channel_layer.group_send(
+                self.room_group_name,
+                group_message("host_reconnected", {"type": "HOST_RECONNECTED"}),
+            )
 
-        messages = await get_recent_messages_by_room_id(room["id"])
+        # 4️⃣ Join room group
+        with WS_CONNECT_SECONDS.labels(phase="join").time():
+            await self.join_room_group()
+            await self.accept()
+
+        get_playback_flusher().acquire()
+        get_chat_writer().acquire()
+        get_presence_heartbeat().track(self.channel_name, room["code"], room["id"], self.user.id)
+        self.holds_background_services = True
+        await get_room_snapshot_cache().acquire(self.channel_layer)
+        get_grace_scheduler().ensure_started()
+        logger.info("WS accepted | room=%s user_id=%s role=%s", self.room_code, self.user.id, self.role)
 
-        await self.send(text_data=json.dumps({
-            "type": "CHAT_HISTORY",
-            "messages": messages,
-        }))
+        with WS_CONNECT_SECONDS.labels(phase="bundle").time():
+            bundle = await self.load_join_bundle(admission["join_versions"])
+            await self.join_roster(bundle)
+            await self.send(text_data=bundle.chat_frame)
 
-        state = await get_playback_state_by_room_id(room["id"])
+            # Late joiners get the position as of now, not as of the last PLAY
+            self.playback_anchor = bundle.anchor
+            await self.send(text_data=bundle.render_playback())
 
-        await self.send(text_data=json.dumps({
-            "type": "PLAYBACK_STATE",
-            "is_playing": state["is_playing"],
-            "time": state["time"],
-            "version": state["version"],
-        }))
+        WS_CONNECT_SECONDS.labels(phase="total").observe(perf_counter() - connect_started)
 
         # 5️⃣ Notify presence
         await self.channel_layer.group_send(
             self.room_group_name,
-            {
-                "type": "user_joined",
-                "user": self.user.display_name,
-                "exclude_channel": self.channel_name,
-            }
+            group_message(
+                "user_joined",
+                {"type": "USER_JOINED", "user": self.user.display_name},
+                exclude_channel=self.channel_name,
+            ),
         )
 
+        # Room events held by the relay follow the startup frames
+        if self.uses_fanout_relay():
+            await get_room_relay().ready(self.room_group_name, self)
+
     async def disconnect(self, close_code):
-        if hasattr(self, "room_group_name"):
-            if self.user.id == self.room_data["host_id"]:
-                await mark_host_disconnected_by_room_id(self.room_data["id"])
-                await mark_room_grace_by_id(self.room_data["id"])
-                await start_grace(
-                    self.room_data["code"],
-                    Room.GRACE_PERIOD_SECONDS,
-                )
+        try:
+            if hasattr(self, "room_group_name"):
+                try:
+                    if self.user.id == self.room_data["host_id"]:
+                        await mark_host_disconnected_by_room_id(self.room_data["id"])
+                        await mark_room_grace_by_id(self.room_data["id"])
+                        await flush_playback_states([self.room_data["code"]])
+                        await start_grace(
+                            self.room_data["code"],
+                            Room.GRACE_PERIOD_SECONDS,
+                        )
+
+                        await self.channel_layer.group_send(
+                            self.room_group_name,
+                            group_message(
+                                "host_disconnected",
+                                {
+                                    "type": "HOST_DISCONNECTED",
+                                    "grace_seconds": Room.GRACE_PERIOD_SECONDS,
+                                },
+                            ),
+                        )
+                    else:
+                        await self.channel_layer.group_send(
+                            self.room_group_name,
+                            group_message(
+                                "user_left",
+                                {"type": "USER_LEFT", "user": self.user.display_name},
+                            ),
+                        )
+                finally:
+                    # The relay pump is bound to this loop; stop it even when
+                    # the announcements above fail
+                    await self.leave_room_group()
+
+            if hasattr(self, "room_data"):
+                await room_disconnected(self.room_data)
+                await host_disconnected(self.room_data, self.user.id)
+                await leave_presence(self.room_data["code"], self.user.id, self.channel_name)
+        finally:
+            await self.release_background_services()
+
+    async def release_background_services(self):
+        if not getattr(self, "holds_background_services", False):
+            return
 
-                await self.channel_layer.group_send(
-                    self.room_group_name,
-                    {
-                        "type": "host_disconnected",
-                        "grace_seconds": Room.GRACE_PERIOD_SECONDS,
-                    }
-                )
-            else:
-                await self.channel_layer.group_send(
-                    self.room_group_name,
-                    {
-                        "type": "user_left",
-                        "user": self.user.display_name,
-                    }
-                )
+        self.holds_background_services = False
+        await get_room_snapshot_cache().release()
+        await get_playback_flusher().release()
+        await get_chat_writer().release()
+        await get_presence_heartbeat().untrack(self.channel_name)
+
+    async def load_connect_context(self):
+        cache = get_room_snapshot_cache()
+
+        cached = cache.get(self.room_code)
+        snapshot, participant_status = await get_connect_context(
+            self.room_code,
+            self.user,
+            cached,
+        )
+        # Without a listener on this loop a cached copy could miss invalidations
+        if cached is None and snapshot is not None and cache.listening:
+            cache.put(self.room_code, snapshot)
+
+        return snapshot, participant_status
+
+    # --- Room group membership ---
+    @staticmethod
+    def uses_fanout_relay():
+        return getattr(settings, "ROOM_FANOUT_RELAY", True)
+
+    async def join_room_group(self):
+        # Moderation targets this connection directly, never through the relay
+        await self.channel_layer.group_add(self.user_group_name, self.channel_name)
+
+        if self.uses_fanout_relay():
+            await get_room_relay().join(self.room_group_name, self)
+            return
+
+        await self.channel_layer.group_add(
+            self.room_group_name,
+            self.channel_name,
+        )
 
+    async def leave_room_group(self):
+        # Relay first: its pump must stop even if Redis rejects the discards
+        if self.uses_fanout_relay():
+            await get_room_relay().leave(self.room_group_name, self)
+        else:
             await self.channel_layer.group_discard(
                 self.room_group_name,
                 self.channel_name,
             )
 
-        if hasattr(self, "room_data"):
-            await room_disconnected(self.room_data)
-            await host_disconnected(self.room_data, self.user.id)
-            await decrement_viewers(self.room_data["code"])
+        await self.channel_layer.group_discard(self.user_group_name, self.channel_name)
 
     # --- Incoming message router ---
     async def receive(self, text_data):
+        # A ban closes the socket; drop anything that races the close
+        if getattr(self, "is_banned", False):
+            return
+
         try:
             data = json.loads(text_data)
         except json.JSONDecodeError:
@@ -429,39 +492,32 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
                 await self.send_error("Message too long.")
                 return
 
-            blocked = await check_and_update_rate_limit(
+            verdict = await check_chat_admission(
                 self.room_data["code"],
                 self.user.id,
+                message_text,
             )
-            if blocked:
-                await self.send_error("Rate limit exceeded. Please wait.")
+            if verdict != CHAT_ALLOWED:
+                await self.send_error(CHAT_REJECTION_MESSAGES[verdict])
                 return
 
-            duplicate = await is_duplicate_message(
+            await enqueue_chat_message(
+                self.room_data["id"],
                 self.room_data["code"],
-                self.user.id,
+                self.user,
                 message_text,
             )
-            if duplicate:
-                await self.send_error("Duplicate message blocked.")
-                return
-
-            if await is_user_muted(self.room_data["code"], self.user.id):
-                await self.send_error("You are muted in this room")
-                return
-
-            await save_message_by_room_id(self.room_data["id"], self.user, message_text)
 
             await self.channel_layer.group_send(
                 self.room_group_name,
-                {
-                    "type": "room_event",
-                    "event": {
+                group_message(
+                    "room_event",
+                    {
                         "type": "CHAT_MESSAGE",
                         "user": self.user.display_name,
                         "message": message_text,
                     },
-                }
+                ),
             )
             return
 
@@ -475,8 +531,9 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
                 }))
                 return
 
-            target_user_id = data.get("user_id")
-            if not target_user_id:
+            try:
+                target_user_id = str(uuid.UUID(str(data.get("user_id"))))
+            except ValueError:
                 return
 
             if event_type == "MUTE_USER":
@@ -485,21 +542,19 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
             if event_type == "BAN_USER":
                 await ban_user(self.room_data["code"], target_user_id)
 
+                banned_name = await get_display_name_by_user_id(target_user_id)
+                if banned_name:
+                    get_roster_coalescer().remove(self, self.room_data["code"], banned_name)
+
                 await self.channel_layer.group_send(
-                    self.room_group_name,
-                    {
-                        "type": "force_disconnect",
-                        "user_id": str(target_user_id),
-                    }
+                    user_group_name(self.room_data["code"], target_user_id),
+                    {"type": "force_disconnect", "banned": True},
                 )
 
             if event_type == "KICK_USER":
                 await self.channel_layer.group_send(
-                    self.room_group_name,
-                    {
-                        "type": "force_disconnect",
-                        "user_id": str(target_user_id),
-                    }
+                    user_group_name(self.room_data["code"], target_user_id),
+                    {"type": "force_disconnect", "banned": False},
                 )
 
             return
@@ -515,12 +570,23 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
                 return
 
             is_playing = event_type == "PLAY"
-            time = data.get("time", 0)
+            try:
+                time = float(data.get("time", 0))
+                rate = float(data.get("rate", 1.0))
+            except (TypeError, ValueError):
+                await self.send_error("Invalid playback time.")
+                return
+
+            if not self.MIN_PLAYBACK_RATE <= rate <= self.MAX_PLAYBACK_RATE:
+                await self.send_error("Invalid playback rate.")
+                return
 
-            new_state = await update_playback_state_by_room_id(
+            new_state = await set_playback_state(
                 self.room_data["id"],
+                self.room_data["code"],
                 is_playing,
                 time,
+                rate,
             )
             await update_host_watch_progress_by_room_id(
                 self.room_data["id"],
@@ -528,17 +594,13 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
                 time,
             )
 
+            anchor = PlaybackAnchor.from_state(new_state)
+            playback_event = anchor.to_event(now=anchor.anchored_at)
+
+            # Receivers also need the decoded anchor to answer SYNC_CHECK locally
             await self.channel_layer.group_send(
                 self.room_group_name,
-                {
-                    "type": "room_event",
-                    "event": {
-                        "type": "PLAYBACK_STATE",
-                        "is_playing": new_state["is_playing"],
-                        "time": new_state["time"],
-                        "version": new_state["version"],
-                    },
-                }
+                group_message("room_event", playback_event, event=playback_event),
             )
             return
 
@@ -581,32 +643,29 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
             await self.handle_sync_check(data)
             return
 
+        # ---------------- ROSTER SYNC ----------------
+        # Clients request a full snapshot when they detect a delta version gap
+        if event_type == "ROSTER_SYNC":
+            await self.send_roster(await self.load_roster())
+            return
+
     # --- Event handlers ---
+    # Group messages carry a pre-encoded `frame` (see sync.frames); handlers
+    # forward it as-is so a broadcast is serialized once, not once per viewer.
     async def user_joined(self, event):
         if event.get("exclude_channel") == self.channel_name:
             return
 
-        await self.send(text_data=json.dumps({
-            "type": "USER_JOINED",
-            "user": event["user"],
-        }))
+        await self.send(text_data=event["frame"])
 
     async def user_left(self, event):
-        await self.send(text_data=json.dumps({
-            "type": "USER_LEFT",
-            "user": event["user"],
-        }))
+        await self.send(text_data=event["frame"])
 
     async def host_disconnected(self, event):
-        await self.send(text_data=json.dumps({
-            "type": "HOST_DISCONNECTED",
-            "grace_seconds": event["grace_seconds"],
-        }))
+        await self.send(text_data=event["frame"])
 
     async def host_reconnected(self, event):
-        await self.send(text_data=json.dumps({
-            "type": "HOST_RECONNECTED"
-        }))
+        await self.send(text_data=event["frame"])
 
     async def room_deleted(self, event):
         await self.send(text_data=json.dumps({
@@ -614,36 +673,92 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
         }))
         await self.close()
 
+    async def room_expired(self, event):
+        await self.send(text_data=event["frame"])
+        await self.close(code=4004)
+
     async def force_disconnect(self, event):
-        if str(self.user.id) == event.get("user_id"):
-            await self.close(code=4011)
+        # Delivered only to the target's per-user group
+        if event.get("banned"):
+            self.is_banned = True
+        await self.close(code=4011)
 
     async def room_event(self, event):
         """
         Send room events to WebSocket
         """
-        await self.send(text_data=json.dumps(event["event"]))
+        payload = event.get("event")
+        if payload and payload.get("type") == "PLAYBACK_STATE":
+            self.track_playback_anchor(payload)
+
+        await self.send(text_data=event["frame"])
+
+    async def room_updated(self, event):
+        # Room saved elsewhere (chat toggle, lifecycle transition); refresh in place
+        self.room_data.update(event["room"])
 
     async def room_participants(self, event):
+        await self.send(text_data=event["frame"])
+
+    async def load_roster(self):
+        roster = await get_roster(self.room_data["code"])
+        if roster is not None:
+            return roster
+
+        payload = await get_participant_payload_by_room_id(self.room_data["id"])
+        version = await update_participants(
+            self.room_data["code"],
+            payload["participants"],
+            payload["host"],
+        )
+        return {
+            "participants": sorted(payload["participants"]),
+            "host": payload["host"],
+            "version": version,
+        }
+
+    async def send_roster(self, roster):
         await self.send(text_data=json.dumps({
             "type": "ROOM_PARTICIPANTS",
-            "participants": event["participants"],
-            "host": event["host"],
+            **roster,
         }))
 
-    async def broadcast_participants(self):
-        payload = await get_participant_payload_by_room_id(self.room_data["id"])
+    async def load_join_bundle(self, key):
+        """
+        Join bundle for the versions the admission script just read.
+        """
+        room_id = self.room_data["id"]
+        room_code = self.room_data["code"]
 
-        await update_participants(self.room_data["code"], payload["participants"])
+        async def build():
+            roster = await self.load_roster()
+            messages = await load_chat_history(room_id, room_code)
+            state = await load_playback_state(room_id, room_code)
+            return JoinBundle.build(key, roster, messages, state)
 
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                "type": "room_participants",
-                "participants": payload["participants"],
-                "host": payload["host"],
-            }
-        )
+        return await get_join_bundle_cache().get_or_build(room_code, key, build)
+
+    async def join_roster(self, bundle):
+        """
+        Snapshot to the joiner only; everyone else hears about a newcomer
+        through the next coalesced delta.
+        """
+        name = self.user.display_name
+        if name in bundle.roster["participants"]:
+            await self.send(text_data=bundle.roster_frame)
+            return
+
+        get_roster_coalescer().add(self, self.room_data["code"], name)
+        await self.send_roster({
+            **bundle.roster,
+            "participants": sorted([*bundle.roster["participants"], name]),
+        })
+
+    def track_playback_anchor(self, payload):
+        anchor = PlaybackAnchor.from_event(payload)
+        current = getattr(self, "playback_anchor", None)
+        if current is None or anchor.version >= current.version:
+            self.playback_anchor = anchor
 
     async def send_error(self, message):
         await self.send(text_data=json.dumps({
@@ -661,16 +776,17 @@ class RoomPresenceConsumer(AsyncWebsocketConsumer):
         except (TypeError, ValueError):
             return
 
-        state = await get_playback_state_by_room_id(self.room_data["id"])
-        if not state:
+        # Expected position comes from the in-memory anchor; no I/O per probe
+        anchor = getattr(self, "playback_anchor", None)
+        if anchor is None:
             return
 
-        server_time = state.get("time", 0)
+        server_time = anchor.position_at()
         drift = abs(server_time - client_time)
 
         if drift > self.DRIFT_THRESHOLD_SECONDS:
             await self.send(text_data=json.dumps({
                 "type": "SYNC_CORRECTION",
                 "time": server_time,
-                "version": state.get("version", 0),
+                "version": anchor.version,
             }))
@@ -9,6 +9,11 @@ class WSEvents:
     CHAT_MESSAGE = "CHAT_MESSAGE"
     CHAT_HISTORY = "CHAT_HISTORY"
 
+    # Roster
+    ROOM_PARTICIPANTS = "ROOM_PARTICIPANTS"
+    ROOM_PARTICIPANTS_DELTA = "ROOM_PARTICIPANTS_DELTA"
+    ROSTER_SYNC = "ROSTER_SYNC"
+
     # Moderation
     MUTE_USER = "MUTE_USER"
     BAN_USER = "BAN_USER"
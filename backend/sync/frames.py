@@ -0,0 +1,22 @@
+import json
+
+
+def encode_frame(payload: dict) -> str:
+    """
+    Serialize a WebSocket payload exactly as clients receive it.
+    """
+    return json.dumps(payload)
+
+
+def group_message(handler: str, payload: dict, **extra) -> dict:
+    """
+    Build a channel-layer message that carries a pre-encoded frame.
+
+    The sender serializes once; every receiving consumer forwards `frame`
+    verbatim instead of re-running json.dumps per connection.
+    """
+    return {
+        "type": handler,
+        "frame": encode_frame(payload),
+        **extra,
+    }
@@ -0,0 +1,100 @@
+import logging
+import time
+
+from channels.db import database_sync_to_async
+from channels.layers import get_channel_layer
+from django.conf import settings
+
+from common.loop_local import loop_local
+from common.redis_room_state import (
+    claim_due_graces,
+    release_grace_claim,
+    schedule_grace_expiry,
+)
+from rooms.services.expiry import clear_rooms_redis_state, expire_room_if_due
+from sync.background import BackgroundService
+from sync.frames import group_message
+
+logger = logging.getLogger("sync.grace")
+
+GRACE_CLAIM_BATCH_SIZE = 100
+GRACE_CLAIM_LEASE_SECONDS = 60
+
+
+async def expire_room(room_code: str, lease: float):
+    expired, deadline = await database_sync_to_async(expire_room_if_due)(room_code)
+
+    if deadline is not None:
+        # Redis deadline ran ahead of the DB (clock skew, re-disconnect)
+        await schedule_grace_expiry(room_code, deadline)
+        return
+
+    if expired:
+        await get_channel_layer().group_send(
+            f"room_{room_code}",
+            group_message("room_expired", {"type": "ROOM_EXPIRED"}),
+        )
+        await clear_rooms_redis_state([room_code])
+        logger.info("Room expired | room=%s", room_code)
+
+    await release_grace_claim(room_code, lease)
+
+
+async def expire_due_rooms() -> float | None:
+    """
+    Expire every room whose grace deadline has passed. Returns the next
+    pending deadline (UNIX timestamp) or None.
+    """
+    while True:
+        room_codes, lease, next_deadline = await claim_due_graces(
+            GRACE_CLAIM_BATCH_SIZE,
+            GRACE_CLAIM_LEASE_SECONDS,
+        )
+
+        for room_code in room_codes:
+            try:
+                await expire_room(room_code, lease)
+            except Exception:
+                # The lease lapses and another tick retries the room
+                logger.exception("Grace expiry failed | room=%s", room_code)
+
+        if len(room_codes) < GRACE_CLAIM_BATCH_SIZE:
+            return next_deadline
+
+
+class GraceScheduler(BackgroundService):
+    """
+    Expires rooms at their host grace deadline from the shared
+    `grace:deadlines` set.
+
+    Sleeps until the earliest deadline, polling at least every
+    GRACE_SCHEDULER_MAX_SLEEP_SECONDS so deadlines set by other workers are
+    seen. Claims are atomic, so exactly one worker expires each room. Once
+    started it runs for the life of the event loop: grace begins precisely
+    when the host's last connection goes away.
+    """
+
+    name = "grace_scheduler"
+
+    def __init__(self):
+        super().__init__()
+        self.interval = getattr(settings, "GRACE_SCHEDULER_MAX_SLEEP_SECONDS", 1.0)
+        self._next_deadline = None
+
+    def ensure_started(self):
+        if self._task is None:
+            self.acquire()
+
+    def next_delay(self) -> float:
+        if self._next_deadline is None:
+            return self.interval
+        return min(self.interval, max(self._next_deadline - time.time(), 0.0))
+
+    async def tick(self):
+        self._next_deadline = None
+        self._next_deadline = await expire_due_rooms()
+
+
+@loop_local
+def get_grace_scheduler():
+    return GraceScheduler()
@@ -0,0 +1,113 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from common.loop_local import loop_local
+from sync.frames import encode_frame
+from sync.playback_clock import PlaybackAnchor
+
+
+@dataclass(frozen=True)
+class JoinBundle:
+    """
+    Everything a joiner receives on connect, pre-encoded.
+
+    Keyed by (room_id, chat version, playback version, roster version): any
+    chat message, playback change or roster delta produces a new key, so a
+    cached bundle is never served after the room moved on.
+    """
+
+    key: tuple | None
+    roster: dict
+    roster_frame: str
+    chat_frame: str
+    anchor: PlaybackAnchor
+    # Paused playback is time-independent and shared; a playing position is
+    # rendered per joiner so late joiners land where the room is now.
+    playback_frame: str | None
+    built_at: float
+
+    @classmethod
+    def build(cls, key, roster: dict, messages: list[dict], playback_state: dict) -> "JoinBundle":
+        anchor = PlaybackAnchor.from_state(playback_state)
+        return cls(
+            key=key,
+            roster=roster,
+            roster_frame=encode_frame({"type": "ROOM_PARTICIPANTS", **roster}),
+            chat_frame=encode_frame({"type": "CHAT_HISTORY", "messages": messages}),
+            anchor=anchor,
+            playback_frame=None if anchor.is_playing else encode_frame(anchor.to_event()),
+            built_at=time.monotonic(),
+        )
+
+    def render_playback(self) -> str:
+        return self.playback_frame or encode_frame(self.anchor.to_event())
+
+
+class JoinBundleCache:
+    """
+    Per-event-loop cache of the latest join bundle for each room.
+
+    Concurrent joiners that miss on the same key share one build, so a
+    premiere join storm costs one history/playback/roster load per worker.
+    """
+
+    def __init__(self, max_rooms=1024):
+        self.max_rooms = max_rooms
+        self.max_age = getattr(settings, "JOIN_BUNDLE_TTL_SECONDS", 30)
+        self._bundles: OrderedDict[str, JoinBundle] = OrderedDict()
+        self._building: dict[tuple, asyncio.Future] = {}
+
+    def get(self, room_code: str, key: tuple) -> JoinBundle | None:
+        bundle = self._bundles.get(room_code)
+        if bundle is None or bundle.key != key:
+            return None
+        if time.monotonic() - bundle.built_at > self.max_age:
+            return None
+
+        self._bundles.move_to_end(room_code)
+        return bundle
+
+    def put(self, room_code: str, bundle: JoinBundle):
+        self._bundles[room_code] = bundle
+        self._bundles.move_to_end(room_code)
+        while len(self._bundles) > self.max_rooms:
+            self._bundles.popitem(last=False)
+
+    def discard(self, room_code: str):
+        self._bundles.pop(room_code, None)
+
+    async def get_or_build(self, room_code: str, key: tuple | None, build) -> JoinBundle:
+        """
+        `build` is an async callable returning a JoinBundle for `key`.
+        A None key (room state not hot yet) always builds and is not cached.
+        """
+        if key is None:
+            return await build()
+
+        bundle = self.get(room_code, key)
+        if bundle is not None:
+            return bundle
+
+        pending = self._building.get((room_code, key))
+        if pending is None:
+            pending = asyncio.get_running_loop().create_task(build())
+            self._building[(room_code, key)] = pending
+
+            def _store(task, build_key=(room_code, key)):
+                self._building.pop(build_key, None)
+                if not task.cancelled() and task.exception() is None:
+                    self.put(room_code, task.result())
+
+            pending.add_done_callback(_store)
+
+        # Shielded so one joiner disconnecting does not cancel the shared build
+        return await asyncio.shield(pending)
+
+
+@loop_local
+def get_join_bundle_cache():
+    return JoinBundleCache()
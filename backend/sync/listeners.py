@@ -0,0 +1,38 @@
+import asyncio
+import logging
+
+logger = logging.getLogger("sync.listeners")
+
+# Sent to a listener's own channel to end its receive loop
+STOP_LISTENER = "listener.stop"
+
+STOP_TIMEOUT_SECONDS = 2.0
+
+
+async def stop_listener(channel_layer, channel_name: str, task: asyncio.Task):
+    """
+    End a channel-layer receive loop by message rather than cancellation.
+
+    channels_redis shares one per-channel lock between all process-local
+    receivers; a receive cancelled while waiting on it leaves the lock bound
+    to the current event loop, and the next loop's receivers then fail. The
+    listener returns on STOP_LISTENER, and is only cancelled if the message
+    cannot be delivered in time.
+    """
+    try:
+        await channel_layer.send(channel_name, {"type": STOP_LISTENER})
+        await asyncio.wait_for(asyncio.shield(task), STOP_TIMEOUT_SECONDS)
+        return
+    except asyncio.TimeoutError:
+        logger.warning("Listener did not stop in time | channel=%s", channel_name)
+    except Exception:
+        logger.exception("Listener stop failed | channel=%s", channel_name)
+
+    if task.done():
+        return
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -0,0 +1,64 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PlaybackAnchor:
+    """
+    Playback modelled as the media position at a known server instant.
+
+    While playing, the expected position advances at `rate` media seconds per
+    wall-clock second from `anchored_at`, so any node can answer "where should
+    the video be right now" without storing per-tick state.
+    """
+
+    is_playing: bool
+    position: float
+    anchored_at: float
+    rate: float = 1.0
+    version: int = 0
+
+    @classmethod
+    def from_state(cls, state: dict) -> "PlaybackAnchor":
+        return cls(
+            is_playing=state["is_playing"],
+            position=state["time"],
+            anchored_at=state.get("anchored_at") or time.time(),
+            rate=state.get("rate", 1.0),
+            version=state["version"],
+        )
+
+    @classmethod
+    def from_event(cls, event: dict) -> "PlaybackAnchor":
+        return cls(
+            is_playing=event["is_playing"],
+            position=event["anchor_time"],
+            anchored_at=event["anchored_at"],
+            rate=event["rate"],
+            version=event["version"],
+        )
+
+    def position_at(self, now: float | None = None) -> float:
+        if not self.is_playing:
+            return self.position
+
+        if now is None:
+            now = time.time()
+
+        elapsed = max(now - self.anchored_at, 0.0)
+        return self.position + elapsed * self.rate
+
+    def to_event(self, now: float | None = None) -> dict:
+        if now is None:
+            now = time.time()
+
+        return {
+            "type": "PLAYBACK_STATE",
+            "is_playing": self.is_playing,
+            "time": self.position_at(now),
+            "version": self.version,
+            "rate": self.rate,
+            "anchor_time": self.position,
+            "anchored_at": self.anchored_at,
+            "server_time": now,
+        }
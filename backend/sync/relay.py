@@ -0,0 +1,127 @@
+import asyncio
+import logging
+
+from common.loop_local import loop_local
+from sync.listeners import STOP_LISTENER, stop_listener
+
+logger = logging.getLogger("sync.relay")
+
+
+class _RoomSubscription:
+    def __init__(self, channel_name):
+        self.channel_name = channel_name
+        self.consumers = set()
+        # Events held for consumers still inside connect()
+        self.pending: dict = {}
+        self.task = None
+
+
+class RoomRelay:
+    """
+    Node-local fan-out for room groups.
+
+    Instead of every consumer joining the room group (one Redis push per
+    viewer per event), the worker joins once per room through its own relay
+    channel and dispatches each received event to its local consumers.
+    A group_send then costs one Redis write per worker hosting the room.
+
+    A consumer joins before it accepts, so nothing is missed while it
+    connects; events are held until it calls ready(), the way its own
+    channel would queue them until connect() returns.
+    """
+
+    def __init__(self):
+        self._rooms: dict[str, _RoomSubscription] = {}
+
+    def local_consumers(self, group_name: str) -> int:
+        subscription = self._rooms.get(group_name)
+        if subscription is None:
+            return 0
+        return len(subscription.consumers) + len(subscription.pending)
+
+    async def join(self, group_name: str, consumer):
+        layer = consumer.channel_layer
+        subscription = self._rooms.get(group_name)
+
+        if subscription is None:
+            # Default prefix: channels_redis serves every process-local channel
+            # from one shared receive, keyed by the prefix of whoever holds it
+            subscription = _RoomSubscription(await layer.new_channel())
+            self._rooms[group_name] = subscription
+            subscription.task = asyncio.get_running_loop().create_task(
+                self._pump(group_name, subscription, layer)
+            )
+
+        subscription.pending[consumer] = []
+
+        # Re-adding on every local join keeps the membership from hitting
+        # the channel layer's group_expiry in long-running rooms.
+        await layer.group_add(group_name, subscription.channel_name)
+
+    async def ready(self, group_name: str, consumer):
+        subscription = self._rooms.get(group_name)
+        if subscription is None or consumer not in subscription.pending:
+            return
+
+        held = subscription.pending[consumer]
+        while held:
+            await self._deliver(group_name, consumer, held.pop(0))
+
+        # Events arriving during the drain were appended to `held` above;
+        # a leave() meanwhile has already dropped the consumer
+        if subscription.pending.pop(consumer, None) is not None:
+            subscription.consumers.add(consumer)
+
+    async def leave(self, group_name: str, consumer):
+        subscription = self._rooms.get(group_name)
+        if subscription is None:
+            return
+
+        subscription.consumers.discard(consumer)
+        subscription.pending.pop(consumer, None)
+        if subscription.consumers or subscription.pending:
+            return
+
+        del self._rooms[group_name]
+
+        layer = consumer.channel_layer
+        # The pump must end while its loop runs; see stop_listener
+        await stop_listener(layer, subscription.channel_name, subscription.task)
+        await layer.group_discard(group_name, subscription.channel_name)
+
+    async def _pump(self, group_name, subscription, layer):
+        while True:
+            try:
+                message = await layer.receive(subscription.channel_name)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Relay receive failed | group=%s", group_name)
+                await asyncio.sleep(1)
+                continue
+
+            if message.get("type") == STOP_LISTENER:
+                return
+
+            for held in subscription.pending.values():
+                held.append(message)
+
+            consumers = list(subscription.consumers)
+            await asyncio.gather(
+                *(self._deliver(group_name, consumer, message) for consumer in consumers)
+            )
+
+    async def _deliver(self, group_name, consumer, message):
+        try:
+            await consumer.dispatch(message)
+        except Exception:
+            logger.exception(
+                "Relay delivery failed | group=%s type=%s",
+                group_name,
+                message.get("type"),
+            )
+
+
+@loop_local
+def get_room_relay():
+    return RoomRelay()
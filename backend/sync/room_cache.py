@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+
+from common.loop_local import loop_local
+from sync.listeners import STOP_LISTENER, stop_listener
+
+logger = logging.getLogger("sync.room_cache")
+
+# Every worker loop that caches snapshots listens on this group
+ROOM_SNAPSHOT_GROUP = "room_snapshots"
+
+# Fields existing connections refresh in place when a Room is saved
+LIVE_ROOM_FIELDS = ("is_active", "is_chat_enabled", "state")
+
+# Re-join well inside the channel layer's default 24h group_expiry
+GROUP_REFRESH_SECONDS = 60 * 60
+
+
+def room_snapshot(room) -> dict:
+    return {
+        "id": room.id,
+        "code": room.code,
+        "host_id": room.host_id,
+        "is_active": room.is_active,
+        "is_chat_enabled": room.is_chat_enabled,
+        "host_disconnected_at": room.host_disconnected_at,
+        "state": room.state,
+    }
+
+
+class RoomSnapshotCache:
+    """
+    Per-event-loop LRU of room snapshots used on WebSocket connect.
+
+    Entries live for ROOM_SNAPSHOT_TTL_SECONDS at most and are dropped early
+    when any process saves the Room (see publish_room_update). Invalidations
+    are only heard while a connection on the loop holds the cache, so callers
+    only store snapshots while it is listening.
+    """
+
+    def __init__(self, max_rooms=2048):
+        self.max_rooms = max_rooms
+        self.ttl = getattr(settings, "ROOM_SNAPSHOT_TTL_SECONDS", 30)
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._holders = 0
+        self._channel_layer = None
+        self._channel_name = None
+        self._task = None
+        self._subscribed_at = None
+
+    @property
+    def listening(self) -> bool:
+        return self._task is not None
+
+    def get(self, room_code: str) -> dict | None:
+        entry = self._entries.get(room_code)
+        if entry is None:
+            return None
+
+        expires_at, snapshot = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[room_code]
+            return None
+
+        self._entries.move_to_end(room_code)
+        # Consumers keep and mutate their copy; the cached one stays pristine
+        return dict(snapshot)
+
+    def put(self, room_code: str, snapshot: dict):
+        self._entries[room_code] = (time.monotonic() + self.ttl, dict(snapshot))
+        self._entries.move_to_end(room_code)
+        while len(self._entries) > self.max_rooms:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, room_code: str):
+        self._entries.pop(room_code, None)
+
+    async def acquire(self, channel_layer):
+        """
+        Hold the invalidation listener; the first holder on the loop starts it.
+        """
+        self._holders += 1
+        if self._task is None:
+            self._channel_layer = channel_layer
+            self._channel_name = await channel_layer.new_channel()
+            self._task = asyncio.get_running_loop().create_task(
+                self._pump(channel_layer)
+            )
+
+        now = time.monotonic()
+        if self._subscribed_at is None or now - self._subscribed_at >= GROUP_REFRESH_SECONDS:
+            await channel_layer.group_add(ROOM_SNAPSHOT_GROUP, self._channel_name)
+            self._subscribed_at = now
+
+    async def release(self):
+        """
+        Drop a hold; the last holder on the loop stops the listener while the
+        loop is still running (see stop_listener) and empties the cache.
+        """
+        self._holders = max(self._holders - 1, 0)
+        if self._holders or self._task is None:
+            return
+
+        task, channel_layer, channel_name = self._task, self._channel_layer, self._channel_name
+        self._task = self._channel_layer = self._channel_name = self._subscribed_at = None
+        # Nothing invalidates entries from here on
+        self._entries.clear()
+
+        await stop_listener(channel_layer, channel_name, task)
+        await channel_layer.group_discard(ROOM_SNAPSHOT_GROUP, channel_name)
+
+    async def _pump(self, channel_layer):
+        channel_name = self._channel_name
+        while True:
+            try:
+                message = await channel_layer.receive(channel_name)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Room snapshot listener receive failed")
+                await asyncio.sleep(1)
+                continue
+
+            if message.get("type") == STOP_LISTENER:
+                return
+
+            if message.get("type") == "room.invalidate":
+                self.invalidate(message["room_code"])
+
+
+@loop_local
+def get_room_snapshot_cache():
+    return RoomSnapshotCache()
+
+
+async def _publish(room_code: str, fields: dict):
+    channel_layer = get_channel_layer()
+    await channel_layer.group_send(
+        ROOM_SNAPSHOT_GROUP,
+        {"type": "room.invalidate", "room_code": room_code},
+    )
+    await channel_layer.group_send(
+        f"room_{room_code}",
+        {"type": "room_updated", "room": fields},
+    )
+
+
+def publish_room_update(room):
+    """
+    Drop cached snapshots everywhere and push live fields to connected
+    consumers. Best-effort: a failed publish only delays visibility until
+    the snapshot TTL expires.
+    """
+    fields = {field: getattr(room, field) for field in LIVE_ROOM_FIELDS}
+    try:
+        async_to_sync(_publish)(room.code, fields)
+    except Exception:
+        logger.warning("Room update publish failed | room=%s", room.code, exc_info=True)
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+
+from django.conf import settings
+
+from common.loop_local import loop_local
+from common.redis_room_state import apply_roster_delta
+from sync.frames import group_message
+
+logger = logging.getLogger("sync.roster")
+
+
+class _PendingRoster:
+    def __init__(self, channel_layer, group_name):
+        self.channel_layer = channel_layer
+        self.group_name = group_name
+        self.added = set()
+        self.removed = set()
+
+
+class RosterCoalescer:
+    """
+    Debounces roster changes per room.
+
+    Adds and removals made on this event loop within one window are applied
+    to Redis in a single script call and broadcast as one
+    ROOM_PARTICIPANTS_DELTA. A join storm therefore costs one delta per
+    window per worker instead of a full roster per connection.
+    """
+
+    def __init__(self):
+        self.window = getattr(settings, "ROSTER_COALESCE_SECONDS", 0.25)
+        self._pending: dict[str, _PendingRoster] = {}
+
+    def add(self, consumer, room_code: str, name: str):
+        pending = self._pending_for(consumer, room_code)
+        pending.removed.discard(name)
+        pending.added.add(name)
+
+    def remove(self, consumer, room_code: str, name: str):
+        pending = self._pending_for(consumer, room_code)
+        pending.added.discard(name)
+        pending.removed.add(name)
+
+    def _pending_for(self, consumer, room_code):
+        pending = self._pending.get(room_code)
+        if pending is None:
+            pending = _PendingRoster(consumer.channel_layer, consumer.room_group_name)
+            self._pending[room_code] = pending
+            asyncio.get_running_loop().create_task(self._flush_later(room_code))
+        return pending
+
+    async def _flush_later(self, room_code):
+        await asyncio.sleep(self.window)
+
+        # Changes queued while this flush runs open a new window
+        pending = self._pending.pop(room_code)
+
+        try:
+            delta = await apply_roster_delta(
+                room_code,
+                sorted(pending.added),
+                sorted(pending.removed),
+            )
+            if delta is None:
+                return
+
+            await pending.channel_layer.group_send(
+                pending.group_name,
+                group_message(
+                    "room_participants",
+                    {"type": "ROOM_PARTICIPANTS_DELTA", **delta},
+                ),
+            )
+        except Exception:
+            logger.exception("Roster flush failed | room=%s", room_code)
+
+
+@loop_local
+def get_roster_coalescer():
+    return RosterCoalescer()
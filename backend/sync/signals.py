@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from rooms.models import Room
+from sync.room_cache import publish_room_update
+
+
+@receiver(post_save, sender=Room)
+def room_saved(sender, instance, created, **kwargs):
+    # New rooms cannot be cached anywhere yet
+    if created:
+        return
+
+    transaction.on_commit(lambda: publish_room_update(instance))
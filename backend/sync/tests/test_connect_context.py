@@ -0,0 +1,57 @@
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from rooms.models import RoomParticipant
+from rooms.services import create_room
+from sync.consumers import get_connect_context
+from users.models import User
+
+
+class ConnectContextTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(
+            email="host@test.com",
+            password="pass",
+            display_name="Host",
+        )
+        self.viewer = User.objects.create_user(
+            email="viewer@test.com",
+            password="pass",
+            display_name="Viewer",
+        )
+        self.room, _ = create_room(
+            host=self.host,
+            is_private=False,
+            entry_mode=None,
+        )
+
+    def test_room_and_status_in_one_query(self):
+        with self.assertNumQueries(1):
+            snapshot, status = async_to_sync(get_connect_context)(self.room.code, self.host)
+
+        self.assertEqual(snapshot["id"], self.room.id)
+        self.assertEqual(snapshot["host_id"], self.host.id)
+        self.assertEqual(status, RoomParticipant.STATUS_APPROVED)
+
+    def test_non_participant_has_no_status(self):
+        snapshot, status = async_to_sync(get_connect_context)(self.room.code, self.viewer)
+
+        self.assertIsNotNone(snapshot)
+        self.assertIsNone(status)
+
+    def test_cached_snapshot_only_reads_status(self):
+        cached = {"id": self.room.id, "code": self.room.code}
+
+        with self.assertNumQueries(1):
+            snapshot, status = async_to_sync(get_connect_context)(
+                self.room.code, self.host, cached
+            )
+
+        self.assertIs(snapshot, cached)
+        self.assertEqual(status, RoomParticipant.STATUS_APPROVED)
+
+    def test_missing_room(self):
+        self.assertEqual(
+            async_to_sync(get_connect_context)("NOPE00", self.host),
+            (None, None),
+        )
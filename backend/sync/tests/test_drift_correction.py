@@ -56,6 +56,7 @@ class DriftCorrectionTests(TransactionTestCase):
 
         event = await wait_for_event(comm, "SYNC_CORRECTION")
         self.assertEqual(event["type"], "SYNC_CORRECTION")
-        self.assertEqual(event["time"], 100)
+        # Server position keeps advancing from the PLAY anchor
+        self.assertAlmostEqual(event["time"], 100, delta=1)
 
         await comm.disconnect()
@@ -0,0 +1,24 @@
+import json
+
+from django.test import SimpleTestCase
+
+from sync.frames import group_message
+
+
+class GroupMessageTests(SimpleTestCase):
+    def test_frame_is_pre_encoded_payload(self):
+        payload = {"type": "CHAT_MESSAGE", "user": "Host", "message": "hi"}
+
+        message = group_message("room_event", payload)
+
+        self.assertEqual(message["type"], "room_event")
+        self.assertEqual(json.loads(message["frame"]), payload)
+
+    def test_extra_fields_are_kept(self):
+        message = group_message(
+            "user_joined",
+            {"type": "USER_JOINED", "user": "Viewer"},
+            exclude_channel="specific.abc",
+        )
+
+        self.assertEqual(message["exclude_channel"], "specific.abc")
@@ -0,0 +1,102 @@
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from channels.layers import InMemoryChannelLayer
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from rooms.models import Room
+from rooms.services import create_room
+from sync.grace import GraceScheduler, expire_room
+from users.models import User
+
+
+@patch("sync.grace.release_grace_claim", new_callable=AsyncMock)
+@patch("sync.grace.schedule_grace_expiry", new_callable=AsyncMock)
+@patch("sync.grace.clear_rooms_redis_state", new_callable=AsyncMock)
+class ExpireRoomTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(
+            email="host@test.com",
+            password="pass",
+            display_name="Host",
+        )
+        self.room, _ = create_room(
+            host=self.host,
+            is_private=False,
+            entry_mode=None,
+        )
+        self.room.mark_live()
+        self.room.mark_grace()
+
+        self.layer = InMemoryChannelLayer()
+        async_to_sync(self.layer.group_add)(f"room_{self.room.code}", "viewer")
+
+    def disconnect_host(self, seconds_ago):
+        self.room.host_disconnected_at = timezone.now() - timedelta(seconds=seconds_ago)
+        self.room.save(update_fields=["host_disconnected_at"])
+
+    def expire(self):
+        with patch("sync.grace.get_channel_layer", return_value=self.layer):
+            async_to_sync(expire_room)(self.room.code, 123.0)
+        self.room.refresh_from_db()
+
+    def test_due_room_expires_and_notifies_viewers(self, mock_clear, mock_schedule, mock_release):
+        self.disconnect_host(Room.GRACE_PERIOD_SECONDS + 1)
+
+        self.expire()
+
+        self.assertEqual(self.room.state, Room.State.EXPIRED)
+        message = async_to_sync(self.layer.receive)("viewer")
+        self.assertEqual(message["type"], "room_expired")
+        self.assertIn("ROOM_EXPIRED", message["frame"])
+        mock_clear.assert_awaited_once_with([self.room.code])
+        mock_release.assert_awaited_once_with(self.room.code, 123.0)
+
+    def test_early_claim_is_rescheduled_to_db_deadline(self, mock_clear, mock_schedule, mock_release):
+        self.disconnect_host(10)
+
+        self.expire()
+
+        self.assertEqual(self.room.state, Room.State.GRACE)
+        deadline = mock_schedule.await_args.args[1]
+        self.assertAlmostEqual(
+            deadline,
+            time.time() + Room.GRACE_PERIOD_SECONDS - 10,
+            delta=5,
+        )
+        mock_release.assert_not_awaited()
+        mock_clear.assert_not_awaited()
+
+    def test_room_no_longer_in_grace_only_releases_claim(self, mock_clear, mock_schedule, mock_release):
+        self.room.mark_live()
+
+        self.expire()
+
+        self.assertEqual(self.room.state, Room.State.LIVE)
+        mock_release.assert_awaited_once_with(self.room.code, 123.0)
+        mock_clear.assert_not_awaited()
+
+
+class GraceSchedulerTests(SimpleTestCase):
+    def test_sleeps_until_next_deadline(self):
+        scheduler = GraceScheduler()
+        scheduler.interval = 1.0
+
+        scheduler._next_deadline = time.time() + 0.2
+        self.assertLessEqual(scheduler.next_delay(), 0.2)
+
+        scheduler._next_deadline = time.time() - 5
+        self.assertEqual(scheduler.next_delay(), 0.0)
+
+    def test_polls_at_most_interval_apart(self):
+        scheduler = GraceScheduler()
+        scheduler.interval = 1.0
+
+        scheduler._next_deadline = None
+        self.assertEqual(scheduler.next_delay(), 1.0)
+
+        scheduler._next_deadline = time.time() + 300
+        self.assertEqual(scheduler.next_delay(), 1.0)
@@ -0,0 +1,96 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+from django.test import SimpleTestCase
+
+from sync.consumers import RoomPresenceConsumer
+from sync.join_bundle import JoinBundle, JoinBundleCache
+
+ROSTER = {"participants": ["Host"], "host": "Host", "version": 1}
+MESSAGES = [{"user": "Host", "message": "hi", "created_at": "2026-01-01T00:00:00+00:00"}]
+
+
+def playback(is_playing):
+    return {
+        "is_playing": is_playing,
+        "time": 42.0,
+        "version": 3,
+        "anchored_at": 1000.0,
+        "rate": 1.0,
+    }
+
+
+class JoinBundleTests(SimpleTestCase):
+    def test_paused_playback_frame_is_shared(self):
+        bundle = JoinBundle.build(("room", 0, 3, 1), ROSTER, MESSAGES, playback(False))
+
+        self.assertIs(bundle.render_playback(), bundle.render_playback())
+        self.assertEqual(json.loads(bundle.render_playback())["time"], 42.0)
+        self.assertEqual(json.loads(bundle.chat_frame)["messages"], MESSAGES)
+        self.assertEqual(json.loads(bundle.roster_frame)["version"], 1)
+
+    def test_playing_position_is_rendered_per_joiner(self):
+        bundle = JoinBundle.build(("room", 0, 3, 1), ROSTER, MESSAGES, playback(True))
+
+        self.assertIsNone(bundle.playback_frame)
+        self.assertGreater(json.loads(bundle.render_playback())["time"], 42.0)
+
+
+class JoinBundleCacheTests(SimpleTestCase):
+    async def test_concurrent_joiners_share_one_build(self):
+        cache = JoinBundleCache()
+        builds = []
+
+        async def build():
+            builds.append(1)
+            await asyncio.sleep(0.01)
+            return JoinBundle.build(("room", 0, 3, 1), ROSTER, MESSAGES, playback(False))
+
+        bundles = await asyncio.gather(*[
+            cache.get_or_build("ROOM1", ("room", 0, 3, 1), build)
+            for _ in range(20)
+        ])
+
+        self.assertEqual(len(builds), 1)
+        self.assertTrue(all(bundle is bundles[0] for bundle in bundles))
+        self.assertIs(cache.get("ROOM1", ("room", 0, 3, 1)), bundles[0])
+
+    async def test_version_change_rebuilds(self):
+        cache = JoinBundleCache()
+
+        def build_for(key):
+            async def build():
+                return JoinBundle.build(key, ROSTER, MESSAGES, playback(False))
+            return build
+
+        first = await cache.get_or_build("ROOM1", ("room", 0, 3, 1), build_for(("room", 0, 3, 1)))
+        second = await cache.get_or_build("ROOM1", ("room", 1, 3, 1), build_for(("room", 1, 3, 1)))
+
+        self.assertIsNot(first, second)
+        self.assertIsNone(cache.get("ROOM1", ("room", 0, 3, 1)))
+
+    async def test_cold_room_is_not_cached(self):
+        cache = JoinBundleCache()
+
+        async def build():
+            return JoinBundle.build(None, ROSTER, MESSAGES, playback(False))
+
+        await cache.get_or_build("ROOM1", None, build)
+
+        self.assertIsNone(cache.get("ROOM1", None))
+
+    @patch("sync.consumers.load_playback_state", new_callable=AsyncMock, return_value=playback(False))
+    @patch("sync.consumers.load_chat_history", new_callable=AsyncMock, return_value=MESSAGES)
+    async def test_consumer_builds_for_admission_versions(self, mock_history, mock_playback):
+        consumer = RoomPresenceConsumer()
+        consumer.room_data = {"id": "room", "code": "ROOM1"}
+        consumer.load_roster = AsyncMock(return_value=ROSTER)
+        cache = JoinBundleCache()
+
+        with patch("sync.consumers.get_join_bundle_cache", return_value=cache):
+            bundle = await consumer.load_join_bundle(("room", 0, 3, 1))
+
+        self.assertEqual(bundle.key, ("room", 0, 3, 1))
+        self.assertIs(cache.get("ROOM1", ("room", 0, 3, 1)), bundle)
+        mock_history.assert_awaited_once_with("room", "ROOM1")
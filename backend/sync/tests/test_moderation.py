@@ -1,7 +1,9 @@
+from channels.db import database_sync_to_async
 from channels.testing import WebsocketCommunicator
 from django.test import TransactionTestCase
 from rest_framework_simplejwt.tokens import AccessToken
 
+from common.redis_room_state import ban_user
 from core.asgi import application
 from rooms.models import Room, RoomParticipant
 from users.models import User
@@ -45,6 +47,22 @@ class ModerationTests(TransactionTestCase):
         self.assertTrue(connected)
         return communicator
 
+    async def _rejection_code(self, user):
+        token = AccessToken.for_user(user)
+        communicator = WebsocketCommunicator(
+            application,
+            f"/ws/room/{self.room.code}/?token={token}",
+        )
+        connected, code = await communicator.connect()
+        self.assertFalse(connected)
+        await communicator.disconnect()
+        return code
+
+    async def _set_user_status(self, status):
+        await database_sync_to_async(
+            RoomParticipant.objects.filter(room=self.room, user=self.user).update
+        )(status=status)
+
     async def _drain_startup(self, communicator):
         for _ in range(3):
             await communicator.receive_json_from()
@@ -99,6 +117,8 @@ class ModerationTests(TransactionTestCase):
 
         self.assertFalse(connected)
 
+        # A rejected consumer keeps receiving until the server disconnects it
+        await new_comm.disconnect()
         await host_comm.disconnect()
 
     async def test_kick_disconnects_but_allows_reconnect(self):
@@ -151,3 +171,22 @@ class ModerationTests(TransactionTestCase):
 
         await host_comm.disconnect()
         await user_comm.disconnect()
+
+    async def test_ban_rejected_before_inactive_room(self):
+        await ban_user(self.room.code, self.user.id)
+        await database_sync_to_async(self.room.mark_deleted)()
+
+        self.assertEqual(await self._rejection_code(self.user), 4010)
+
+    async def test_ban_rejected_before_pending_approval(self):
+        await self._set_user_status(RoomParticipant.STATUS_PENDING)
+        self.assertEqual(await self._rejection_code(self.user), 4003)
+
+        await ban_user(self.room.code, self.user.id)
+        self.assertEqual(await self._rejection_code(self.user), 4010)
+
+    async def test_inactive_room_rejected_before_pending_approval(self):
+        await self._set_user_status(RoomParticipant.STATUS_PENDING)
+        await database_sync_to_async(self.room.mark_deleted)()
+
+        self.assertEqual(await self._rejection_code(self.user), 4005)
@@ -0,0 +1,40 @@
+from django.test import SimpleTestCase
+
+from sync.playback_clock import PlaybackAnchor
+
+
+class PlaybackClockTests(SimpleTestCase):
+    def test_paused_position_is_fixed(self):
+        anchor = PlaybackAnchor(
+            is_playing=False,
+            position=42.0,
+            anchored_at=1000.0,
+            version=3,
+        )
+
+        self.assertEqual(anchor.position_at(1500.0), 42.0)
+
+    def test_playing_position_advances_with_rate(self):
+        anchor = PlaybackAnchor(
+            is_playing=True,
+            position=10.0,
+            anchored_at=1000.0,
+            rate=1.5,
+            version=1,
+        )
+
+        self.assertEqual(anchor.position_at(1004.0), 16.0)
+
+    def test_event_round_trip(self):
+        anchor = PlaybackAnchor(
+            is_playing=True,
+            position=10.0,
+            anchored_at=1000.0,
+            version=7,
+        )
+
+        event = anchor.to_event(now=1030.0)
+
+        self.assertEqual(event["type"], "PLAYBACK_STATE")
+        self.assertEqual(event["time"], 40.0)
+        self.assertEqual(PlaybackAnchor.from_event(event), anchor)
@@ -0,0 +1,74 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from sync.background import PresenceHeartbeat
+
+
+@patch("sync.background.sweep_stale_presence", new_callable=AsyncMock)
+@patch("sync.background.claim_presence_sweep", new_callable=AsyncMock)
+@patch("sync.background.refresh_presence", new_callable=AsyncMock)
+class PresenceHeartbeatTests(SimpleTestCase):
+    def make_heartbeat(self):
+        heartbeat = PresenceHeartbeat()
+        # Keep the periodic loop out of the way; ticks are driven by hand
+        heartbeat.acquire = MagicMock()
+        heartbeat.release = AsyncMock()
+        return heartbeat
+
+    async def test_tick_refreshes_tracked_connections_in_one_batch(self, mock_refresh, mock_claim, mock_sweep):
+        mock_claim.return_value = False
+        heartbeat = self.make_heartbeat()
+        heartbeat.track("chan-1", "ROOM01", "room-1", "user-1")
+        heartbeat.track("chan-2", "ROOM01", "room-1", "user-1")
+
+        await heartbeat.tick()
+
+        mock_refresh.assert_awaited_once_with([
+            ("ROOM01", "user-1", "chan-1"),
+            ("ROOM01", "user-1", "chan-2"),
+        ])
+        mock_sweep.assert_not_awaited()
+
+    async def test_untracked_connections_stop_heartbeating(self, mock_refresh, mock_claim, mock_sweep):
+        mock_claim.return_value = False
+        heartbeat = self.make_heartbeat()
+        heartbeat.track("chan-1", "ROOM01", "room-1", "user-1")
+
+        await heartbeat.untrack("chan-1")
+        await heartbeat.untrack("chan-1")
+        await heartbeat.tick()
+
+        heartbeat.release.assert_awaited_once()
+        mock_refresh.assert_awaited_once_with([])
+
+    @patch("sync.background.persist_heartbeats")
+    async def test_db_heartbeats_are_batched_per_interval(self, mock_persist, mock_refresh, mock_claim, mock_sweep):
+        mock_claim.return_value = False
+        heartbeat = self.make_heartbeat()
+        heartbeat.persist_interval = 0
+        heartbeat.track("chan-1", "ROOM01", "room-1", "user-1")
+        heartbeat.track("chan-2", "ROOM01", "room-1", "user-2")
+        heartbeat.track("chan-3", "ROOM02", "room-2", "user-1")
+
+        await heartbeat.tick()
+
+        mock_persist.assert_called_once()
+        room_users, _ = mock_persist.call_args.args
+        self.assertEqual(
+            dict(room_users),
+            {"room-1": {"user-1", "user-2"}, "room-2": {"user-1"}},
+        )
+
+        heartbeat.persist_interval = 3600
+        await heartbeat.tick()
+        mock_persist.assert_called_once()
+
+    async def test_sweep_runs_only_with_claim(self, mock_refresh, mock_claim, mock_sweep):
+        mock_claim.return_value = True
+        mock_sweep.return_value = 2
+        heartbeat = self.make_heartbeat()
+
+        await heartbeat.tick()
+
+        mock_sweep.assert_awaited_once_with(heartbeat.stale_seconds)
@@ -0,0 +1,126 @@
+import asyncio
+
+from channels.layers import InMemoryChannelLayer
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from common.channel_layers import RedisChannelLayer
+from sync.relay import RoomRelay
+
+
+class FakeConsumer:
+    def __init__(self, channel_layer):
+        self.channel_layer = channel_layer
+        self.received = []
+
+    async def dispatch(self, message):
+        self.received.append(message)
+
+
+async def wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() >= deadline:
+            raise AssertionError("Condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class RoomRelayTests(SimpleTestCase):
+    async def test_one_group_member_per_worker(self):
+        layer = InMemoryChannelLayer()
+        relay = RoomRelay()
+        consumers = [FakeConsumer(layer) for _ in range(3)]
+
+        for consumer in consumers:
+            await relay.join("room_RELAY1", consumer)
+            await relay.ready("room_RELAY1", consumer)
+
+        self.assertEqual(len(layer.groups["room_RELAY1"]), 1)
+
+        await layer.group_send("room_RELAY1", {"type": "room_event", "frame": "{}"})
+        await asyncio.sleep(0.05)
+
+        for consumer in consumers:
+            self.assertEqual(consumer.received, [{"type": "room_event", "frame": "{}"}])
+
+        for consumer in consumers:
+            await relay.leave("room_RELAY1", consumer)
+
+        self.assertNotIn("room_RELAY1", layer.groups)
+        self.assertEqual(relay.local_consumers("room_RELAY1"), 0)
+
+    async def test_leave_stops_delivery_to_consumer(self):
+        layer = InMemoryChannelLayer()
+        relay = RoomRelay()
+        staying = FakeConsumer(layer)
+        leaving = FakeConsumer(layer)
+
+        for consumer in (staying, leaving):
+            await relay.join("room_RELAY2", consumer)
+            await relay.ready("room_RELAY2", consumer)
+        await relay.leave("room_RELAY2", leaving)
+
+        await layer.group_send("room_RELAY2", {"type": "room_event", "frame": "{}"})
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(len(staying.received), 1)
+        self.assertEqual(leaving.received, [])
+
+        await relay.leave("room_RELAY2", staying)
+
+    async def test_events_held_until_consumer_ready(self):
+        layer = InMemoryChannelLayer()
+        relay = RoomRelay()
+        consumer = FakeConsumer(layer)
+
+        await relay.join("room_RELAY3", consumer)
+        await layer.group_send("room_RELAY3", {"type": "room_event", "frame": "1"})
+        await layer.group_send("room_RELAY3", {"type": "room_event", "frame": "2"})
+        await asyncio.sleep(0.05)
+        self.assertEqual(consumer.received, [])
+
+        await relay.ready("room_RELAY3", consumer)
+        self.assertEqual([m["frame"] for m in consumer.received], ["1", "2"])
+
+        await layer.group_send("room_RELAY3", {"type": "room_event", "frame": "3"})
+        await wait_for(lambda: len(consumer.received) == 3)
+
+        await relay.leave("room_RELAY3", consumer)
+
+
+class RedisRoomRelayTests(SimpleTestCase):
+    """
+    channels_redis serves all process-local channels through one shared
+    receive lock, which the in-memory layer does not model.
+    """
+
+    def make_layer(self):
+        return RedisChannelLayer(**settings.CHANNEL_LAYERS["default"]["CONFIG"])
+
+    async def relay_round_trip(self, layer, group_name):
+        relay = RoomRelay()
+        consumer = FakeConsumer(layer)
+        await relay.join(group_name, consumer)
+        await relay.ready(group_name, consumer)
+
+        # A consumer's own channel still receives while the pump holds the lock
+        direct = await layer.new_channel()
+        await asyncio.sleep(0.05)
+        await layer.send(direct, {"type": "direct"})
+        self.assertEqual(await asyncio.wait_for(layer.receive(direct), 2), {"type": "direct"})
+
+        await layer.group_send(group_name, {"type": "room_event", "frame": "{}"})
+        await wait_for(lambda: consumer.received)
+        self.assertEqual(consumer.received, [{"type": "room_event", "frame": "{}"}])
+
+        await relay.leave(group_name, consumer)
+
+    async def test_relay_and_consumer_channels_both_receive(self):
+        await self.relay_round_trip(self.make_layer(), "room_REDIS1")
+
+    def test_relay_survives_consecutive_event_loops(self):
+        layer = self.make_layer()
+
+        for attempt in range(2):
+            asyncio.run(self.relay_round_trip(layer, f"room_LOOP{attempt}"))
+            self.assertEqual(layer.receive_count, 0)
@@ -0,0 +1,123 @@
+import asyncio
+from unittest.mock import patch
+
+from channels.layers import InMemoryChannelLayer
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+
+from common.channel_layers import RedisChannelLayer
+from rooms.services import create_room
+from sync.room_cache import ROOM_SNAPSHOT_GROUP, RoomSnapshotCache
+from users.models import User
+
+SNAPSHOT = {"code": "CACHE1", "is_chat_enabled": True, "state": "LIVE"}
+
+
+class RoomSnapshotCacheTests(SimpleTestCase):
+    def test_returns_independent_copies(self):
+        cache = RoomSnapshotCache()
+        cache.put("CACHE1", SNAPSHOT)
+
+        copy = cache.get("CACHE1")
+        copy["is_chat_enabled"] = False
+
+        self.assertTrue(cache.get("CACHE1")["is_chat_enabled"])
+
+    def test_entries_expire(self):
+        cache = RoomSnapshotCache()
+        cache.ttl = 0
+        cache.put("CACHE1", SNAPSHOT)
+
+        self.assertIsNone(cache.get("CACHE1"))
+
+    def test_least_recently_used_room_is_evicted(self):
+        cache = RoomSnapshotCache(max_rooms=2)
+        cache.put("A", SNAPSHOT)
+        cache.put("B", SNAPSHOT)
+        cache.get("A")
+        cache.put("C", SNAPSHOT)
+
+        self.assertIsNotNone(cache.get("A"))
+        self.assertIsNone(cache.get("B"))
+
+    async def test_invalidation_broadcast_drops_entry(self):
+        layer = InMemoryChannelLayer()
+        cache = RoomSnapshotCache()
+        await cache.acquire(layer)
+        cache.put("CACHE1", SNAPSHOT)
+
+        await layer.group_send(
+            ROOM_SNAPSHOT_GROUP,
+            {"type": "room.invalidate", "room_code": "CACHE1"},
+        )
+        await asyncio.sleep(0.05)
+
+        self.assertIsNone(cache.get("CACHE1"))
+        await cache.release()
+
+    async def test_last_release_stops_listener(self):
+        layer = InMemoryChannelLayer()
+        cache = RoomSnapshotCache()
+        await cache.acquire(layer)
+        await cache.acquire(layer)
+        task = cache._task
+        cache.put("CACHE1", SNAPSHOT)
+
+        await cache.release()
+        self.assertTrue(cache.listening)
+        self.assertIsNotNone(cache.get("CACHE1"))
+
+        await cache.release()
+        self.assertFalse(cache.listening)
+        self.assertTrue(task.done())
+        self.assertNotIn(ROOM_SNAPSHOT_GROUP, layer.groups)
+        self.assertIsNone(cache.get("CACHE1"))
+
+
+class RedisRoomSnapshotCacheTests(SimpleTestCase):
+    async def invalidate_round_trip(self, layer):
+        cache = RoomSnapshotCache()
+        await cache.acquire(layer)
+        cache.put("CACHE1", SNAPSHOT)
+
+        await asyncio.sleep(0.05)
+        await layer.group_send(
+            ROOM_SNAPSHOT_GROUP,
+            {"type": "room.invalidate", "room_code": "CACHE1"},
+        )
+        for _ in range(200):
+            if cache.get("CACHE1") is None:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertIsNone(cache.get("CACHE1"))
+        await cache.release()
+
+    def test_listener_survives_consecutive_event_loops(self):
+        layer = RedisChannelLayer(**settings.CHANNEL_LAYERS["default"]["CONFIG"])
+
+        for _ in range(2):
+            asyncio.run(self.invalidate_round_trip(layer))
+            self.assertEqual(layer.receive_count, 0)
+
+
+class RoomSavedSignalTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(
+            email="host@test.com",
+            password="pass",
+            display_name="Host",
+        )
+
+    @patch("sync.signals.publish_room_update")
+    def test_save_publishes_after_commit(self, mock_publish):
+        with self.captureOnCommitCallbacks(execute=True):
+            room, _ = create_room(host=self.host, is_private=False, entry_mode=None)
+
+        mock_publish.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            room.is_chat_enabled = False
+            room.save(update_fields=["is_chat_enabled"])
+
+        mock_publish.assert_called_once_with(room)
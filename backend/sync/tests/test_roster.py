@@ -0,0 +1,58 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+from channels.layers import InMemoryChannelLayer
+from django.test import SimpleTestCase
+
+from sync.roster import RosterCoalescer
+
+
+class FakeConsumer:
+    def __init__(self, channel_layer):
+        self.channel_layer = channel_layer
+        self.room_group_name = "room_ROSTER1"
+
+
+class RosterCoalescerTests(SimpleTestCase):
+    @patch("sync.roster.apply_roster_delta", new_callable=AsyncMock)
+    async def test_changes_within_window_are_sent_once(self, mock_apply):
+        mock_apply.return_value = {"added": ["Ann", "Bob"], "removed": [], "version": 4}
+        layer = InMemoryChannelLayer()
+        await layer.group_add("room_ROSTER1", "viewer")
+        consumer = FakeConsumer(layer)
+        coalescer = RosterCoalescer()
+        coalescer.window = 0.01
+
+        coalescer.add(consumer, "ROSTER1", "Bob")
+        coalescer.add(consumer, "ROSTER1", "Ann")
+        await asyncio.sleep(0.05)
+
+        mock_apply.assert_awaited_once_with("ROSTER1", ["Ann", "Bob"], [])
+
+        message = await layer.receive("viewer")
+        self.assertEqual(message["type"], "room_participants")
+        self.assertEqual(
+            json.loads(message["frame"]),
+            {
+                "type": "ROOM_PARTICIPANTS_DELTA",
+                "added": ["Ann", "Bob"],
+                "removed": [],
+                "version": 4,
+            },
+        )
+
+    @patch("sync.roster.apply_roster_delta", new_callable=AsyncMock)
+    async def test_latest_change_per_member_wins(self, mock_apply):
+        mock_apply.return_value = None
+        consumer = FakeConsumer(InMemoryChannelLayer())
+        coalescer = RosterCoalescer()
+        coalescer.window = 0.01
+
+        coalescer.add(consumer, "ROSTER1", "Ann")
+        coalescer.remove(consumer, "ROSTER1", "Ann")
+        coalescer.remove(consumer, "ROSTER1", "Bob")
+        coalescer.add(consumer, "ROSTER1", "Bob")
+        await asyncio.sleep(0.05)
+
+        mock_apply.assert_awaited_once_with("ROSTER1", ["Bob"], ["Ann"])
@@ -0,0 +1,69 @@
+import json
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from channels.layers import InMemoryChannelLayer
+from django.test import SimpleTestCase, override_settings
+
+from sync.consumers import RoomPresenceConsumer, user_group_name
+
+
+@override_settings(ROOM_FANOUT_RELAY=False)
+class UserGroupTests(SimpleTestCase):
+    async def make_consumer(self, layer, user_id):
+        consumer = RoomPresenceConsumer()
+        consumer.channel_layer = layer
+        consumer.channel_name = await layer.new_channel()
+        consumer.room_group_name = "room_ROOM01"
+        consumer.user_group_name = user_group_name("ROOM01", user_id)
+        consumer.send = AsyncMock()
+        consumer.close = AsyncMock()
+        return consumer
+
+    async def test_moderation_reaches_only_the_target(self):
+        layer = InMemoryChannelLayer()
+        target_id, bystander_id = uuid.uuid4(), uuid.uuid4()
+        target = await self.make_consumer(layer, target_id)
+        bystander = await self.make_consumer(layer, bystander_id)
+
+        await target.join_room_group()
+        await bystander.join_room_group()
+        self.assertIn(target.channel_name, layer.groups[target.user_group_name])
+        self.assertNotIn(bystander.channel_name, layer.groups[target.user_group_name])
+
+        await layer.group_send(
+            user_group_name("ROOM01", str(target_id)),
+            {"type": "force_disconnect", "banned": True},
+        )
+        await target.dispatch(await layer.receive(target.channel_name))
+
+        target.close.assert_awaited_once_with(code=4011)
+        self.assertTrue(target.is_banned)
+        self.assertTrue(layer.channels.get(bystander.channel_name) is None or layer.channels[bystander.channel_name].empty())
+
+        await target.leave_room_group()
+        self.assertNotIn(target.user_group_name, layer.groups)
+        self.assertIn(bystander.channel_name, layer.groups[bystander.user_group_name])
+
+    async def test_frames_dropped_once_banned(self):
+        consumer = await self.make_consumer(InMemoryChannelLayer(), uuid.uuid4())
+        consumer.user = object()
+        consumer.room_data = {"code": "ROOM01"}
+        frame = json.dumps({"type": "CHAT_MESSAGE", "message": "hi"})
+
+        with patch("sync.consumers.PermissionService.can_chat", return_value=False):
+            await consumer.force_disconnect({"type": "force_disconnect", "banned": False})
+            await consumer.receive(frame)
+            self.assertEqual(consumer.send.await_count, 1)
+
+            await consumer.force_disconnect({"type": "force_disconnect", "banned": True})
+            await consumer.receive(frame)
+            self.assertEqual(consumer.send.await_count, 1)
+
+    def test_group_is_scoped_to_room(self):
+        user_id = uuid.uuid4()
+
+        self.assertNotEqual(
+            user_group_name("ROOM01", user_id),
+            user_group_name("ROOM02", user_id),
+        )
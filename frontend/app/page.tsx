@@ -433,6 +433,9 @@ export default function Home() {
                       <h3 className="text-base font-semibold">
                         {room.host}
                       </h3>
+                      {room.video_title && (
+                        <p className="text-sm">{room.video_title}</p>
+                      )}
                       <p className="text-xs text-[color:var(--color-muted)]">
                         Room {room.code} - started {formatAge(room.created_at)}
                       </p>
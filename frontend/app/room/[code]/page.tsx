@@ -17,6 +17,7 @@ import { useRoomStore } from "@/store/roomStore"
 import { useSessionStore } from "@/store/sessionStore"
 import {
   approveParticipant,
+  autocompleteContent,
   deleteRoom,
   getRoomDetail,
   getRoomParticipants,
@@ -143,7 +144,13 @@ export default function RoomPage() {
           break
 
         case "ROOM_PARTICIPANTS":
-          store.setParticipants(event.participants, event.host)
+          store.setParticipants(event.participants, event.host, event.version)
+          break
+
+        case "ROOM_PARTICIPANTS_DELTA":
+          if (!store.applyParticipantsDelta(event.added, event.removed, event.version)) {
+            sendMessage({ type: "ROSTER_SYNC" })
+          }
           break
 
         case "USER_JOINED":
@@ -177,6 +184,10 @@ export default function RoomPage() {
           setSystemMessages((prev) => [...prev, "Room deleted by host"])
           break
 
+        case "ROOM_EXPIRED":
+          setSystemMessages((prev) => [...prev, "Room expired: the host did not return in time"])
+          break
+
         case "ERROR":
           setSystemMessages((prev) => [...prev, event.message])
           break
@@ -262,6 +273,27 @@ export default function RoomPage() {
     sendMessage({ type: "PLAYER_EVENT", data })
   }
 
+  useEffect(() => {
+    const query = searchQuery.trim()
+    if (query.length < 2) return
+
+    // Typeahead from the local index; the Search button still hits providers
+    let cancelled = false
+    const timer = setTimeout(async () => {
+      try {
+        const data = await autocompleteContent(query)
+        if (!cancelled) setSearchResults(data)
+      } catch {
+        // Suggestions are best-effort
+      }
+    }, 150)
+
+    return () => {
+      cancelled = true
+      clearTimeout(timer)
+    }
+  }, [searchQuery])
+
   const handleSearch = async () => {
     if (!searchQuery.trim()) return
     setSearchLoading(true)
@@ -302,6 +334,8 @@ export default function RoomPage() {
               ...prev,
               video_provider: updated.video_provider,
               video_id: updated.video_id,
+              video_title: item.title,
+              video_poster: item.poster,
             }
           : prev
       )
@@ -383,7 +417,9 @@ export default function RoomPage() {
       ? "Chat enabled"
       : "Chat disabled"
     : "Chat status pending"
-  const streamTitle = roomDetail?.video_id ? "Live watch party" : `Room ${roomCode}`
+  const streamTitle = roomDetail?.video_id
+    ? roomDetail.video_title ?? "Live watch party"
+    : `Room ${roomCode}`
 
   return (
     <div className="min-h-screen">
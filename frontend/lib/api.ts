@@ -42,6 +42,8 @@ export type PublicRoom = {
   host: string
   viewers: number
   created_at: string
+  video_title: string | null
+  video_poster: string | null
 }
 
 export type SearchResult = {
@@ -65,6 +67,8 @@ export type RoomDetail = {
   host_id: string
   video_provider: string
   video_id: string
+  video_title: string | null
+  video_poster: string | null
   created_at: string
   is_host: boolean
 }
@@ -197,6 +201,11 @@ export function searchContent(query: string, page = 1): Promise<SearchResult[]>
   return request(`/api/rooms/search/?${params.toString()}`)
 }
 
+export function autocompleteContent(query: string, limit = 8): Promise<SearchResult[]> {
+  const params = new URLSearchParams({ q: query, limit: String(limit) })
+  return request(`/api/rooms/search/autocomplete/?${params.toString()}`)
+}
+
 export function getRoomDetail(
   roomCode: string,
   token?: string | null
@@ -9,13 +9,15 @@ export type ClientEvent =
   // Chat
   | { type: "CHAT_MESSAGE"; message: string }
   // Playback — host only. Use PLAY/PAUSE/SEEK (not PLAYER_EVENT) for sync.
-  | { type: "PLAY"; time: number }
+  | { type: "PLAY"; time: number; rate?: number }
   | { type: "PAUSE"; time: number }
   | { type: "SEEK"; time: number }
   // Watch-progress tracking (backend updates WatchProgress model, does NOT broadcast)
   | { type: "PLAYER_EVENT"; data: PlayerEventData }
   // Sync check — ask server if local time has drifted
   | { type: "SYNC_CHECK"; client_time: number }
+  // Roster — request a full snapshot after a delta version gap
+  | { type: "ROSTER_SYNC" }
   // Moderation — host only
   | { type: "MUTE_USER"; user_id: string }
   | { type: "BAN_USER"; user_id: string }
@@ -30,13 +32,24 @@ export type PlayerEventData =
 export type ServerEvent =
   | { type: "CHAT_HISTORY"; messages: ChatMessage[] }
   | { type: "CHAT_MESSAGE"; user: string; message: string }
-  | { type: "PLAYBACK_STATE"; is_playing: boolean; time: number; version: number }
-  | { type: "ROOM_PARTICIPANTS"; participants: string[]; host: string }
+  | {
+      type: "PLAYBACK_STATE"
+      is_playing: boolean
+      time: number
+      version: number
+      rate?: number
+      anchor_time?: number
+      anchored_at?: number
+      server_time?: number
+    }
+  | { type: "ROOM_PARTICIPANTS"; participants: string[]; host: string; version: number }
+  | { type: "ROOM_PARTICIPANTS_DELTA"; added: string[]; removed: string[]; version: number }
   | { type: "USER_JOINED"; user: string }
   | { type: "USER_LEFT"; user: string }
   | { type: "HOST_DISCONNECTED"; grace_seconds: number }
   | { type: "HOST_RECONNECTED" }
   | { type: "ROOM_DELETED" }
+  | { type: "ROOM_EXPIRED" }
   | { type: "SYNC_CORRECTION"; time: number; version: number }
   | { type: "ERROR"; message: string; code?: string }
 
@@ -15,6 +15,8 @@ interface RoomStore {
   // Participants (backend sends display names, not objects)
   participants: string[]
   host: string | null
+  // Version of the last applied ROOM_PARTICIPANTS snapshot or delta
+  rosterVersion: number
 
   // Chat
   messages: ChatMessage[]
@@ -23,7 +25,9 @@ interface RoomStore {
   playback: PlaybackState
 
   // Actions
-  setParticipants: (participants: string[], host: string) => void
+  setParticipants: (participants: string[], host: string, version: number) => void
+  // Returns false on a version gap; the caller should request ROSTER_SYNC
+  applyParticipantsDelta: (added: string[], removed: string[], version: number) => boolean
   addParticipant: (user: string) => void
   removeParticipant: (user: string) => void
   loadChatHistory: (messages: ChatMessage[]) => void
@@ -34,14 +38,28 @@ interface RoomStore {
 
 // ─── Store ────────────────────────────────────────────────────────────────────
 
-export const useRoomStore = create<RoomStore>((set) => ({
+export const useRoomStore = create<RoomStore>((set, get) => ({
   participants: [],
   host: null,
+  rosterVersion: 0,
   messages: [],
   playback: { time: 0, is_playing: false, version: 0 },
 
-  setParticipants: (participants, host) =>
-    set({ participants, host }),
+  setParticipants: (participants, host, version) =>
+    set({ participants, host, rosterVersion: version }),
+
+  applyParticipantsDelta: (added, removed, version) => {
+    const { participants, rosterVersion } = get()
+    if (version <= rosterVersion) return true
+    if (version !== rosterVersion + 1) return false
+
+    const next = participants.filter((p) => !removed.includes(p))
+    for (const user of added) {
+      if (!next.includes(user)) next.push(user)
+    }
+    set({ participants: next, rosterVersion: version })
+    return true
+  },
 
   // Guard against duplicates from concurrent events
   addParticipant: (user) =>
@@ -69,6 +87,7 @@ export const useRoomStore = create<RoomStore>((set) => ({
     set({
       participants: [],
       host: null,
+      rosterVersion: 0,
       messages: [],
       playback: { time: 0, is_playing: false, version: 0 },
     }),